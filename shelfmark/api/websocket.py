@@ -56,6 +56,10 @@ class WebSocketManager:
         """Check if WebSocket is enabled and ready."""
         return self._enabled and self.socketio is not None
 
+    def has_subscribers(self) -> bool:
+        """Check if any client is connected to receive broadcasts."""
+        return self._connection_count > 0
+
     def _get_socketio(self) -> SocketIO | None:
         if not self._enabled:
             return None
@@ -188,6 +192,33 @@ class WebSocketManager:
         except Exception:
             logger.exception("Error broadcasting download progress")
 
+    def broadcast_download_progress_batch(
+        self, updates: dict[str, tuple[float, int | None]], status: str
+    ) -> None:
+        """Broadcast progress for several books at once.
+
+        ``updates`` maps book_id to ``(progress, user_id)``. Each book is still sent as
+        its own ``download_progress`` event so clients need no batch-aware handler.
+        """
+        socketio = self._get_socketio()
+        if socketio is None:
+            return
+
+        try:
+            with self._rooms_lock:
+                user_rooms = set(self._user_rooms)
+
+            for book_id, (progress, user_id) in updates.items():
+                data = {"book_id": book_id, "progress": progress, "status": status}
+                socketio.emit("download_progress", data, to="admins")
+                if user_id is not None:
+                    room = f"user_{user_id}"
+                    if room in user_rooms:
+                        socketio.emit("download_progress", data, to=room)
+            logger.debug("Broadcasted progress for %s books", len(updates))
+        except Exception:
+            logger.exception("Error broadcasting download progress batch")
+
     def broadcast_search_status(
         self,
         source: str,
@@ -8,7 +8,7 @@ from shelfmark.core.languages import LANGUAGE_PLACEHOLDERS, normalize_language
 from shelfmark.core.logger import setup_logger
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Callable, Mapping
 
 logger = setup_logger(__name__)
 
@@ -118,9 +118,13 @@ def derive_primary_title(title: str | None, subtitle: str | None) -> str:
 PAD_NUMBERS_PATTERN = re.compile(r"\d+")
 
 
+def _pad_number(match: re.Match[str]) -> str:
+    return match.group().zfill(9)
+
+
 def natural_sort_key(path: str | Path) -> str:
     """Generate a sort key with padded numbers for natural sorting."""
-    return PAD_NUMBERS_PATTERN.sub(lambda m: m.group().zfill(9), str(path).lower())
+    return PAD_NUMBERS_PATTERN.sub(_pad_number, str(path).lower())
 
 
 def assign_part_numbers(
@@ -131,6 +135,7 @@ def assign_part_numbers(
     if not files:
         return []
 
+    # sorted() evaluates the key once per file, so no extra memoization is needed.
     sorted_files = sorted(files, key=natural_sort_key)
     return [
         (file_path, str(part_num).zfill(zero_pad_width))
@@ -245,6 +250,34 @@ def build_library_path(
     extension: str | None = None,
 ) -> Path:
     """Build a final library path from a template and metadata."""
+    return _build_library_path_from_base(Path(base_path).resolve(), template, metadata, extension)
+
+
+def compile_library_path(
+    base_path: str,
+    template: str,
+    metadata: Mapping[str, str | int | float | None],
+) -> Callable[[str | None, str | None], Path]:
+    """Specialize `build_library_path` for one release whose files differ only by part.
+
+    The library base is resolved once up front; the returned builder takes
+    ``(part_number, extension)`` and only renders the per-file template.
+    """
+    base = Path(base_path).resolve()
+
+    def build(part_number: str | None, extension: str | None = None) -> Path:
+        file_metadata = metadata if part_number is None else {**metadata, "PartNumber": part_number}
+        return _build_library_path_from_base(base, template, file_metadata, extension)
+
+    return build
+
+
+def _build_library_path_from_base(
+    base: Path,
+    template: str,
+    metadata: Mapping[str, str | int | float | None],
+    extension: str | None,
+) -> Path:
     relative = parse_naming_template(template, metadata, allow_path_separators=True)
 
     if not relative:
@@ -255,7 +288,6 @@ def build_library_path(
     # Remove any path traversal attempts
     relative = relative.replace("..", "")
 
-    base = Path(base_path).resolve()
     full_path = (base / relative).resolve()
 
     # Verify the path is within the base directory
@@ -351,7 +351,7 @@ class DownloadClient(ABC):
         """
 
     def find_existing(
-        self, url: str, category: str | None = None
+        self, url: str, category: str | None = None, expected_hash: str | None = None
     ) -> tuple[str, DownloadStatus] | None:
         """Check if a download for this URL already exists in the client.
 
@@ -361,6 +361,8 @@ class DownloadClient(ABC):
         Args:
             url: Download URL (magnet link, .torrent URL, or NZB URL)
             category: Category to filter by (usenet clients only)
+            expected_hash: Optional info_hash hint (torrents only); when given,
+                torrent clients look it up instead of fetching the .torrent file
 
         Returns:
             Tuple of (download_id, status) if found, None if not found.
@@ -11,7 +11,6 @@ Requirements:
 - Deluge Web UI must be connected (or connectable) to a Deluge daemon
 """
 
-import base64
 from contextlib import suppress
 from typing import Any, NoReturn
 from urllib.parse import urlparse
@@ -63,6 +62,19 @@ _DELUGE_CLIENT_ERRORS = (
     ValueError,
 )
 
+# Read-only and auth calls, safe to resend when the connection drops mid-request
+_IDEMPOTENT_RPC_METHODS = frozenset(
+    {
+        "auth.login",
+        "core.get_torrent_status",
+        "daemon.get_version",
+        "daemon.info",
+        "system.listMethods",
+        "web.connected",
+        "web.get_hosts",
+    }
+)
+
 
 def _get_error_message(error: object) -> tuple[str, int | None]:
     if isinstance(error, dict):
@@ -143,12 +155,20 @@ class DelugeClient(DownloadClient):
             "params": list(params),
         }
 
-        response = self._session.post(
-            self._rpc_url,
-            json=payload,
-            timeout=timeout,
-            verify=get_ssl_verify(self._rpc_url),
-        )
+        try:
+            response = self._post_rpc(payload, timeout)
+        except requests.exceptions.ConnectionError as e:
+            # Usually a pooled keep-alive socket Deluge already closed. The session and
+            # its login cookie are still good, so retry once on a fresh connection
+            # instead of failing the call and paying for a full reconnect. Calls that
+            # change state (adds, removes, labels) may already have been applied, and a
+            # connect timeout means the host is down, so neither is resent.
+            if method not in _IDEMPOTENT_RPC_METHODS or isinstance(
+                e, requests.exceptions.ConnectTimeout
+            ):
+                raise
+            logger.debug("Deluge RPC %s lost its connection, retrying once: %s", method, e)
+            response = self._post_rpc(payload, timeout)
         response.raise_for_status()
 
         data = response.json()
@@ -158,6 +178,14 @@ class DelugeClient(DownloadClient):
 
         return data.get("result")
 
+    def _post_rpc(self, payload: dict[str, Any], timeout: int) -> requests.Response:
+        return self._session.post(
+            self._rpc_url,
+            json=payload,
+            timeout=timeout,
+            verify=get_ssl_verify(self._rpc_url),
+        )
+
     def _login(self) -> None:
         result = self._rpc_call("auth.login", self._password)
         if result is not True:
@@ -302,12 +330,11 @@ class DelugeClient(DownloadClient):
                 magnet_url = torrent_info.magnet_url or url
                 torrent_id = self._rpc_call("core.add_torrent_magnet", magnet_url, options)
             else:
-                torrent_data = torrent_info.torrent_data
-                if torrent_data is None:
+                # Cached on the (reused) fetch result, so a retried add does not re-encode
+                filedump = torrent_info.torrent_data_b64
+                if filedump is None:
                     _raise_runtime_error("Failed to fetch torrent file")
 
-                torrent_data_bytes: bytes = torrent_data
-                filedump = base64.b64encode(torrent_data_bytes).decode("ascii")
                 torrent_id = self._rpc_call(
                     "core.add_torrent_file",
                     f"{name}.torrent",
@@ -458,13 +485,16 @@ class DelugeClient(DownloadClient):
             return None
 
     def find_existing(
-        self, url: str, category: str | None = None
+        self, url: str, category: str | None = None, expected_hash: str | None = None
     ) -> tuple[str, DownloadStatus] | None:
         """Find an existing Deluge torrent matching a release URL."""
         try:
             self._ensure_connected()
 
-            torrent_info = extract_torrent_info(url)
+            # A known hash is enough to look the torrent up; only fetch without one
+            torrent_info = extract_torrent_info(
+                url, fetch_torrent=not expected_hash, expected_hash=expected_hash
+            )
             if not torrent_info.info_hash:
                 return None
 
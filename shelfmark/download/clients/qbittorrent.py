@@ -759,11 +759,14 @@ class QBittorrentClient(DownloadClient):
             return None
 
     def find_existing(
-        self, url: str, category: str | None = None
+        self, url: str, category: str | None = None, expected_hash: str | None = None
     ) -> tuple[str, DownloadStatus] | None:
         """Check if a torrent for this URL already exists in qBittorrent."""
         try:
-            torrent_info = extract_torrent_info(url)
+            # A known hash is enough to look the torrent up; only fetch without one
+            torrent_info = extract_torrent_info(
+                url, fetch_torrent=not expected_hash, expected_hash=expected_hash
+            )
             if not torrent_info.info_hash:
                 return None
 
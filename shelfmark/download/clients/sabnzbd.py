@@ -561,7 +561,7 @@ class SABnzbdClient(DownloadClient):
         return status.file_path
 
     def find_existing(
-        self, url: str, category: str | None = None
+        self, url: str, category: str | None = None, expected_hash: str | None = None
     ) -> tuple[str, DownloadStatus] | None:
         """Check if an NZB for this URL already exists in SABnzbd.
 
@@ -573,6 +573,7 @@ class SABnzbdClient(DownloadClient):
         Args:
             url: NZB URL
             category: Category to filter by (defaults to configured category)
+            expected_hash: Unused; NZBs have no info_hash
 
         Returns:
             Tuple of (nzo_id, status) if found, None if not found.
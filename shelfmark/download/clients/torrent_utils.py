@@ -8,6 +8,8 @@ import re
 import time
 from binascii import Error as BinasciiError
 from dataclasses import dataclass
+from functools import cached_property
+from http.cookiejar import DefaultCookiePolicy
 from threading import Lock
 from urllib.parse import ParseResult, parse_qs, urljoin, urlparse
 
@@ -47,6 +49,18 @@ _TORRENT_FETCH_CACHE_MAX_ENTRIES = 8
 _torrent_fetch_cache_lock = Lock()
 _torrent_fetch_cache: dict[str, tuple[float, TorrentInfo]] = {}
 
+# Magnet link hash formats: "urn:btih:" carries 40 hex or 32 base32/hex characters
+_BTIH_XT_PATTERN = re.compile(r"urn:btih:([a-fA-F0-9]{40}|[a-zA-Z0-9]{32})")
+_HEX_PATTERN = re.compile(r"[a-fA-F0-9]+")
+_HEX32_PATTERN = re.compile(r"[a-fA-F0-9]{32}")
+_BASE32_32_PATTERN = re.compile(r"[A-Z2-7]{32}")
+
+# Torrent fetches usually hit the same Prowlarr/indexer host again and again, so they
+# share one session and reuse its keep-alive connections. Cookies are never stored,
+# keeping each fetch as stateless as a bare requests.get.
+_torrent_fetch_session = requests.Session()
+_torrent_fetch_session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+
 type BencodeValue = dict[str | bytes, BencodeValue] | list[BencodeValue] | int | bytes | str
 
 
@@ -69,9 +83,16 @@ class TorrentInfo:
     fetch_error: str | None = None
     """Why fetching the .torrent URL failed, or None if it succeeded/was skipped."""
 
+    @cached_property
+    def torrent_data_b64(self) -> str | None:
+        """Base64 form of torrent_data for JSON uploads, encoded once per fetch."""
+        if self.torrent_data is None:
+            return None
+        return base64.b64encode(self.torrent_data).decode("ascii")
+
     def with_info_hash(self, info_hash: str | None) -> TorrentInfo:
         """Return a copy with the info_hash replaced when provided."""
-        if info_hash:
+        if info_hash and info_hash != self.info_hash:
             return TorrentInfo(
                 info_hash=info_hash,
                 torrent_data=self.torrent_data,
@@ -100,6 +121,9 @@ def extract_torrent_info(
 
     """
     is_magnet = url.startswith("magnet:")
+    # Indexers report hashes in either case; TorrentInfo hashes are lowercase
+    if expected_hash:
+        expected_hash = expected_hash.lower()
 
     # Try to extract hash from magnet URL
     if is_magnet:
@@ -185,10 +209,11 @@ def _fetch_torrent_info(url: str) -> TorrentInfo:
         redirects_remaining = _TORRENT_FETCH_MAX_REDIRECTS
         while True:
             request_headers = dict(headers)
-            if not _is_trusted_torrent_fetch_url(current_url):
+            # Without an API key there is nothing to withhold, so skip parsing the hop's origin
+            if api_key and not _is_trusted_torrent_fetch_url(current_url):
                 request_headers.pop("X-Api-Key", None)
 
-            resp = requests.get(
+            resp = _torrent_fetch_session.get(
                 current_url,
                 timeout=30,
                 allow_redirects=False,
@@ -296,64 +321,99 @@ def parse_transmission_url(url: str) -> tuple[str, str, int, str]:
 
 def bencode_decode(data: bytes) -> tuple:
     """Decode bencoded data. Returns (value, remaining_bytes)."""
-    if data[0:1] == b"d":
-        # Dictionary
-        result = {}
-        data = data[1:]
-        while data[0:1] != b"e":
-            key, data = bencode_decode(data)
-            value, data = bencode_decode(data)
-            result[key] = value
-        return result, data[1:]
-    if data[0:1] == b"l":
-        # List
-        result = []
-        data = data[1:]
-        while data[0:1] != b"e":
-            value, data = bencode_decode(data)
-            result.append(value)
-        return result, data[1:]
-    if data[0:1] == b"i":
-        # Integer
-        end = data.index(b"e")
-        return int(data[1:end]), data[end + 1 :]
-    if data[0:1].isdigit():
-        # Byte string
-        colon = data.index(b":")
-        length = int(data[:colon])
-        start = colon + 1
-        return data[start : start + length], data[start + length :]
-    first_byte = data[0:1]
-    msg = (
-        f"Invalid bencode data: expected 'd', 'l', 'i', or digit, "
-        f"got {first_byte!r}. First 20 bytes: {data[:20]!r}"
-    )
-    raise ValueError(msg)
+    value, end = _bencode_parse(data, 0)
+    return value, data[end:]
+
+
+def _bencode_parse(data: bytes, pos: int) -> tuple[BencodeValue, int]:
+    """Decode the value starting at pos. Returns (value, offset just past it).
+
+    Walks the buffer with a cursor and an explicit container stack, so nothing
+    but the decoded strings is copied and nesting depth is not bounded by the
+    recursion limit.
+    """
+    # Open containers, innermost last; for dicts, the key still waiting for its value
+    stack: list[dict | list] = []
+    pending_keys: list[BencodeValue | None] = []
+
+    while True:
+        token = data[pos : pos + 1]
+        if token in (b"d", b"l"):
+            stack.append({} if token == b"d" else [])
+            pending_keys.append(None)
+            pos += 1
+            continue
+
+        if token == b"e" and stack:
+            if pending_keys.pop() is not None:
+                msg = f"Invalid bencode data: dictionary key without a value at offset {pos}"
+                raise ValueError(msg)
+            value = stack.pop()
+            pos += 1
+        elif token == b"i":
+            # Integer
+            end = data.index(b"e", pos)
+            value = int(data[pos + 1 : end])
+            pos = end + 1
+        elif token.isdigit():
+            # Byte string
+            colon = data.index(b":", pos)
+            start = colon + 1
+            end = start + int(data[pos:colon])
+            value = data[start:end]
+            pos = end
+        else:
+            msg = (
+                f"Invalid bencode data: expected 'd', 'l', 'i', or digit, "
+                f"got {token!r}. First 20 bytes: {data[pos : pos + 20]!r}"
+            )
+            raise ValueError(msg)
+
+        if not stack:
+            return value, pos
+
+        parent = stack[-1]
+        if isinstance(parent, list):
+            parent.append(value)
+        elif pending_keys[-1] is None:
+            pending_keys[-1] = value
+        else:
+            parent[pending_keys[-1]] = value
+            pending_keys[-1] = None
 
 
 def bencode_encode(data: BencodeValue) -> bytes:
     """Encode data to bencode format."""
+    out = bytearray()
+    _bencode_into(data, out)
+    return bytes(out)
+
+
+def _bencode_into(data: BencodeValue, out: bytearray) -> None:
+    """Append the bencoding of data to out, so nested values share one buffer."""
     if isinstance(data, dict):
         # Keys must be sorted (bencode spec requirement)
-        result = b"d"
+        out += b"d"
         for key in sorted(data.keys()):
-            result += bencode_encode(key)
-            result += bencode_encode(data[key])
-        result += b"e"
-        return result
+            _bencode_into(key, out)
+            _bencode_into(data[key], out)
+        out += b"e"
+        return
     if isinstance(data, list):
-        result = b"l"
+        out += b"l"
         for item in data:
-            result += bencode_encode(item)
-        result += b"e"
-        return result
+            _bencode_into(item, out)
+        out += b"e"
+        return
     if isinstance(data, int):
-        return f"i{data}e".encode()
-    if isinstance(data, bytes):
-        return f"{len(data)}:".encode() + data
+        out += b"i%de" % data
+        return
     if isinstance(data, str):
-        encoded = data.encode("utf-8")
-        return f"{len(encoded)}:".encode() + encoded
+        data = data.encode("utf-8")
+    if isinstance(data, bytes):
+        out += b"%d:" % len(data)
+        out += data
+        return
     msg = (
         f"Cannot bencode type {type(data).__name__}: "
         f"expected dict, list, int, bytes, or str. Value: {data!r}"
@@ -361,19 +421,35 @@ def bencode_encode(data: BencodeValue) -> bytes:
     raise ValueError(msg)
 
 
+def _find_info_dict(torrent_data: bytes) -> tuple[BencodeValue, bytes] | None:
+    """Return the decoded top-level info value and its exact bencoded bytes."""
+    if torrent_data[0:1] != b"d":
+        return None
+
+    pos = 1
+    while torrent_data[pos : pos + 1] != b"e":
+        key, pos = _bencode_parse(torrent_data, pos)
+        value_start = pos
+        value, pos = _bencode_parse(torrent_data, pos)
+        if key == b"info":
+            return value, torrent_data[value_start:pos]
+    return None
+
+
 def extract_info_hash_from_torrent(torrent_data: bytes) -> str | None:
     """Extract info_hash from .torrent file data."""
     try:
-        decoded, _ = bencode_decode(torrent_data)
-        if b"info" not in decoded:
+        found = _find_info_dict(torrent_data)
+        if found is None:
             return None
 
-        info_bencoded = bencode_encode(decoded[b"info"])
-        info_dict = decoded[b"info"]
+        # The info hash is defined over the info dict's bytes exactly as they appear
+        # in the file, so hash that slice rather than a re-encoding of the decoded dict.
+        info_dict, info_bencoded = found
         if isinstance(info_dict, dict) and b"pieces" in info_dict:
-            # BitTorrent v1 info hashes are defined as SHA-1.
-            return hashlib.sha1(info_bencoded).hexdigest().lower()  # noqa: S324
-        return hashlib.sha256(info_bencoded).hexdigest().lower()
+            # BitTorrent v1 info hashes are defined as SHA-1; it identifies, it does not protect.
+            return hashlib.sha1(info_bencoded, usedforsecurity=False).hexdigest()
+        return hashlib.sha256(info_bencoded).hexdigest()
     except _TORRENT_PARSE_ERRORS as e:
         logger.debug("Failed to parse torrent file: %s", e)
         return None
@@ -393,7 +469,7 @@ def extract_hash_from_magnet(magnet_url: str) -> str | None:
             return None
 
         data: bytes | None = None
-        if re.fullmatch(r"[a-fA-F0-9]+", raw_value):
+        if _HEX_PATTERN.fullmatch(raw_value):
             if len(raw_value) % 2 != 0:
                 return None
             try:
@@ -417,10 +493,10 @@ def extract_hash_from_magnet(magnet_url: str) -> str | None:
         ):
             digest = data[2:_BASE32_BTMH_TAG_BYTES]
             if len(digest) == _BTIH_DIGEST_LENGTH:
-                return digest.hex().lower()
+                return digest.hex()
 
         if len(data) == _BTIH_HASH_LENGTH_32:
-            return data.hex().lower()
+            return data.hex()
 
         return None
 
@@ -428,20 +504,18 @@ def extract_hash_from_magnet(magnet_url: str) -> str | None:
 
     for xt in xt_values:
         # Format: urn:btih:<hash> (32 or 40 chars)
-        match = re.match(r"urn:btih:([a-fA-F0-9]{40}|[a-zA-Z0-9]{32})", xt)
+        match = _BTIH_XT_PATTERN.match(xt)
         if match:
             hash_value = match.group(1)
 
             # 40-char hex or 32-char hex (ED2K) - return as-is
-            if len(hash_value) == _BTIH_HASH_LENGTH_40 or re.match(
-                r"^[a-fA-F0-9]{32}$", hash_value
-            ):
+            if len(hash_value) == _BTIH_HASH_LENGTH_40 or _HEX32_PATTERN.fullmatch(hash_value):
                 return hash_value.lower()
 
             # 32-char base32 - decode to hex
-            if re.match(r"^[A-Z2-7]{32}$", hash_value.upper()):
+            if _BASE32_32_PATTERN.fullmatch(hash_value.upper()):
                 try:
-                    return base64.b32decode(hash_value.upper()).hex().lower()
+                    return base64.b32decode(hash_value.upper()).hex()
                 except BinasciiError, ValueError:
                     logger.debug(
                         "Could not decode base32 BTIH hash from magnet URI: %s", hash_value
@@ -11,7 +11,7 @@ import subprocess
 import tempfile
 import time
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, TypeVar, cast
+from typing import TYPE_CHECKING, Any, Literal, TypeVar, cast
 
 from shelfmark.core.logger import setup_logger
 from shelfmark.download.permissions_debug import log_transfer_permission_context
@@ -33,6 +33,28 @@ except ImportError:
 T = TypeVar("T")
 _IO_THREADPOOL: ThreadPool | None = None
 
+# (source dir, destination dir) pairs where os.link already failed with EXDEV.
+# Later files in the same batch go straight to copy instead of re-raising per file.
+_CROSS_DEVICE_DIRS: set[tuple[str, str]] = set()
+_CROSS_DEVICE_DIRS_MAX = 256
+
+# Files at least this large try an in-kernel copy_file_range() first, which CoW
+# filesystems (btrfs, XFS with reflink, NFS 4.2 server-side copy) turn into a
+# near-instant clone. Smaller files are not worth the extra syscalls.
+_COPY_FILE_RANGE_MIN_SIZE = 64 * 1024 * 1024
+_COPY_FILE_RANGE_UNSUPPORTED_ERRNOS = frozenset(
+    {
+        errno.EXDEV,
+        errno.EINVAL,
+        errno.ENOSYS,
+        errno.EBADF,
+        getattr(errno, "ENOTSUP", errno.EINVAL),
+        getattr(errno, "EOPNOTSUPP", errno.EINVAL),
+    }
+)
+# (source st_dev, destination st_dev) -> whether copy_file_range worked
+_COPY_FILE_RANGE_SUPPORT: dict[tuple[int, int], bool] = {}
+
 
 def _use_gevent_threadpool() -> bool:
     return bool(
@@ -564,10 +586,26 @@ def atomic_hardlink(source_path: Path, dest_path: Path, max_attempts: int = 100)
     Raises:
         RuntimeError: If no unique path found after max_attempts
 
+    """
+    return atomic_hardlink_or_copy(source_path, dest_path, max_attempts=max_attempts)[0]
+
+
+def atomic_hardlink_or_copy(
+    source_path: Path, dest_path: Path, max_attempts: int = 100
+) -> tuple[Path, Literal["hardlink", "copy"]]:
+    """Hardlink like `atomic_hardlink`, also reporting whether it fell back to copy.
+
+    Returns:
+        (final_path, op) where op is "hardlink" or "copy"
+
     """
     base = dest_path.stem
     ext = dest_path.suffix
     parent = dest_path.parent
+    dir_pair = (str(source_path.parent), str(parent))
+
+    if dir_pair in _CROSS_DEVICE_DIRS:
+        return atomic_copy(source_path, dest_path, max_attempts=max_attempts), "copy"
 
     for attempt in range(max_attempts):
         try_path = dest_path if attempt == 0 else parent / f"{base}_{attempt}{ext}"
@@ -593,15 +631,75 @@ def atomic_hardlink(source_path: Path, dest_path: Path, max_attempts: int = 100)
                     source_path,
                     dest_path,
                 )
-                return atomic_copy(source_path, dest_path, max_attempts=max_attempts)
+                if e.errno == errno.EXDEV:
+                    if len(_CROSS_DEVICE_DIRS) >= _CROSS_DEVICE_DIRS_MAX:
+                        _CROSS_DEVICE_DIRS.clear()
+                    _CROSS_DEVICE_DIRS.add(dir_pair)
+                return atomic_copy(source_path, dest_path, max_attempts=max_attempts), "copy"
             raise
         else:
-            return try_path
+            return try_path, "hardlink"
 
     msg = f"Could not create hardlink after {max_attempts} attempts: {dest_path}"
     raise RuntimeError(msg)
 
 
+def _copy_file_range(source_path: Path, dest_path: Path, size: int) -> bool:
+    """Copy file contents with os.copy_file_range, mirroring shutil.copy2.
+
+    Returns False without touching metadata when the kernel or filesystem pair does
+    not support it, so the caller can fall back to a regular copy.
+    """
+    copy_file_range = getattr(os, "copy_file_range", None)
+    if copy_file_range is None or size < _COPY_FILE_RANGE_MIN_SIZE:
+        return False
+
+    with source_path.open("rb") as src, dest_path.open("wb") as dst:
+        src_fd = src.fileno()
+        dst_fd = dst.fileno()
+        device_pair = (os.fstat(src_fd).st_dev, os.fstat(dst_fd).st_dev)
+        if _COPY_FILE_RANGE_SUPPORT.get(device_pair) is False:
+            return False
+
+        copied = 0
+        try:
+            while copied < size:
+                chunk = copy_file_range(src_fd, dst_fd, size - copied)
+                if chunk == 0:
+                    break
+                copied += chunk
+        except OSError as e:
+            if e.errno not in _COPY_FILE_RANGE_UNSUPPORTED_ERRNOS or copied:
+                raise
+            if device_pair not in _COPY_FILE_RANGE_SUPPORT:
+                logger.info(
+                    "copy_file_range unavailable between devices %s -> %s (%s); using regular copy",
+                    *device_pair,
+                    e,
+                )
+            _COPY_FILE_RANGE_SUPPORT[device_pair] = False
+            return False
+
+        if copied < size:
+            # A 0 return before the end means the filesystem would not copy this range
+            # (or the source shrank); let copy2 redo the whole file instead.
+            if not copied:
+                if device_pair not in _COPY_FILE_RANGE_SUPPORT:
+                    logger.info(
+                        "copy_file_range copied nothing between devices %s -> %s; "
+                        "using regular copy",
+                        *device_pair,
+                    )
+                _COPY_FILE_RANGE_SUPPORT[device_pair] = False
+            return False
+
+    if device_pair not in _COPY_FILE_RANGE_SUPPORT:
+        logger.info("copy_file_range fast path active between devices %s -> %s", *device_pair)
+    _COPY_FILE_RANGE_SUPPORT[device_pair] = True
+    shutil.copystat(source_path, dest_path)
+    return True
+
+
 def atomic_copy(source_path: Path, dest_path: Path, max_attempts: int = 100) -> Path:
     """Copy a file with atomic collision detection.
 
@@ -633,7 +731,8 @@ def atomic_copy(source_path: Path, dest_path: Path, max_attempts: int = 100) ->
         try:
             temp_path = _create_temp_path(try_path)
             try:
-                run_blocking_io(shutil.copy2, str(source_path), str(temp_path))
+                if not run_blocking_io(_copy_file_range, source_path, temp_path, expected_size):
+                    run_blocking_io(shutil.copy2, str(source_path), str(temp_path))
             except (PermissionError, OSError) as e:
                 if _should_fallback_to_content_copy(e):
                     if _is_permission_error(e):
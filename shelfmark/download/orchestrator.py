@@ -4,6 +4,7 @@ Two-stage architecture: handlers stage to TMP_DIR, orchestrator delivers to the
 with archive extraction and custom script support.
 """
 
+import heapq
 import os
 import random
 import threading
@@ -55,20 +56,32 @@ except ImportError:
     ws_manager = None
     WEBSOCKET_AVAILABLE = False
 
-# Progress update throttling - track last broadcast time per book
-_progress_last_broadcast: dict[str, float] = {}
+# Progress broadcast coalescing - latest unsent progress per book, flushed by
+# the progress broadcaster thread
+_pending_progress: dict[str, float] = {}
 _progress_lock = Lock()
-
-# Stall detection - track last activity time per download
+# Last progress sent per book. Immediate and ticker broadcasts both hold _broadcast_lock,
+# so a stale coalesced value can never go out after a newer immediate one
+_broadcast_progress: dict[str, float] = {}
+_broadcast_lock = Lock()
+
+# Stall detection - track last activity time (time.monotonic) per download, plus a
+# min-heap of (deadline, task_id) so the coordinator only inspects tasks that are due.
+# Heap entries are invalidated lazily: _stall_deadlines holds the live deadline per task.
 _last_activity: dict[str, float] = {}
+_stall_heap: list[tuple[float, str]] = []
+_stall_deadlines: dict[str, float] = {}
 _last_progress_value: dict[str, float] = {}
 # De-duplicate status updates (keep-alive updates shouldn't spam clients)
 _last_status_event: dict[str, tuple[str, str | None]] = {}
 STALL_TIMEOUT = 300  # 5 minutes without progress/status update = stalled
 COORDINATOR_LOOP_ERROR_RETRY_DELAY = 1.0
+_DOWNLOAD_STAGGER_MIN_SECONDS = 2.0
+_DOWNLOAD_STAGGER_MAX_SECONDS = 5.0
 _PROGRESS_BROADCAST_START_PERCENT = 1
 _PROGRESS_BROADCAST_COMPLETE_PERCENT = 99
-_PROGRESS_BROADCAST_MIN_DELTA = 10
+_PROGRESS_BROADCAST_MIN_INTERVAL = 0.1
+_QUEUE_STATUS_BY_VALUE: dict[str, QueueStatus] = {status.value: status for status in QueueStatus}
 
 
 def _is_plain_email_address(value: str) -> bool:
@@ -304,8 +317,7 @@ def queue_release(
         logger.info("Release queued with priority %s: %s", priority, task.title)
 
         # Broadcast status update via WebSocket
-        if ws_manager:
-            ws_manager.broadcast_status_update(queue_status())
+        _broadcast_queue_status()
 
     except ValueError as e:
         error_msg = str(e)
@@ -341,6 +353,17 @@ def queue_status(user_id: int | None = None) -> dict[str, dict[str, Any]]:
     }
 
 
+def _ws_has_subscribers() -> bool:
+    """Check whether any WebSocket client would receive a broadcast."""
+    return bool(ws_manager and ws_manager.is_enabled() and ws_manager.has_subscribers())
+
+
+def _broadcast_queue_status() -> None:
+    """Broadcast queue status, skipping the queue snapshot when nobody is listening."""
+    if ws_manager and _ws_has_subscribers():
+        ws_manager.broadcast_status_update(queue_status())
+
+
 def get_book_data(task_id: str) -> tuple[bytes | None, DownloadTask | None]:
     """Get downloaded file data for a specific task."""
     task = None
@@ -547,8 +570,7 @@ def retry_persisted_download(
 
     book_queue.update_status_message(task.task_id, "Retrying now")
 
-    if ws_manager:
-        ws_manager.broadcast_status_update(queue_status())
+    _broadcast_queue_status()
 
     return True, None
 
@@ -608,7 +630,10 @@ def _capture_task_error(
 
 
 def _format_download_exception_message(exc: BaseException) -> str:
-    if isinstance(exc, PermissionError) and "/cwa-book-ingest" in str(exc):
+    if isinstance(exc, PermissionError) and any(
+        isinstance(path, str) and "/cwa-book-ingest" in path
+        for path in (exc.filename, exc.filename2)
+    ):
         return "Destination misconfigured. Go to Settings → Downloads to update."
     if isinstance(exc, PermissionError):
         return f"Permission denied: {exc}"
@@ -745,8 +770,47 @@ def _download_task(task_id: str, cancel_flag: Event) -> str | None:
     return result
 
 
+def _record_activity_locked(book_id: str, now: float) -> None:
+    """Record download activity for stall detection. Caller must hold _progress_lock."""
+    _last_activity[book_id] = now
+    # Only schedule a deadline for tasks without one; the coordinator reschedules
+    # from _last_activity when an entry comes due, keeping one heap entry per task.
+    if book_id not in _stall_deadlines:
+        deadline = now + STALL_TIMEOUT
+        _stall_deadlines[book_id] = deadline
+        heapq.heappush(_stall_heap, (deadline, book_id))
+
+
+def _pop_stalled_tasks(now: float, active_task_ids: set[str]) -> list[str]:
+    """Return active tasks with no activity for STALL_TIMEOUT seconds, in deadline order."""
+    stalled: list[str] = []
+    with _progress_lock:
+        while _stall_heap and _stall_heap[0][0] < now:
+            deadline, task_id = heapq.heappop(_stall_heap)
+            if _stall_deadlines.get(task_id) != deadline:
+                continue  # Superseded or cleaned up
+
+            if task_id not in active_task_ids:
+                # A late callback after cleanup re-armed tracking for a finished task
+                del _stall_deadlines[task_id]
+                _last_activity.pop(task_id, None)
+                continue
+
+            last_active = _last_activity.get(task_id)
+            actual_deadline = last_active + STALL_TIMEOUT if last_active is not None else None
+            if actual_deadline is None or now > actual_deadline:
+                del _stall_deadlines[task_id]
+                if actual_deadline is not None:
+                    stalled.append(task_id)
+                continue
+
+            _stall_deadlines[task_id] = actual_deadline
+            heapq.heappush(_stall_heap, (actual_deadline, task_id))
+    return stalled
+
+
 def update_download_progress(book_id: str, progress: float) -> None:
-    """Update download progress with throttled WebSocket broadcasts."""
+    """Update download progress, coalescing WebSocket broadcasts per interval."""
     book_queue.update_progress(book_id, progress)
 
     # Only real progress changes should reset stall detection. Repeated keep-alive
@@ -754,54 +818,85 @@ def update_download_progress(book_id: str, progress: float) -> None:
     with _progress_lock:
         last_progress = _last_progress_value.get(book_id)
         if last_progress is None or progress != last_progress:
-            _last_activity[book_id] = time.time()
+            _record_activity_locked(book_id, time.monotonic())
         _last_progress_value[book_id] = progress
 
-    # Broadcast progress via WebSocket with throttling
-    if ws_manager:
-        current_time = time.time()
-        progress_update_interval = _config_float(config.DOWNLOAD_PROGRESS_UPDATE_INTERVAL, 1.0)
-        should_broadcast = False
-
-        with _progress_lock:
-            last_broadcast = _progress_last_broadcast.get(book_id, 0)
-            last_progress = _progress_last_broadcast.get(f"{book_id}_progress", 0)
-            time_elapsed = current_time - last_broadcast
-
-            # Always broadcast at start (0%) or completion (>=99%)
-            should_broadcast = (
-                progress <= _PROGRESS_BROADCAST_START_PERCENT
-                or progress >= _PROGRESS_BROADCAST_COMPLETE_PERCENT
-                or time_elapsed >= progress_update_interval
-                or progress - last_progress >= _PROGRESS_BROADCAST_MIN_DELTA
-            )
-
-            if should_broadcast:
-                _progress_last_broadcast[book_id] = current_time
-                _progress_last_broadcast[f"{book_id}_progress"] = progress
+    if not (ws_manager and _ws_has_subscribers()):
+        return
 
-        if should_broadcast:
-            task = book_queue.get_task(book_id)
-            task_user_id = task.user_id if task else None
+    # Always broadcast at start (0%) or completion (>=99%); everything in between is
+    # picked up by the progress broadcaster thread on its next tick.
+    if (
+        progress <= _PROGRESS_BROADCAST_START_PERCENT
+        or progress >= _PROGRESS_BROADCAST_COMPLETE_PERCENT
+    ):
+        _pending_progress.pop(book_id, None)
+        task = book_queue.get_task(book_id)
+        task_user_id = task.user_id if task else None
+        with _broadcast_lock:
+            _broadcast_progress[book_id] = progress
             ws_manager.broadcast_download_progress(
                 book_id, progress, "downloading", user_id=task_user_id
             )
+        return
+
+    # Single dict store is atomic under the GIL; no lock needed on the hot path.
+    _pending_progress[book_id] = progress
+
+
+def _flush_pending_progress() -> None:
+    """Broadcast the latest coalesced progress for every task updated since the last tick."""
+    updates: dict[str, tuple[float, int | None]] = {}
+    with _broadcast_lock:
+        while True:
+            try:
+                book_id, progress = _pending_progress.popitem()
+            except KeyError:
+                break
+            # The task finished, or a newer value already went out immediately
+            if book_queue.get_task_status(book_id) != QueueStatus.DOWNLOADING:
+                continue
+            if progress < _broadcast_progress.get(book_id, progress):
+                continue
+            task = book_queue.get_task(book_id)
+            updates[book_id] = (progress, task.user_id if task else None)
+            _broadcast_progress[book_id] = progress
+
+        if updates and ws_manager and _ws_has_subscribers():
+            ws_manager.broadcast_download_progress_batch(updates, "downloading")
+
+
+def _progress_broadcast_loop() -> None:
+    """Flush coalesced progress updates every DOWNLOAD_PROGRESS_UPDATE_INTERVAL seconds."""
+    while True:
+        interval = _config_float(config.DOWNLOAD_PROGRESS_UPDATE_INTERVAL, 1.0)
+        time.sleep(max(interval, _PROGRESS_BROADCAST_MIN_INTERVAL))
+        try:
+            _flush_pending_progress()
+        except (AttributeError, KeyError, OSError, RuntimeError, TypeError, ValueError) as e:
+            logger.error_trace("Progress broadcaster error: %s", e)
 
 
 def update_download_status(book_id: str, status: str, message: str | None = None) -> None:
     """Update download status with optional message for UI display."""
-    status_key = status.lower()
-    try:
-        queue_status_enum = QueueStatus(status_key)
-    except ValueError:
-        return
+    queue_status_enum = _QUEUE_STATUS_BY_VALUE.get(status)
+    if queue_status_enum is None:
+        queue_status_enum = _QUEUE_STATUS_BY_VALUE.get(status.lower())
+        if queue_status_enum is None:
+            return
 
     with _progress_lock:
-        status_event = (status_key, message)
-        if _last_status_event.get(book_id) == status_event:
+        last_event = _last_status_event.get(book_id)
+        # A repeat of the current status is a no-op unless it carries a new message;
+        # a missing message leaves the displayed one untouched.
+        if (
+            last_event is not None
+            and last_event[0] == queue_status_enum.value
+            and message in (None, last_event[1])
+        ):
             return
-        _last_activity[book_id] = time.time()
-        _last_status_event[book_id] = status_event
+        _record_activity_locked(book_id, time.monotonic())
+        _last_status_event[book_id] = (queue_status_enum.value, message)
 
     # Update status message first so terminal snapshots capture the final message
     # (for example, "Complete" or "Sent to ...") instead of a stale in-progress one.
@@ -811,8 +906,7 @@ def update_download_status(book_id: str, status: str, message: str | None = None
     book_queue.update_status(book_id, queue_status_enum)
 
     # Broadcast status update via WebSocket
-    if ws_manager:
-        ws_manager.broadcast_status_update(queue_status())
+    _broadcast_queue_status()
 
 
 def cancel_download(book_id: str) -> bool:
@@ -820,8 +914,8 @@ def cancel_download(book_id: str) -> bool:
     result = book_queue.cancel_download(book_id)
 
     # Broadcast status update via WebSocket
-    if result and ws_manager and ws_manager.is_enabled():
-        ws_manager.broadcast_status_update(queue_status())
+    if result:
+        _broadcast_queue_status()
 
     return result
 
@@ -852,8 +946,7 @@ def retry_download(book_id: str) -> tuple[bool, str | None]:
 
     book_queue.update_status_message(book_id, "Retrying now")
 
-    if ws_manager:
-        ws_manager.broadcast_status_update(queue_status())
+    _broadcast_queue_status()
 
     return True, None
 
@@ -880,10 +973,12 @@ def get_active_downloads() -> list[str]:
 
 def _cleanup_progress_tracking(task_id: str) -> None:
     """Clean up progress tracking data for a completed/cancelled download."""
+    with _broadcast_lock:
+        _pending_progress.pop(task_id, None)
+        _broadcast_progress.pop(task_id, None)
     with _progress_lock:
-        _progress_last_broadcast.pop(task_id, None)
-        _progress_last_broadcast.pop(f"{task_id}_progress", None)
         _last_activity.pop(task_id, None)
+        _stall_deadlines.pop(task_id, None)
         _last_progress_value.pop(task_id, None)
         _last_status_event.pop(task_id, None)
 
@@ -918,8 +1013,7 @@ def _process_single_download(task_id: str, cancel_flag: Event) -> None:
     if cancel_flag.is_set():
         book_queue.update_status(task_id, QueueStatus.CANCELLED)
         # Broadcast cancellation
-        if ws_manager:
-            ws_manager.broadcast_status_update(queue_status())
+        _broadcast_queue_status()
         return
 
     if download_path:
@@ -929,8 +1023,7 @@ def _process_single_download(task_id: str, cancel_flag: Event) -> None:
         _finalize_download_failure(task_id)
 
     # Broadcast final status (completed or error)
-    if ws_manager:
-        ws_manager.broadcast_status_update(queue_status())
+    _broadcast_queue_status()
 
 
 def concurrent_download_loop() -> None:
@@ -942,6 +1035,7 @@ def concurrent_download_loop() -> None:
     with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="Download") as executor:
         active_futures: dict[Future, tuple[str, Event]] = {}  # Track active download futures
         stalled_tasks: set[str] = set()  # Track tasks already cancelled due to stall
+        next_start_at = 0.0  # Earliest monotonic time another concurrent download may start
 
         while True:
             try:
@@ -965,8 +1059,7 @@ def concurrent_download_loop() -> None:
                                     exc_type="CancelledError",
                                 )
                             _finalize_download_failure(task_id)
-                        if ws_manager:
-                            ws_manager.broadcast_status_update(queue_status())
+                        _broadcast_queue_status()
                         continue
 
                     worker_error = future.exception()
@@ -987,44 +1080,46 @@ def concurrent_download_loop() -> None:
                                 exc_type=type(worker_error).__name__,
                             )
                         _finalize_download_failure(task_id)
-                    if ws_manager:
-                        ws_manager.broadcast_status_update(queue_status())
-
-                # Check for stalled downloads (no activity in STALL_TIMEOUT seconds)
-                current_time = time.time()
-                with _progress_lock:
-                    for _future, (task_id, _cancel_flag) in list(active_futures.items()):
-                        if task_id in stalled_tasks:
-                            continue
-                        last_active = _last_activity.get(task_id, current_time)
-                        if current_time - last_active > STALL_TIMEOUT:
-                            logger.warning("Download stalled for %s, cancelling", task_id)
-                            book_queue.cancel_download(task_id)
-                            book_queue.update_status_message(
-                                task_id,
-                                f"Download stalled (no activity for {STALL_TIMEOUT}s)",
-                            )
-                            stalled_tasks.add(task_id)
+                    _broadcast_queue_status()
+
+                # Check for stalled downloads (no activity in STALL_TIMEOUT seconds).
+                # Only tasks whose deadline has passed are popped from the stall heap.
+                active_task_ids = {task_id for task_id, _ in active_futures.values()}
+                for task_id in _pop_stalled_tasks(time.monotonic(), active_task_ids):
+                    if task_id in stalled_tasks:
+                        continue
+                    logger.warning("Download stalled for %s, cancelling", task_id)
+                    book_queue.cancel_download(task_id)
+                    book_queue.update_status_message(
+                        task_id,
+                        f"Download stalled (no activity for {STALL_TIMEOUT}s)",
+                    )
+                    stalled_tasks.add(task_id)
 
                 # Start new downloads if we have capacity
                 while len(active_futures) < max_workers:
+                    # Stagger concurrent downloads to avoid rate limiting on shared download
+                    # servers. Only delay if other downloads are already active, and defer to
+                    # a later tick instead of sleeping so the coordinator keeps reaping futures.
+                    if active_futures and time.monotonic() < next_start_at:
+                        break
+
                     next_download = book_queue.get_next()
                     if not next_download:
                         break
 
-                    # Stagger concurrent downloads to avoid rate limiting on shared download servers
-                    # Only delay if other downloads are already active
-                    if active_futures:
-                        stagger_delay = _RNG.uniform(2, 5)
-                        logger.debug("Staggering download start by %.1fs", stagger_delay)
-                        time.sleep(stagger_delay)
-
                     task_id, cancel_flag = next_download
 
                     # Submit download job to thread pool
                     future = executor.submit(_process_single_download, task_id, cancel_flag)
                     active_futures[future] = (task_id, cancel_flag)
 
+                    stagger_delay = _RNG.uniform(
+                        _DOWNLOAD_STAGGER_MIN_SECONDS, _DOWNLOAD_STAGGER_MAX_SECONDS
+                    )
+                    next_start_at = time.monotonic() + stagger_delay
+                    logger.debug("Next concurrent download may start in %.1fs", stagger_delay)
+
                 # Brief sleep to prevent busy waiting
                 time.sleep(main_loop_sleep_time)
             except (AttributeError, KeyError, OSError, RuntimeError, TypeError, ValueError) as e:
@@ -1034,14 +1129,21 @@ def concurrent_download_loop() -> None:
 
 # Download coordinator thread (started explicitly via start())
 _coordinator_thread: threading.Thread | None = None
+_progress_broadcaster_thread: threading.Thread | None = None
 _coordinator_lock = Lock()
 
 
 def start() -> None:
     """Start the download coordinator thread. Safe to call multiple times."""
-    global _coordinator_thread
+    global _coordinator_thread, _progress_broadcaster_thread
 
     with _coordinator_lock:
+        if _progress_broadcaster_thread is None or not _progress_broadcaster_thread.is_alive():
+            _progress_broadcaster_thread = threading.Thread(
+                target=_progress_broadcast_loop, daemon=True, name="ProgressBroadcaster"
+            )
+            _progress_broadcaster_thread.start()
+
         if _coordinator_thread is not None and _coordinator_thread.is_alive():
             logger.debug("Download coordinator already started")
             return
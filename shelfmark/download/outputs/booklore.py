@@ -436,7 +436,9 @@ def _post_process_booklore(
                 }
             },
         )
-        if not maybe_run_custom_script(script_context, status_callback=status_callback):
+        if not maybe_run_custom_script(
+            script_context, status_callback=status_callback, cancel_flag=cancel_flag
+        ):
             return None
 
         message = f"Uploaded to {BOOKLORE_DISPLAY_NAME}"
@@ -443,7 +443,9 @@ def _post_process_email(
                 }
             },
         )
-        if not maybe_run_custom_script(script_context, status_callback=status_callback):
+        if not maybe_run_custom_script(
+            script_context, status_callback=status_callback, cancel_flag=cancel_flag
+        ):
             return None
 
         status_callback("complete", f"Sent to {label}")
@@ -16,6 +16,7 @@ if TYPE_CHECKING:
     from threading import Event
 
     from shelfmark.core.models import DownloadTask
+    from shelfmark.download.postprocess.types import OutputPlan
 
 logger = setup_logger(__name__)
 
@@ -36,6 +37,7 @@ class _ProcessingPlan:
     stage_action: StageAction
     staging_dir: Path
     hardlink_source: Path | None
+    output_plan: OutputPlan
     output_mode: str = FOLDER_OUTPUT_MODE
 
 
@@ -83,6 +85,7 @@ def _build_processing_plan(
         stage_action=output_plan.stage_action,
         staging_dir=output_plan.staging_dir,
         hardlink_source=hardlink_source,
+        output_plan=output_plan,
     )
 
 
@@ -128,6 +131,7 @@ def process_folder_output(
         output_mode=plan.output_mode,
         status_callback=status_callback,
         destination=plan.destination,
+        output_plan=plan.output_plan,
         preserve_source_on_failure=preserve_source_on_failure,
     )
     if not prepared:
@@ -242,7 +246,9 @@ def process_folder_output(
         ),
     )
 
-    if not maybe_run_custom_script(script_context, status_callback=status_callback, steps=steps):
+    if not maybe_run_custom_script(
+        script_context, status_callback=status_callback, steps=steps, cancel_flag=cancel_flag
+    ):
         if not preserve_source_on_failure:
             cleanup_output_staging(
                 prepared.output_plan,
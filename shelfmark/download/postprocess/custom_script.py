@@ -2,21 +2,24 @@
 
 from __future__ import annotations
 
+import contextlib
 import json
 import os
+import signal
 import subprocess
+import time
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import shelfmark.core.config as core_config
 from shelfmark.core.logger import setup_logger
-from shelfmark.download.fs import run_blocking_io
 
 from .steps import log_plan_steps, record_step
 
 if TYPE_CHECKING:
     from collections.abc import Callable
+    from threading import Event
 
     from shelfmark.core.models import DownloadTask
 
@@ -25,6 +28,10 @@ if TYPE_CHECKING:
 logger = setup_logger(__name__)
 
 DEFAULT_CUSTOM_SCRIPT_TIMEOUT_SECONDS = 300  # 5 minutes
+# How often a running script is checked against the task's cancel flag.
+CUSTOM_SCRIPT_CANCEL_POLL_SECONDS = 0.5
+# Grace period between SIGTERM and SIGKILL when a script is cancelled.
+CUSTOM_SCRIPT_TERMINATE_GRACE_SECONDS = 5
 
 
 def resolve_custom_script_target(target_path: Path, destination: Path, path_mode: str) -> Path:
@@ -36,10 +43,17 @@ def resolve_custom_script_target(target_path: Path, destination: Path, path_mode
     target is not within the destination, fall back to just the filename to
     avoid leaking unrelated absolute paths.
     """
-    mode = (path_mode or "absolute").strip().lower()
-    if mode != "relative":
+    if _normalize_path_mode(path_mode) != "relative":
         return target_path
+    return _relative_script_target(target_path, destination)
+
+
+def _normalize_path_mode(path_mode: str) -> str:
+    mode = (path_mode or "absolute").strip().lower()
+    return "relative" if mode == "relative" else "absolute"
+
 
+def _relative_script_target(target_path: Path, destination: Path) -> Path:
     try:
         return target_path.relative_to(destination)
     except ValueError:
@@ -96,11 +110,10 @@ def prepare_custom_script_execution(
     payload: dict[str, Any] | None = None,
 ) -> CustomScriptExecution:
     """Resolve script arguments and payload for a custom hook invocation."""
-    mode = (path_mode or "absolute").strip().lower()
-    if mode != "relative":
-        mode = "absolute"
-
-    target_arg = resolve_custom_script_target(target_path, destination, mode)
+    mode = _normalize_path_mode(path_mode)
+    target_arg = (
+        _relative_script_target(target_path, destination) if mode == "relative" else target_path
+    )
     return CustomScriptExecution(
         script_path=str(script_path),
         target_arg=target_arg,
@@ -112,14 +125,84 @@ def prepare_custom_script_execution(
     )
 
 
+def _signal_script_process(process: subprocess.Popen[str], sig: signal.Signals) -> None:
+    # Scripts run in their own session so children they spawn (which would keep
+    # the output pipes open) are signalled together with the script itself.
+    with contextlib.suppress(ProcessLookupError):
+        os.killpg(process.pid, sig)
+
+
+def _terminate_script_process(process: subprocess.Popen[str]) -> None:
+    _signal_script_process(process, signal.SIGTERM)
+    try:
+        process.communicate(timeout=CUSTOM_SCRIPT_TERMINATE_GRACE_SECONDS)
+    except subprocess.TimeoutExpired:
+        _signal_script_process(process, signal.SIGKILL)
+        process.communicate()
+
+
+def _run_script_process(
+    args: list[str],
+    *,
+    payload_json: str | None,
+    cwd: str | None,
+    timeout_seconds: float,
+    cancel_flag: Event | None,
+) -> subprocess.CompletedProcess[str] | None:
+    """Run the script to completion, or return None if `cancel_flag` interrupts it.
+
+    Raises the same exceptions as ``subprocess.run(..., check=True, timeout=...)``.
+    """
+    # If we are not sending a JSON payload, close stdin so scripts that try
+    # to read it won't block indefinitely.
+    process = subprocess.Popen(
+        args,
+        stdin=subprocess.DEVNULL if payload_json is None else subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        cwd=cwd,
+        start_new_session=True,
+    )
+    deadline = time.monotonic() + timeout_seconds
+    pending_input = payload_json
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            _signal_script_process(process, signal.SIGKILL)
+            process.communicate()
+            raise subprocess.TimeoutExpired(args, timeout_seconds)
+        if cancel_flag is not None:
+            if cancel_flag.is_set():
+                _terminate_script_process(process)
+                return None
+            remaining = min(remaining, CUSTOM_SCRIPT_CANCEL_POLL_SECONDS)
+        try:
+            stdout, stderr = process.communicate(input=pending_input, timeout=remaining)
+        except subprocess.TimeoutExpired:
+            # The payload is only written on the first call; later calls just keep reading.
+            pending_input = None
+            continue
+        break
+
+    if process.returncode:
+        raise subprocess.CalledProcessError(process.returncode, args, stdout, stderr)
+    return subprocess.CompletedProcess(args, process.returncode, stdout, stderr)
+
+
 def run_custom_script(
     execution: CustomScriptExecution,
     *,
     task_id: str,
     status_callback: Callable[[str, str | None], None],
     timeout_seconds: int = DEFAULT_CUSTOM_SCRIPT_TIMEOUT_SECONDS,
+    cancel_flag: Event | None = None,
 ) -> bool:
-    """Run a prepared custom script and report success."""
+    """Run a prepared custom script and report success.
+
+    When `cancel_flag` is set while the script is running, the script is
+    terminated and the run is reported as unsuccessful without an error status.
+    """
     cwd: str | None = None
     if execution.mode == "relative":
         # Make relative paths unambiguous by running the script from the destination folder.
@@ -134,27 +217,19 @@ def run_custom_script(
     )
 
     try:
-        run_kwargs: dict[str, Any] = {
-            "check": True,
-            "timeout": timeout_seconds,
-            "capture_output": True,
-            "text": True,
-            "cwd": cwd,
-        }
-        # If we are not sending a JSON payload, close stdin so scripts that try
-        # to read it won't block indefinitely. When we do send a payload, let
-        # subprocess.run manage stdin implicitly via `input=` to avoid passing
-        # both arguments at once.
-        if execution.payload_json is None:
-            run_kwargs["stdin"] = subprocess.DEVNULL
-        else:
-            run_kwargs["input"] = execution.payload_json
-
-        result = run_blocking_io(
-            subprocess.run,
+        # Popen/communicate run on the calling greenlet: under gevent the patched
+        # subprocess module needs the hub's child watcher, so it must not be
+        # pushed onto the blocking-I/O threadpool.
+        result = _run_script_process(
             [execution.script_path, str(execution.target_arg)],
-            **run_kwargs,
+            payload_json=execution.payload_json,
+            cwd=cwd,
+            timeout_seconds=timeout_seconds,
+            cancel_flag=cancel_flag,
         )
+        if result is None:
+            logger.info("Task %s: custom script cancelled: %s", task_id, execution.script_path)
+            return False
         if result.stdout:
             logger.debug("Task %s: custom script stdout: %s", task_id, result.stdout.strip())
     except FileNotFoundError:
@@ -262,6 +337,7 @@ def maybe_run_custom_script(
     *,
     status_callback: Callable[[str, str | None], None],
     steps: list[PlanStep] | None = None,
+    cancel_flag: Event | None = None,
 ) -> bool:
     """Run the custom script hook (if configured).
 
@@ -321,5 +397,8 @@ def maybe_run_custom_script(
         log_plan_steps(context.task.task_id, steps)
 
     return run_custom_script(
-        execution, task_id=context.task.task_id, status_callback=status_callback
+        execution,
+        task_id=context.task.task_id,
+        status_callback=status_callback,
+        cancel_flag=cancel_flag,
     )
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -11,6 +13,7 @@ from shelfmark.core.logger import setup_logger
 from shelfmark.core.naming import (
     assign_part_numbers,
     build_library_path,
+    compile_library_path,
     derive_primary_title,
     normalize_language_code,
     parse_naming_template,
@@ -19,7 +22,7 @@ from shelfmark.core.naming import (
 from shelfmark.core.utils import is_audiobook as check_audiobook
 from shelfmark.download.fs import (
     atomic_copy,
-    atomic_hardlink,
+    atomic_hardlink_or_copy,
     atomic_move,
     run_blocking_io,
 )
@@ -36,6 +39,7 @@ if TYPE_CHECKING:
 
 logger = setup_logger("shelfmark.download.postprocess.pipeline")
 _TRANSFER_PROCESS_ERRORS = (AttributeError, KeyError, OSError, RuntimeError, TypeError, ValueError)
+_LIBRARY_TRANSFER_MAX_WORKERS = 8
 
 
 def should_hardlink(task: DownloadTask) -> bool:
@@ -124,10 +128,24 @@ def is_torrent_source(source_path: Path, task: DownloadTask) -> bool:
         return False
 
     original_path = Path(task.original_download_path)
+    if os.path.normpath(str(source_path)) == os.path.normpath(str(original_path)):
+        return True
+
+    # samefile() compares (st_dev, st_ino) with two stats instead of resolve()'s
+    # per-component readlink walk, and still catches symlinked/bind-mounted aliases.
     try:
-        return run_blocking_io(source_path.resolve) == run_blocking_io(original_path.resolve)
+        return run_blocking_io(os.path.samefile, source_path, original_path)
     except OSError, ValueError:
-        return os.path.normpath(str(source_path)) == os.path.normpath(str(original_path))
+        return False
+
+
+def _is_torrent_path(
+    path: Path, checked_path: Path, task: DownloadTask, *, is_torrent: bool
+) -> bool:
+    """Reuse an `is_torrent_source` result when `path` is the path already checked."""
+    if path == checked_path:
+        return is_torrent
+    return is_torrent_source(path, task)
 
 
 def _max_attempts_for_batch(file_count: int, default: int = 100) -> int:
@@ -146,13 +164,7 @@ def _transfer_single_file(
     max_attempts: int = 100,
 ) -> tuple[Path, str]:
     if use_hardlink:
-        final_path = atomic_hardlink(source_path, dest_path, max_attempts=max_attempts)
-        try:
-            if run_blocking_io(source_path.stat).st_ino == run_blocking_io(final_path.stat).st_ino:
-                return final_path, "hardlink"
-        except OSError:
-            return final_path, "hardlink"
-        return final_path, "copy"
+        return atomic_hardlink_or_copy(source_path, dest_path, max_attempts=max_attempts)
 
     if is_torrent or preserve_source:
         return atomic_copy(source_path, dest_path, max_attempts=max_attempts), "copy"
@@ -281,6 +293,7 @@ def process_directory(
     use_hardlink: bool | None = None,
 ) -> tuple[list[Path], str | None]:
     """Process staged directory: find book files, extract archives, move to ingest."""
+    is_torrent: bool | None = None
     try:
         is_torrent = is_torrent_source(directory, task)
         book_files, _, cleanup_paths, error = collect_directory_files(
@@ -323,7 +336,9 @@ def process_directory(
         logger.error_trace(
             "Task %s: error processing directory %s: %s", task.task_id, directory, exc
         )
-        if not is_torrent_source(directory, task):
+        if is_torrent is None:
+            is_torrent = is_torrent_source(directory, task)
+        if not is_torrent:
             safe_cleanup_path(directory, task)
         return [], str(exc)
     else:
@@ -366,7 +381,11 @@ def transfer_file_to_library(
             final_path,
         )
 
-    if use_hardlink and temp_file and not is_torrent_source(temp_file, task):
+    if (
+        use_hardlink
+        and temp_file
+        and not _is_torrent_path(temp_file, source_path, task, is_torrent=is_torrent)
+    ):
         safe_cleanup_path(temp_file, task)
 
     status_callback("complete", "Complete")
@@ -401,13 +420,8 @@ def transfer_directory_to_library(
             safe_cleanup_path(temp_file, task)
         return None
 
-    base_library_path = run_blocking_io(
-        build_library_path,
-        library_base,
-        template,
-        metadata,
-        extension=None,
-    )
+    build_release_path = run_blocking_io(compile_library_path, library_base, template, metadata)
+    base_library_path = run_blocking_io(build_release_path, None, None)
     run_blocking_io(base_library_path.parent.mkdir, parents=True, exist_ok=True)
 
     is_torrent = is_torrent_source(source_dir, task)
@@ -432,14 +446,23 @@ def transfer_directory_to_library(
     else:
         zero_pad_width = max(len(str(len(source_files))), 2)
         files_with_parts = assign_part_numbers(source_files, zero_pad_width)
+        created_dirs: set[Path] = set()
+        created_dirs_lock = threading.Lock()
 
-        for source_file, part_number in files_with_parts:
-            ext = source_file.suffix.lstrip(".")
-            file_metadata = {**metadata, "PartNumber": part_number}
-            file_path = run_blocking_io(
-                build_library_path, library_base, template, file_metadata, extension=ext
+        planned_parts = [
+            (
+                source_file,
+                run_blocking_io(build_release_path, part_number, source_file.suffix.lstrip(".")),
             )
-            run_blocking_io(file_path.parent.mkdir, parents=True, exist_ok=True)
+            for source_file, part_number in files_with_parts
+        ]
+
+        def _transfer_part(planned_part: tuple[Path, Path]) -> tuple[Path, str]:
+            source_file, file_path = planned_part
+            with created_dirs_lock:
+                if file_path.parent not in created_dirs:
+                    run_blocking_io(file_path.parent.mkdir, parents=True, exist_ok=True)
+                    created_dirs.add(file_path.parent)
 
             final_path, op = _transfer_single_file(
                 source_file,
@@ -449,6 +472,24 @@ def transfer_directory_to_library(
                 max_attempts=max_attempts,
             )
             logger.debug("Library %s: %s -> %s", op, source_file.name, final_path)
+            return final_path, op
+
+        # Only copies fan out: hardlinks are near-free, and atomic_move's collision check
+        # is not exclusive, so concurrent moves onto one name could overwrite each other.
+        # Parts that share a destination (template without a part number) stay sequential
+        # too, so their _1/_2 suffixes follow part order rather than thread timing.
+        # map() keeps results in part order so the first part stays the returned path.
+        distinct_destinations = len({path for _, path in planned_parts}) == len(planned_parts)
+        if use_hardlink or not is_torrent or not distinct_destinations:
+            results = list(map(_transfer_part, planned_parts))
+        else:
+            max_workers = min(_LIBRARY_TRANSFER_MAX_WORKERS, len(planned_parts))
+            with ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="LibraryTransfer"
+            ) as executor:
+                results = list(executor.map(_transfer_part, planned_parts))
+
+        for final_path, op in results:
             transferred_paths.append(final_path)
             op_counts[op] = op_counts.get(op, 0) + 1
 
@@ -466,7 +507,11 @@ def transfer_directory_to_library(
             len(transferred_paths),
         )
 
-    if use_hardlink and temp_file and not is_torrent_source(temp_file, task):
+    if (
+        use_hardlink
+        and temp_file
+        and not _is_torrent_path(temp_file, source_dir, task, is_torrent=is_torrent)
+    ):
         safe_cleanup_path(temp_file, task)
     elif not is_torrent:
         safe_cleanup_path(temp_file, task)
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import os
 import shutil
+import stat
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -24,6 +27,25 @@ def _tmp_dir() -> Path:
     return env_config.TMP_DIR
 
 
+# Resolved forms of paths that stay fixed while tasks run (TMP_DIR and each task's
+# original_download_path), so repeated cleanup checks resolve them only once.
+_RESOLVED_PATHS: dict[Path, Path] = {}
+_RESOLVED_PATHS_MAX = 256
+
+# Upper bound on cleanup paths removed concurrently by cleanup_output_staging.
+_CLEANUP_MAX_WORKERS = 4
+
+
+def _resolve_cached(path: Path) -> Path:
+    resolved = _RESOLVED_PATHS.get(path)
+    if resolved is None:
+        resolved = run_blocking_io(path.resolve)
+        if len(_RESOLVED_PATHS) >= _RESOLVED_PATHS_MAX:
+            _RESOLVED_PATHS.clear()
+        _RESOLVED_PATHS[path] = resolved
+    return resolved
+
+
 def is_within_tmp_dir(path: Path) -> bool:
     """Legacy helper: True if path is inside TMP_DIR."""
     # Fast path: avoid `resolve()` (can block on NFS) for obviously-non-TMP paths.
@@ -31,16 +53,13 @@ def is_within_tmp_dir(path: Path) -> bool:
     # prevent symlink escapes from being treated as managed.
     tmp_dir = _tmp_dir()
     with suppress(Exception):
-        if (
-            path.is_absolute()
-            and tmp_dir.is_absolute()
-            and path != tmp_dir
-            and tmp_dir not in path.parents
-        ):
+        # Relative paths are anchored at the working directory, as resolve() would.
+        candidate = path if path.is_absolute() else Path(os.path.normpath(Path.cwd() / path))
+        if tmp_dir.is_absolute() and candidate != tmp_dir and tmp_dir not in candidate.parents:
             return False
 
     try:
-        run_blocking_io(path.resolve).relative_to(run_blocking_io(tmp_dir.resolve))
+        run_blocking_io(path.resolve).relative_to(_resolve_cached(tmp_dir))
     except OSError, ValueError:
         return False
     else:
@@ -61,7 +80,9 @@ def _is_original_download(path: Path | None, task: DownloadTask) -> bool:
         return False
     try:
         original = Path(task.original_download_path)
-        return run_blocking_io(path.resolve) == run_blocking_io(original.resolve)
+        if os.path.normpath(path) == os.path.normpath(original):
+            return True
+        return run_blocking_io(path.resolve) == _resolve_cached(original)
     except OSError, ValueError:
         return False
 
@@ -76,10 +97,15 @@ def safe_cleanup_path(path: Path | None, task: DownloadTask) -> None:
         return
 
     try:
-        if path.is_dir():
+        # One stat decides between rmtree and unlink (is_dir() + exists() took two).
+        try:
+            path_stat = run_blocking_io(path.stat)
+        except FileNotFoundError:
+            return
+        if stat.S_ISDIR(path_stat.st_mode):
             run_blocking_io(shutil.rmtree, path, ignore_errors=True)
-        elif path.exists():
-            path.unlink(missing_ok=True)
+        else:
+            run_blocking_io(path.unlink, missing_ok=True)
     except (OSError, PermissionError) as exc:
         logger.warning("Cleanup failed for task %s (%s): %s", task.task_id, path, exc)
 
@@ -97,6 +123,18 @@ def cleanup_output_staging(
             cleanup_target = working_path
         safe_cleanup_path(cleanup_target, task)
 
-    if cleanup_paths:
-        for path in cleanup_paths:
-            safe_cleanup_path(path, task)
+    if not cleanup_paths:
+        return
+
+    if len(cleanup_paths) == 1:
+        safe_cleanup_path(cleanup_paths[0], task)
+        return
+
+    # Each rmtree is a long run of unlinks; on network filesystems overlapping them
+    # hides most of the per-call latency. Removal is idempotent, so overlapping
+    # paths (a directory and a file inside it) are safe to race.
+    max_workers = min(_CLEANUP_MAX_WORKERS, len(cleanup_paths))
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="StagingCleanup"
+    ) as executor:
+        list(executor.map(lambda path: safe_cleanup_path(path, task), cleanup_paths))
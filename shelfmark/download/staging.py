@@ -45,12 +45,16 @@ def build_staging_dir(prefix: str | None, task_id: str) -> Path:
     staging_dir = base_dir / f"{prefix}_{safe_id}"
     counter = 1
 
-    while run_blocking_io(staging_dir.exists):
-        staging_dir = base_dir / f"{prefix}_{safe_id}_{counter}"
-        counter += 1
-
-    run_blocking_io(staging_dir.mkdir, parents=True, exist_ok=True)
-    return staging_dir
+    # Creating the directory is the existence check, so a concurrent caller can
+    # never be handed the same directory.
+    while True:
+        try:
+            run_blocking_io(staging_dir.mkdir)
+        except FileExistsError:
+            staging_dir = base_dir / f"{prefix}_{safe_id}_{counter}"
+            counter += 1
+        else:
+            return staging_dir
 
 
 def stage_file(source_path: Path, task_id: str, *, copy: bool = False) -> Path:
@@ -56,7 +56,7 @@ class BrowseRecord:
     source_url: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Release:
     """A downloadable release - all sources return this same structure."""
 
@@ -4,11 +4,13 @@ Stores search results in CONFIG_DIR to survive container restarts.
 IRC searches are slow and resource-intensive, so we cache aggressively.
 """
 
+import atexit
+import copy
 import json
 import time
-from dataclasses import asdict
+from dataclasses import fields
 from pathlib import Path
-from threading import Lock
+from threading import Lock, Timer
 from typing import Any
 
 from shelfmark.config import env
@@ -17,14 +19,34 @@ from shelfmark.release_sources import Release, ReleaseProtocol
 
 logger = setup_logger(__name__)
 
+_RELEASE_FIELDS = tuple(f.name for f in fields(Release))
+
 # Cache file location
 CACHE_FILE = Path(env.CONFIG_DIR) / "irc_cache.json"
 
 # Default TTL: 30 days (in seconds)
 DEFAULT_CACHE_TTL = 30 * 24 * 60 * 60
 
-# Lock for thread-safe file access
+# An empty answer may only mean the search bot was briefly away, so it is not kept
+# for the full TTL: 10 minutes (in seconds)
+EMPTY_RESULTS_CACHE_TTL = 10 * 60
+
+# Lock for thread-safe cache access
 _cache_lock = Lock()
+# Serializes writes of the cache file
+_write_lock = Lock()
+
+# Parsed cache file, reused while the file's mtime is unchanged (guarded by _cache_lock)
+_cache_data: dict[str, Any] | None = None
+_cache_mtime_ns: int | None = None
+
+# Saves are coalesced: mutations mark the in-memory cache dirty and a timer writes it
+# out once, so a burst of search completions costs one file rewrite.
+SAVE_DELAY_SECONDS = 0.5
+# A failed write is retried on its own after this long, without waiting for a new search
+SAVE_RETRY_DELAY_SECONDS = 30.0
+_cache_dirty = False
+_flush_timer: Timer | None = None
 
 
 def _coerce_cache_ttl(value: object, default: int) -> int:
@@ -55,27 +77,150 @@ def _coerce_timestamp(value: object) -> float:
     return 0.0
 
 
+def _configured_cache_ttl() -> int:
+    from shelfmark.core.config import config
+
+    ttl_value = config.get("IRC_CACHE_TTL", DEFAULT_CACHE_TTL)
+    return _coerce_cache_ttl(ttl_value, DEFAULT_CACHE_TTL)
+
+
+def _entry_ttl(entry: dict[str, Any], ttl_seconds: int) -> int:
+    """Return the TTL for one cached answer (0 never expires).
+
+    Answers with releases use the configured TTL; empty answers never outlive
+    EMPTY_RESULTS_CACHE_TTL, even when the configured TTL is 0.
+    """
+    if entry.get("releases"):
+        return ttl_seconds
+    if ttl_seconds == 0:
+        return EMPTY_RESULTS_CACHE_TTL
+    return min(ttl_seconds, EMPTY_RESULTS_CACHE_TTL)
+
+
+def _unexpired_entries(
+    entries: dict[str, Any], ttl_seconds: int, current_time: float
+) -> dict[str, Any]:
+    """Return the entries still within their TTL (a TTL of 0 never expires)."""
+    # Compare against one cutoff per kind of answer rather than computing each entry's
+    # age. Expiry stays derived from the current TTL, so changing the setting applies
+    # to existing entries.
+    cutoff = current_time - ttl_seconds if ttl_seconds != 0 else None
+    empty_cutoff = current_time - _entry_ttl({}, ttl_seconds)
+    return {
+        key: entry
+        for key, entry in entries.items()
+        if (entry_cutoff := cutoff if entry.get("releases") else empty_cutoff) is None
+        or _coerce_timestamp(entry.get("cached_at", 0)) >= entry_cutoff
+    }
+
+
+def _empty_cache() -> dict[str, Any]:
+    return {"entries": {}, "version": 1}
+
+
 def _load_cache() -> dict[str, Any]:
-    """Load cache from disk."""
+    """Load cache from disk, reusing the parsed copy while the file is unchanged."""
+    global _cache_data, _cache_mtime_ns
+
+    # Unsaved changes make the in-memory copy authoritative.
+    if _cache_dirty and _cache_data is not None:
+        return _cache_data
+
     try:
-        if CACHE_FILE.exists():
-            return json.loads(CACHE_FILE.read_text())
+        mtime_ns = CACHE_FILE.stat().st_mtime_ns
+    except FileNotFoundError:
+        _cache_data = None
+        _cache_mtime_ns = None
+        return _empty_cache()
+    except OSError as e:
+        logger.warning("Failed to load IRC cache: %s", e)
+        return _empty_cache()
+
+    if _cache_data is not None and mtime_ns == _cache_mtime_ns:
+        return _cache_data
+
+    try:
+        cache = json.loads(CACHE_FILE.read_bytes())
     except (OSError, json.JSONDecodeError) as e:
         logger.warning("Failed to load IRC cache: %s", e)
-    return {"entries": {}, "version": 1}
+        return _empty_cache()
+
+    _cache_data = cache
+    _cache_mtime_ns = mtime_ns
+    return cache
 
 
 def _save_cache(cache: dict[str, Any]) -> None:
-    """Save cache to disk."""
+    """Schedule the cache to be written to disk (caller holds _cache_lock)."""
+    global _cache_data, _cache_dirty
+
+    _cache_data = cache
+    _cache_dirty = True
+    _schedule_flush(SAVE_DELAY_SECONDS)
+
+
+def _schedule_flush(delay: float) -> None:
+    """Arm the flush timer unless one is already pending (caller holds _cache_lock)."""
+    global _flush_timer
+
+    if _flush_timer is None:
+        _flush_timer = Timer(delay, _flush_cache)
+        _flush_timer.daemon = True
+        _flush_timer.start()
+
+
+def _flush_cache() -> None:
+    """Write pending cache changes to disk now."""
+    global _flush_timer, _cache_dirty, _cache_mtime_ns
+
+    # _write_lock keeps file writes in order; _cache_lock is held only to snapshot the
+    # entries, so lookups are not blocked behind disk I/O.
+    with _write_lock:
+        with _cache_lock:
+            if _flush_timer is not None:
+                _flush_timer.cancel()
+                _flush_timer = None
+            if not _cache_dirty or _cache_data is None:
+                return
+            # Machine-read file: compact output keeps json on its C encoder (indent
+            # forces the pure-Python one) and shrinks what each reload has to read.
+            payload = json.dumps(_cache_data, separators=(",", ":"))
+            _cache_dirty = False
+
+        mtime_ns = _write_cache_file(payload)
+
+        with _cache_lock:
+            if mtime_ns is None:
+                # Keep the changes in memory and retry the write later.
+                _cache_dirty = True
+                _schedule_flush(SAVE_RETRY_DELAY_SECONDS)
+            else:
+                _cache_mtime_ns = mtime_ns
+
+
+atexit.register(_flush_cache)
+
+
+def _write_cache_file(payload: str) -> int | None:
+    """Write serialized cache to disk, returning the new file mtime (None on failure)."""
+    # Write to temp file first, then rename so a crash mid-write can't truncate the cache
+    temp_path = CACHE_FILE.with_name(f"{CACHE_FILE.name}.tmp")
     try:
-        CACHE_FILE.write_text(json.dumps(cache, indent=2))
+        temp_path.write_text(payload)
+        temp_path.replace(CACHE_FILE)
+        return CACHE_FILE.stat().st_mtime_ns
     except OSError:
+        temp_path.unlink(missing_ok=True)
         logger.exception("Failed to save IRC cache")
+        return None
 
 
 def _release_to_dict(release: Release) -> dict[str, Any]:
     """Convert Release to a JSON-serializable dict."""
-    data = asdict(release)
+    # Release is flat apart from `extra`, so only that needs copying (asdict would
+    # deep-copy every field).
+    data = {name: getattr(release, name) for name in _RELEASE_FIELDS}
+    data["extra"] = copy.deepcopy(release.extra)
     # Convert enum to string
     if data.get("protocol"):
         data["protocol"] = (
@@ -86,6 +231,8 @@ def _release_to_dict(release: Release) -> dict[str, Any]:
 
 def _dict_to_release(data: dict[str, Any]) -> Release:
     """Convert dict back to Release object."""
+    # Cached entries stay in memory between loads, so never hand them out directly.
+    data = copy.deepcopy(data)
     # Convert protocol string back to enum
     if data.get("protocol"):
         try:
@@ -114,11 +261,8 @@ def get_cached_results(
         or None if not cached or expired
 
     """
-    from shelfmark.core.config import config
-
     if ttl_seconds is None:
-        ttl_value = config.get("IRC_CACHE_TTL", DEFAULT_CACHE_TTL)
-        ttl_seconds = _coerce_cache_ttl(ttl_value, DEFAULT_CACHE_TTL)
+        ttl_seconds = _configured_cache_ttl()
 
     with _cache_lock:
         cache = _load_cache()
@@ -130,13 +274,14 @@ def get_cached_results(
         # Check expiration
         cached_at = _coerce_timestamp(entry.get("cached_at", 0))
         age = time.time() - cached_at
+        entry_ttl = _entry_ttl(entry, ttl_seconds)
 
-        if ttl_seconds != 0 and age > ttl_seconds:
+        if entry_ttl != 0 and age > entry_ttl:
             logger.debug(
                 "IRC cache expired for '%s' (age: %.0fs > TTL: %ss)",
                 entry.get("title", cache_key),
                 age,
-                ttl_seconds,
+                entry_ttl,
             )
             # Don't delete here - let cleanup handle it
             return None
@@ -173,21 +318,30 @@ def cache_results(
         online_servers: List of online server nicks (optional)
 
     """
+    ttl_seconds = _configured_cache_ttl()
+    current_time = time.time()
+
     with _cache_lock:
         cache = _load_cache()
 
-        if "entries" not in cache:
-            cache["entries"] = {}
+        # Nothing else sweeps the cache on its own, and this write rewrites the whole
+        # file anyway, so drop expired answers here instead of letting them pile up.
+        previous = cache.get("entries", {})
+        entries = _unexpired_entries(previous, ttl_seconds, current_time)
+        expired_count = len(previous) - len(entries)
+        cache["entries"] = entries
 
-        cache["entries"][cache_key] = {
+        entries[cache_key] = {
             "title": title,
             "releases": [_release_to_dict(r) for r in releases],
             "online_servers": list(online_servers) if online_servers else [],
-            "cached_at": time.time(),
+            "cached_at": current_time,
         }
 
         _save_cache(cache)
         logger.info("Cached %s IRC releases for '%s'", len(releases), title)
+        if expired_count:
+            logger.debug("Dropped %s expired IRC cache entries", expired_count)
 
 
 def invalidate_cache(cache_key: str) -> bool:
@@ -237,31 +391,20 @@ def cleanup_expired(ttl_seconds: int | None = None) -> int:
         Number of entries removed
 
     """
-    from shelfmark.core.config import config
-
     if ttl_seconds is None:
-        ttl_value = config.get("IRC_CACHE_TTL", DEFAULT_CACHE_TTL)
-        ttl_seconds = _coerce_cache_ttl(ttl_value, DEFAULT_CACHE_TTL)
+        ttl_seconds = _configured_cache_ttl()
 
     current_time = time.time()
-    removed = 0
 
     with _cache_lock:
         cache = _load_cache()
         entries = cache.get("entries", {})
 
-        expired_keys = [
-            key
-            for key, entry in entries.items()
-            if ttl_seconds != 0
-            and current_time - _coerce_timestamp(entry.get("cached_at", 0)) > ttl_seconds
-        ]
-
-        for key in expired_keys:
-            del entries[key]
-            removed += 1
+        kept = _unexpired_entries(entries, ttl_seconds, current_time)
+        removed = len(entries) - len(kept)
 
         if removed:
+            cache["entries"] = kept
             _save_cache(cache)
             logger.info("Cleaned up %s expired IRC cache entries", removed)
 
@@ -275,10 +418,7 @@ def get_cache_stats() -> dict[str, Any]:
         Dict with cache stats
 
     """
-    from shelfmark.core.config import config
-
-    ttl_value = config.get("IRC_CACHE_TTL", DEFAULT_CACHE_TTL)
-    ttl_seconds = _coerce_cache_ttl(ttl_value, DEFAULT_CACHE_TTL)
+    ttl_seconds = _configured_cache_ttl()
     current_time = time.time()
 
     with _cache_lock:
@@ -286,12 +426,7 @@ def get_cache_stats() -> dict[str, Any]:
         entries = cache.get("entries", {})
 
         total = len(entries)
-        expired = sum(
-            1
-            for entry in entries.values()
-            if ttl_seconds != 0
-            and current_time - _coerce_timestamp(entry.get("cached_at", 0)) > ttl_seconds
-        )
+        expired = total - len(_unexpired_entries(entries, ttl_seconds, current_time))
 
         # Calculate total releases cached
         total_releases = sum(len(entry.get("releases", [])) for entry in entries.values())
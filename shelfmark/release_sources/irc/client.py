@@ -31,6 +31,8 @@ POLL_INTERVAL = 2.0
 # IRC channel user prefixes that indicate elevated status (ops, voice, etc.)
 # These are the download bots/servers
 ELEVATED_PREFIXES = frozenset({"~", "&", "@", "%", "+"})
+# The same prefixes as a tuple, so one str.startswith call can test them all
+_ELEVATED_PREFIX_CHARS = tuple(ELEVATED_PREFIXES)
 
 
 class IRCEvent(Enum):
@@ -48,7 +50,16 @@ class IRCEvent(Enum):
     VERSION = auto()  # CTCP VERSION request
 
 
-@dataclass
+# Notice phrases in precedence order; the first one present wins
+_NOTICE_EVENTS = (
+    ("Sorry", IRCEvent.NO_RESULTS),
+    ("try another server", IRCEvent.BAD_SERVER),
+    ("has been accepted", IRCEvent.SEARCH_ACCEPTED),
+    ("matches", IRCEvent.MATCHES_FOUND),
+)
+
+
+@dataclass(slots=True)
 class IRCMessage:
     """Parsed IRC message."""
 
@@ -97,7 +108,7 @@ class IRCClient:
         self.version = version
 
         self._socket: socket.socket | None = None
-        self._buffer = ""
+        self._buffer = bytearray()
         self._connected = False
 
         # Track online servers (elevated users in channel)
@@ -129,6 +140,8 @@ class IRCClient:
                 sock = context.wrap_socket(sock, server_hostname=self.server)
 
             sock.connect((self.server, self.port))
+            # IRC traffic is many small request/response lines; don't let Nagle hold them
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
             self._socket = sock
 
         except OSError as e:
@@ -136,30 +149,27 @@ class IRCClient:
             raise IRCConnectionError(msg) from e
 
         # Send authentication (USER before NICK per IRC protocol)
-        self._send(f"USER {self.nick} 0 * :{self.nick}")
-        self._send(f"NICK {self.nick}")
+        self._send_many(f"USER {self.nick} 0 * :{self.nick}", f"NICK {self.nick}")
 
         # Wait for 001 (RPL_WELCOME) which confirms registration is complete
         # Server may take time for hostname lookup, ident check, etc.
         logger.debug("Waiting for server welcome (001)...")
-        sock.settimeout(2.0)  # Short timeout for polling
+        deadline = time.monotonic() + 30.0  # Max wait for registration
 
-        start = time.time()
-        timeout = 30.0  # Max wait for registration
-
-        while time.time() - start < timeout:
+        while (remaining := deadline - time.monotonic()) > 0:
             try:
+                # Wait exactly as long as is left instead of waking up on a fixed tick
+                sock.settimeout(remaining)
                 data = sock.recv(RECV_BUFFER)
                 if not data:
                     msg = "Connection closed during registration"
                     raise IRCConnectionError(msg)
-                self._buffer += data.decode("utf-8", errors="replace")
+                self._buffer += data
             except TimeoutError:
                 continue
 
             # Process lines looking for 001 or errors
-            while "\r\n" in self._buffer:
-                line, self._buffer = self._buffer.split("\r\n", 1)
+            while (line := self._pop_buffered_line()) is not None:
                 if not line:
                     continue
 
@@ -170,18 +180,22 @@ class IRCClient:
                     logger.debug("PONG %s", pong.split(":")[-1] if ":" in pong else "")
                     continue
 
+                # The numeric reply code follows the optional ":prefix"
+                parts = line.split(None, 2)
+                command = parts[1] if line.startswith(":") and len(parts) > 1 else parts[0]
+
                 # 001 = RPL_WELCOME - registration complete
-                if " 001 " in line:
+                if command == "001":
                     sock.settimeout(SOCKET_TIMEOUT)  # Restore timeout
                     self._connected = True
                     logger.info("Connected as %s", self.nick)
                     return
 
                 # Check for fatal errors
-                if " 433 " in line:  # Nickname in use
+                if command == "433":  # Nickname in use
                     msg = "Nickname already in use"
                     raise IRCConnectionError(msg)
-                if " 432 " in line:  # Erroneous nickname
+                if command == "432":  # Erroneous nickname
                     msg = "Invalid nickname"
                     raise IRCConnectionError(msg)
 
@@ -211,27 +225,24 @@ class IRCClient:
 
         if wait_for_join:
             sock = self._require_socket()
-            # Use a short socket timeout during join so we can check elapsed time
+            # Bound each recv by the time left for the join, then put the timeout back
             original_timeout = sock.gettimeout()
-            sock.settimeout(2.0)  # 2 second recv timeout
 
             try:
-                start = time.time()
-                timeout = 15.0  # Total wait time for join
+                deadline = time.monotonic() + 15.0  # Total wait time for join
 
-                while time.time() - start < timeout:
-                    # Read data with short timeout
+                while (remaining := deadline - time.monotonic()) > 0:
                     try:
+                        sock.settimeout(remaining)
                         data = sock.recv(RECV_BUFFER)
                         if not data:
                             break
-                        self._buffer += data.decode("utf-8", errors="replace")
+                        self._buffer += data
                     except TimeoutError:
-                        continue  # No data yet, check time and retry
+                        continue  # Deadline reached; the loop condition ends the wait
 
                     # Process any complete lines in buffer
-                    while "\r\n" in self._buffer:
-                        line, self._buffer = self._buffer.split("\r\n", 1)
+                    while (line := self._pop_buffered_line()) is not None:
                         if not line:
                             continue
 
@@ -291,31 +302,47 @@ class IRCClient:
     def _parse_names_list(self, names_data: str) -> None:
         """Parse 353 NAMES reply and extract elevated users (download servers)."""
         # Extract the trailing part after the last colon (the actual names)
-        names_part = names_data.rsplit(" :", maxsplit=1)[-1] if " :" in names_data else names_data
+        _, separator, names_part = names_data.rpartition(" :")
+        if not separator:
+            names_part = names_data
 
         for name in names_part.split():
             # Check if user has an elevated prefix
-            if name[0] in ELEVATED_PREFIXES:
+            if name.startswith(_ELEVATED_PREFIX_CHARS):
                 # Strip the prefix to get the actual nick
                 self.online_servers.add(name[1:])
             # Note: we only care about elevated users for server status
 
     def _send(self, message: str) -> None:
         """Send raw IRC message."""
+        self._send_many(message)
+
+    def _send_many(self, *messages: str) -> None:
+        """Send raw IRC messages back to back in a single write."""
         if not self._socket:
             msg = "Not connected"
             raise IRCError(msg)
 
-        data = f"{message}\r\n".encode()
+        data = "".join(f"{message}\r\n" for message in messages).encode()
         self._socket.sendall(data)
 
+    def _pop_buffered_line(self) -> str | None:
+        """Remove and decode the next complete line, or None if none is buffered."""
+        end = self._buffer.find(b"\r\n")
+        if end < 0:
+            return None
+        line = self._buffer[:end].decode("utf-8", errors="replace")
+        del self._buffer[: end + 2]
+        return line
+
     def _recv_lines(self, deadline: float | None = None) -> Iterator[str]:
         """Receive and yield complete CRLF-delimited IRC lines.
 
-        A deadline stops the read once it passes, even if nothing ever arrives.
-        Callers time out by watching the messages they receive, so on a channel
-        with no traffic at all there is nothing to watch: the recv would just
-        keep blocking for SOCKET_TIMEOUT and retrying forever.
+        A deadline (a ``time.monotonic()`` value) stops the read once it passes,
+        even if nothing ever arrives. Callers time out by watching the messages
+        they receive, so on a channel with no traffic at all there is nothing to
+        watch: the recv would just keep blocking for SOCKET_TIMEOUT and retrying
+        forever.
         """
         sock = self._require_socket()
         original_timeout = sock.gettimeout()
@@ -323,13 +350,12 @@ class IRCClient:
         try:
             while True:
                 # Check if we have a complete line in buffer
-                while "\r\n" in self._buffer:
-                    line, self._buffer = self._buffer.split("\r\n", 1)
+                while (line := self._pop_buffered_line()) is not None:
                     if line:
                         yield line
 
                 if deadline is not None:
-                    remaining = deadline - time.time()
+                    remaining = deadline - time.monotonic()
                     if remaining <= 0:
                         return
                     # Wake up often enough to notice the deadline pass
@@ -340,7 +366,7 @@ class IRCClient:
                     data = sock.recv(RECV_BUFFER)
                     if not data:
                         return  # Connection closed
-                    self._buffer += data.decode("utf-8", errors="replace")
+                    self._buffer += data
                 except TimeoutError:
                     continue  # Keep waiting (the deadline is re-checked above)
                 except OSError as e:
@@ -356,26 +382,26 @@ class IRCClient:
 
         Format: [:prefix] COMMAND [params] [:trailing]
         """
-        msg = IRCMessage(raw=line)
+        raw = line
+        prefix = None
+        trailing = None
 
         # Extract prefix if present
         if line.startswith(":"):
-            space_idx = line.find(" ")
-            if space_idx != -1:
-                msg.prefix = line[1:space_idx]
-                line = line[space_idx + 1 :]
+            head, space, rest = line[1:].partition(" ")
+            if space:
+                prefix = head
+                line = rest
 
         # Extract trailing if present
-        if " :" in line:
-            idx = line.find(" :")
-            msg.trailing = line[idx + 2 :]
-            line = line[:idx]
+        line, separator, after = line.partition(" :")
+        if separator:
+            trailing = after
 
         # Split remaining into command and params
         parts = line.split()
-        if parts:
-            msg.command = parts[0]
-            msg.params = parts[1:]
+        command = parts[0] if parts else ""
+        msg = IRCMessage(raw, prefix, command, parts[1:], trailing)
 
         # Classify event type based on message content
         msg.event = self._classify_event(msg)
@@ -383,26 +409,20 @@ class IRCClient:
         return msg
 
     def _classify_event(self, msg: IRCMessage) -> IRCEvent:
-        """Classify message into event type using string containment checks."""
-        raw = msg.raw
+        """Classify message into event type from its parsed command and trailing text."""
         trailing = msg.trailing or ""
 
-        # DCC SEND detection
-        if "DCC SEND" in raw:
-            if "_results_for" in raw:
+        # DCC SEND detection (CTCP requests are the \x01-delimited trailing text)
+        if trailing.startswith("\x01DCC SEND"):
+            if "_results_for" in trailing:
                 return IRCEvent.SEARCH_RESULT
             return IRCEvent.BOOK_RESULT
 
         # NOTICE messages
-        if msg.command == "NOTICE" or "NOTICE" in raw:
-            if "Sorry" in trailing:
-                return IRCEvent.NO_RESULTS
-            if "try another server" in trailing:
-                return IRCEvent.BAD_SERVER
-            if "has been accepted" in trailing:
-                return IRCEvent.SEARCH_ACCEPTED
-            if "matches" in trailing:
-                return IRCEvent.MATCHES_FOUND
+        if msg.command == "NOTICE" and trailing:
+            for marker, event in _NOTICE_EVENTS:
+                if marker in trailing:
+                    return event
 
         # User list (RPL_NAMREPLY and RPL_ENDOFNAMES)
         if msg.command in ("353", "366"):
@@ -413,7 +433,7 @@ class IRCClient:
             return IRCEvent.PING
 
         # CTCP VERSION
-        if "\x01VERSION\x01" in raw:
+        if trailing.startswith("\x01VERSION\x01"):
             return IRCEvent.VERSION
 
         return IRCEvent.MESSAGE
@@ -491,7 +511,7 @@ class IRCClient:
     ) -> DCCOffer | None:
         """Wait for a DCC SEND offer. Returns None on timeout or no results."""
         target_event = IRCEvent.SEARCH_RESULT if result_type else IRCEvent.BOOK_RESULT
-        deadline = time.time() + timeout
+        deadline = time.monotonic() + timeout
 
         for msg in self.read_messages(deadline=deadline):
             if msg.event == target_event:
@@ -525,7 +545,7 @@ class IRCClient:
                     count = match.group(1)
                     logger.info("Found %s matches", count)
 
-        if time.time() >= deadline:
+        if time.monotonic() >= deadline:
             logger.warning("Timeout waiting for DCC offer")
         return None
 
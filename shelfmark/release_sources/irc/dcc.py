@@ -3,9 +3,9 @@
 Handles DCC SEND file transfers used by IRC bots to send files.
 """
 
-import re
 import socket
 import struct
+from contextlib import closing
 from dataclasses import dataclass
 from ipaddress import ip_address
 from pathlib import PureWindowsPath
@@ -20,17 +20,20 @@ if TYPE_CHECKING:
 
 logger = setup_logger(__name__)
 
-# Regex to parse DCC SEND messages - handles quoted filenames
+# DCC SEND offers are parsed from the right, since only the filename can contain spaces
 # Format: DCC SEND "filename.epub" 2760158537 2050 2321788
 #                  |                |          |    |
 #                  filename         IP(int)    port size
-DCC_REGEX = re.compile(r'DCC SEND "?(.+[^"])"?\s(\d+)\s+(\d+)\s+(\d+)\s*')
+DCC_SEND_MARKER = "DCC SEND "
 
-# Buffer size for DCC transfers - 4096 bytes provides good performance
-BUFFER_SIZE = 4096
+# Buffer size for DCC transfers - large enough that multi-MB files take few recv calls
+BUFFER_SIZE = 65536
 
+# Received chunks are batched into writes of this size
+WRITE_BUFFER_SIZE = 1024 * 1024
 
-@dataclass
+
+@dataclass(slots=True)
 class DCCOffer:
     """Parsed DCC SEND offer."""
 
@@ -67,21 +70,27 @@ class DCCSecurityError(DCCError):
 
 def int_to_ip(ip_int: int) -> str:
     """Convert 32-bit integer (DCC format) to dotted IP notation."""
-    packed = struct.pack(">I", ip_int)
-    return ".".join(str(b) for b in packed)
+    return socket.inet_ntoa(struct.pack(">I", ip_int))
 
 
 def parse_dcc_send(text: str) -> DCCOffer:
     """Parse a DCC SEND message into a DCCOffer. Raises DCCParseError on failure."""
-    match = DCC_REGEX.search(text)
-    if not match:
+    _, marker, offer_text = text.partition(DCC_SEND_MARKER)
+    # CTCP messages are wrapped in \x01 delimiters
+    fields = offer_text.strip().strip("\x01").rsplit(None, 3)
+    if (
+        not marker
+        or len(fields) != 4
+        or not all(field.isdecimal() for field in fields[1:])
+        or not fields[0].strip('"')
+    ):
         msg = f"Invalid DCC SEND format: {text[:100]}"
         raise DCCParseError(msg)
 
-    filename = match.group(1).strip('"')
-    ip_int = int(match.group(2))
-    port = int(match.group(3))
-    size = int(match.group(4))
+    filename = fields[0].strip('"')
+    ip_int = int(fields[1])
+    port = int(fields[2])
+    size = int(fields[3])
     try:
         ip = int_to_ip(ip_int)
     except struct.error as e:
@@ -149,11 +158,11 @@ def download_dcc(
         raise DCCConnectionError(msg) from e
 
     try:
-        received = 0
-        last_progress = -1
+        # Byte count at which the next whole percent is reached
+        next_progress_at = 0
 
-        with dest_path.open("wb") as f:
-            while received < offer.size:
+        with closing(_BufferedFileSink(dest_path)) as sink:
+            while sink.received < offer.size:
                 # Check for cancellation
                 if cancel_flag and cancel_flag.is_set():
                     logger.info("DCC download cancelled")
@@ -161,24 +170,22 @@ def download_dcc(
 
                 # Read chunk
                 try:
-                    chunk = sock.recv(BUFFER_SIZE)
+                    chunk_size = sink.receive(sock)
                 except TimeoutError as e:
                     msg = f"Timeout reading from {offer.ip}:{offer.port}"
                     raise DCCError(msg) from e
 
-                if not chunk:
+                if not chunk_size:
                     # Connection closed prematurely
                     break
 
-                f.write(chunk)
-                received += len(chunk)
-
                 # Report progress (every 1%)
-                if progress_callback:
-                    progress = int((received / offer.size) * 100)
-                    if progress != last_progress:
-                        progress_callback(progress)
-                        last_progress = progress
+                if progress_callback and sink.received >= next_progress_at:
+                    progress = sink.received * 100 // offer.size
+                    progress_callback(progress)
+                    next_progress_at = -(-(progress + 1) * offer.size // 100)
+
+            received = sink.received
 
         # Verify downloaded size matches expected
         if received != offer.size:
@@ -189,3 +196,21 @@ def download_dcc(
 
     finally:
         sock.close()
+
+
+class _BufferedFileSink:
+    """Receives DCC data into one reused buffer and writes it to the file."""
+
+    def __init__(self, dest_path: Path) -> None:
+        self.received = 0
+        self._buffer = memoryview(bytearray(BUFFER_SIZE))
+        self._file = dest_path.open("wb", buffering=WRITE_BUFFER_SIZE)
+
+    def receive(self, sock: socket.socket) -> int:
+        size = sock.recv_into(self._buffer)
+        self._file.write(self._buffer[:size])
+        self.received += size
+        return size
+
+    def close(self) -> None:
+        self._file.close()
@@ -14,6 +14,7 @@ from shelfmark.core.logger import setup_logger
 from shelfmark.core.utils import is_audiobook as check_audiobook
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
     from pathlib import Path
 
 logger = setup_logger(__name__)
@@ -70,16 +71,28 @@ def _normalize_config_formats(raw_formats: object) -> set[str]:
     return set()
 
 
-def _get_supported_formats(content_type: str | None = None) -> set[str]:
+# Config key -> (raw value, normalized formats) from the last lookup
+_supported_formats_cache: dict[str, tuple[object, frozenset[str]]] = {}
+
+
+def _get_supported_formats(content_type: str | None = None) -> frozenset[str]:
     """Get the supported formats for the requested content type."""
     if check_audiobook(content_type):
-        formats = config.get("SUPPORTED_AUDIOBOOK_FORMATS", ["m4b", "mp3"])
+        key = "SUPPORTED_AUDIOBOOK_FORMATS"
+        formats = config.get(key, ["m4b", "mp3"])
     else:
-        formats = config.get(
-            "SUPPORTED_FORMATS", ["epub", "mobi", "azw3", "fb2", "djvu", "cbz", "cbr"]
-        )
+        key = "SUPPORTED_FORMATS"
+        formats = config.get(key, ["epub", "mobi", "azw3", "fb2", "djvu", "cbz", "cbr"])
+
+    # Config refreshes replace values rather than mutating them, so an identical
+    # object means the normalized set from last time is still current.
+    cached = _supported_formats_cache.get(key)
+    if cached is not None and cached[0] is formats:
+        return cached[1]
 
-    return _normalize_config_formats(formats)
+    normalized = frozenset(_normalize_config_formats(formats))
+    _supported_formats_cache[key] = (formats, normalized)
+    return normalized
 
 
 # Regex to parse result lines
@@ -98,8 +111,18 @@ SIMPLE_RESULT_REGEX = re.compile(
     r"^!(\S+)\s+(.+)$"  # !Server everything_else
 )
 
+# Any recognized ".format" extension, longest first so "azw3" wins over "azw"
+KNOWN_FORMAT_REGEX = re.compile(
+    r"\.("
+    + "|".join(
+        re.escape(fmt) for fmt in sorted(ALL_RECOGNIZED_FORMATS, key=lambda fmt: (-len(fmt), fmt))
+    )
+    + r")\b",
+    re.IGNORECASE,
+)
+
 
-@dataclass
+@dataclass(slots=True)
 class SearchResult:
     """Parsed search result entry."""
 
@@ -148,11 +171,8 @@ def parse_result_line(line: str) -> SearchResult | None:
         server, rest = match.groups()
 
         # Try to extract format from the line
-        fmt = None
-        for known_fmt in ALL_RECOGNIZED_FORMATS:
-            if f".{known_fmt}" in rest.lower():
-                fmt = known_fmt
-                break
+        format_match = KNOWN_FORMAT_REGEX.search(rest)
+        fmt = format_match.group(1).lower() if format_match else None
 
         # Try to split author - title
         if " - " in rest:
@@ -170,9 +190,7 @@ def parse_result_line(line: str) -> SearchResult | None:
             size = info.split("::")[0].strip()
 
         # Clean up title (remove extension)
-        title = title_part
-        for known_fmt in ALL_RECOGNIZED_FORMATS:
-            title = re.sub(rf"\.{known_fmt}\b", "", title, flags=re.IGNORECASE)
+        title = KNOWN_FORMAT_REGEX.sub("", title_part)
 
         return SearchResult(
             server=server,
@@ -187,23 +205,39 @@ def parse_result_line(line: str) -> SearchResult | None:
     return None
 
 
-def parse_results_file(content: str, content_type: str | None = None) -> list[SearchResult]:
-    """Parse a search results file into SearchResult objects."""
-    results = []
+def parse_result_lines(lines: Iterable[str]) -> list[SearchResult]:
+    """Parse every recognizable result line, consuming the lines lazily."""
+    return [result for line in lines if (result := parse_result_line(line)) is not None]
+
+
+def select_supported_results(
+    results: Iterable[SearchResult], content_type: str | None = None
+) -> list[SearchResult]:
+    """Keep the results whose format is enabled for the requested content type."""
     supported = _get_supported_formats(content_type)
+    # Filter to user's configured formats
+    selected = [
+        result for result in results if result.format in supported or result.format == "unknown"
+    ]
+
+    logger.info("Parsed %s results from search file", len(selected))
+    return selected
+
 
-    for line in content.splitlines():
-        result = parse_result_line(line)
-        if result and (result.format in supported or result.format == "unknown"):
-            # Filter to user's configured formats
-            results.append(result)
+def parse_results_file(
+    content: str | Iterable[str], content_type: str | None = None
+) -> list[SearchResult]:
+    """Parse a search results file (text or an iterable of lines) into SearchResults."""
+    lines = content.splitlines() if isinstance(content, str) else content
+    return select_supported_results(parse_result_lines(lines), content_type)
 
-    logger.info("Parsed %s results from search file", len(results))
-    return results
 
+def extract_results_from_zip(zip_path: Path) -> Iterator[str]:
+    """Stream the decoded text lines of a search results ZIP.
 
-def extract_results_from_zip(zip_path: Path) -> str:
-    """Extract and return text content from a search results ZIP."""
+    The member is read incrementally rather than decompressed into memory, so
+    the ZIP must stay in place until the returned iterator is exhausted.
+    """
     with zipfile.ZipFile(zip_path, "r") as zf:
         # Should contain exactly one text file
         names = zf.namelist()
@@ -222,21 +256,28 @@ def extract_results_from_zip(zip_path: Path) -> str:
             # Use first file
             txt_file = names[0]
 
-        content = zf.read(txt_file)
+        with zf.open(txt_file) as member:
+            for raw_line in member:
+                yield _decode_line(raw_line)
 
-        # Try different encodings
-        for encoding in ["utf-8", "latin-1", "cp1252"]:
-            decoded = _decode_content_with_encoding(content, encoding)
-            if decoded is not None:
-                return decoded
 
-        # Last resort
-        return content.decode("utf-8", errors="replace")
+def extract_results_from_text(text_path: Path) -> Iterator[str]:
+    """Stream the decoded lines of a plain-text search results file.
 
+    Lines are read as bytes and decoded one at a time, the same way as ZIP
+    members, so the whole file is never held in memory as text.
+    """
+    with text_path.open("rb") as results_file:
+        for raw_line in results_file:
+            yield _decode_line(raw_line)
 
-def _decode_content_with_encoding(content: bytes, encoding: str) -> str | None:
-    """Decode bytes using one encoding, returning None when it fails."""
+
+def _decode_line(raw_line: bytes) -> str:
+    """Decode one results line as UTF-8, falling back to Latin-1.
+
+    Latin-1 maps every byte, so the fallback never fails.
+    """
     try:
-        return content.decode(encoding)
+        return raw_line.decode("utf-8")
     except UnicodeDecodeError:
-        return None
+        return raw_line.decode("latin-1")
@@ -141,7 +141,7 @@ def irc_settings() -> list[SettingsField]:
         SelectField(
             key="IRC_CACHE_TTL",
             label="Cache Duration",
-            description="How long to keep cached search results before they expire.",
+            description="How long to keep cached search results before they expire. Searches that found nothing are retried after 10 minutes.",
             options=[
                 {"value": "2592000", "label": "30 days"},
                 {"value": "0", "label": "Forever (until manually cleared)"},
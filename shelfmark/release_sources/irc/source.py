@@ -3,10 +3,16 @@
 Searches IRC channels for ebook and audiobook releases.
 """
 
+import atexit
+import re
+import shutil
 import tempfile
+import threading
 import time
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import TYPE_CHECKING, ClassVar
+from typing import TYPE_CHECKING, ClassVar, NamedTuple
 
 if TYPE_CHECKING:
     from shelfmark.core.search_plan import ReleaseSearchPlan
@@ -32,10 +38,46 @@ from shelfmark.release_sources import (
 
 from .connection_manager import connection_manager
 from .dcc import DCCError, download_dcc, safe_dcc_filename
-from .parser import SearchResult, extract_results_from_zip, parse_results_file
+from .parser import (
+    SearchResult,
+    extract_results_from_text,
+    extract_results_from_zip,
+    parse_result_lines,
+    select_supported_results,
+)
 
 logger = setup_logger(__name__)
 
+# Human-readable result sizes such as "1.2MB", "500 K" or a plain byte count
+_SIZE_PATTERN = re.compile(r"^\s*([\d.]+)\s*([KMGT]?B?)\s*$", re.IGNORECASE)
+_SIZE_MULTIPLIERS = {
+    "": 1,
+    "B": 1,
+    "K": 1024,
+    "KB": 1024,
+    "M": 1024**2,
+    "MB": 1024**2,
+    "G": 1024**3,
+    "GB": 1024**3,
+    "T": 1024**4,
+    "TB": 1024**4,
+}
+
+
+# Result files repeat the same few size strings many times over
+@lru_cache(maxsize=1024)
+def _parse_size_bytes(size_str: str) -> int | None:
+    """Convert a human-readable size string to bytes, or None if malformed."""
+    match = _SIZE_PATTERN.match(size_str)
+    if not match:
+        return None
+
+    number, unit = match.groups()
+    try:
+        return int(float(number) * _SIZE_MULTIPLIERS[unit.upper()])
+    except ValueError:
+        return None
+
 
 def _config_text(key: str) -> str:
     """Read a string config value with whitespace trimmed."""
@@ -74,6 +116,32 @@ def _config_bool(key: str, default: bool) -> bool:
     return default
 
 
+class _IRCSettings(NamedTuple):
+    server: str
+    port: int
+    use_tls: bool
+    channel: str
+    nick: str
+    search_bot: str
+
+
+def _load_settings() -> _IRCSettings:
+    """Read the IRC connection settings once, for one availability check or search."""
+    return _IRCSettings(
+        server=_config_text("IRC_SERVER"),
+        port=_config_port("IRC_PORT", 6697),
+        use_tls=_config_bool("IRC_USE_TLS", True),
+        channel=_config_text("IRC_CHANNEL"),
+        nick=_config_text("IRC_NICK"),
+        search_bot=_config_text("IRC_SEARCH_BOT"),
+    )
+
+
+def _is_configured(settings: _IRCSettings) -> bool:
+    """Server, channel, nick, and search bot are all required to search."""
+    return bool(settings.server and settings.channel and settings.nick and settings.search_bot)
+
+
 def _emit_status(message: str, phase: str = "searching") -> None:
     """Emit search status to frontend via WebSocket."""
     ws_manager.broadcast_search_status(
@@ -87,7 +155,9 @@ def _emit_status(message: str, phase: str = "searching") -> None:
 
 # Rate limiting to avoid server throttling
 MIN_SEARCH_INTERVAL = 15.0
-_last_search_time: float = 0
+# Monotonic time of the latest reserved search slot, guarded by _rate_limit_lock
+_last_search_time: float = float("-inf")
+_rate_limit_lock = threading.Lock()
 
 # Anti-spam budget: the exact same message may only be posted to the channel a limited
 # number of times within a rolling window. This stops a retry/refresh loop from flooding
@@ -102,16 +172,43 @@ _recent_message_sends: dict[str, list[float]] = {}
 
 
 def _enforce_rate_limit() -> None:
-    """Ensure minimum time between searches."""
+    """Ensure minimum time between searches, including concurrent ones.
+
+    Each caller reserves the next free slot under the lock and then sleeps until
+    it outside the lock, so simultaneous searches are spaced out in turn rather
+    than all waking together after one shared wait.
+    """
     global _last_search_time
 
-    elapsed = time.time() - _last_search_time
-    if elapsed < MIN_SEARCH_INTERVAL:
-        wait_time = MIN_SEARCH_INTERVAL - elapsed
+    with _rate_limit_lock:
+        now = time.monotonic()
+        slot = max(now, _last_search_time + MIN_SEARCH_INTERVAL)
+        _last_search_time = slot
+
+    wait_time = slot - now
+    if wait_time > 0:
         logger.info("Rate limiting: waiting %.1fs", wait_time)
         time.sleep(wait_time)
 
-    _last_search_time = time.time()
+
+# Result files are downloaded into one directory for the life of the process and
+# removed individually after parsing, instead of a fresh temp dir per search
+_results_dir: Path | None = None
+_results_dir_lock = threading.Lock()
+
+
+def _get_results_dir() -> Path:
+    """Return the directory DCC result files are downloaded into, creating it if needed."""
+    global _results_dir
+
+    with _results_dir_lock:
+        if _results_dir is None:
+            _results_dir = Path(tempfile.mkdtemp(prefix="shelfmark-irc-"))
+            atexit.register(shutil.rmtree, _results_dir, ignore_errors=True)
+        else:
+            # Recreate it if a tmp cleaner removed it while the process was running
+            _results_dir.mkdir(exist_ok=True)
+        return _results_dir
 
 
 def _query_identity(server: str, channel: str, query: str) -> str:
@@ -164,11 +261,7 @@ class IRCReleaseSource(ReleaseSource):
         The search bot is required: without it we would post bare queries straight
         to the channel, which reads as spam and gets the nick banned.
         """
-        server = _config_text("IRC_SERVER")
-        channel = _config_text("IRC_CHANNEL")
-        nick = _config_text("IRC_NICK")
-        search_bot = _config_text("IRC_SEARCH_BOT")
-        return bool(server and channel and nick and search_bot)
+        return _is_configured(_load_settings())
 
     def get_column_config(self) -> ReleaseColumnConfig:
         """Configure UI columns for IRC results."""
@@ -222,7 +315,9 @@ class IRCReleaseSource(ReleaseSource):
         """
         from .cache import cache_results, get_cached_results
 
-        if not self.is_available():
+        # Read the settings once; the availability check and the search share them
+        settings = _load_settings()
+        if not _is_configured(settings):
             logger.debug("IRC source is disabled, skipping search")
             return []
 
@@ -232,13 +327,7 @@ class IRCReleaseSource(ReleaseSource):
             logger.warning("No search query could be built")
             return []
 
-        # Get IRC settings
-        server = _config_text("IRC_SERVER")
-        port = _config_port("IRC_PORT", 6697)
-        use_tls = _config_bool("IRC_USE_TLS", True)
-        channel = _config_text("IRC_CHANNEL")
-        nick = _config_text("IRC_NICK")
-        search_bot = _config_text("IRC_SEARCH_BOT")
+        server, port, use_tls, channel, nick, search_bot = settings
 
         # Audiobooks may be indexed in a separate channel from ebooks on some networks
         # (e.g. #ebooks for ebooks, #bookz for audiobooks). When an audiobook channel is
@@ -341,27 +430,37 @@ class IRCReleaseSource(ReleaseSource):
 
             # Download results file
             _emit_status(f"Connected to #{channel} - Downloading results...", phase="downloading")
-            with tempfile.TemporaryDirectory() as tmpdir:
-                result_path = Path(tmpdir) / safe_dcc_filename(offer.filename)
+            # Prefixed with the searching thread so concurrent searches never share a file
+            result_path = _get_results_dir() / (
+                f"{threading.get_ident()}-{safe_dcc_filename(offer.filename)}"
+            )
+            try:
                 download_dcc(offer, result_path, timeout=30.0)
 
-                # Parse results
+                # The IRC side is done once the file is in; hand the connection back
+                # (don't close it) so a waiting search can use it while this one parses.
+                # Cleared so a parse failure below cannot close it under its next user.
+                connection_manager.release_connection(client)
+                client = None
+
+                # Parse results line by line while the downloaded file still exists
                 if result_path.suffix.lower() == ".zip":
-                    content = extract_results_from_zip(result_path)
+                    parsed_results = parse_result_lines(extract_results_from_zip(result_path))
                 else:
-                    content = result_path.read_text(errors="replace")
-
-            # Release connection for reuse (don't close it)
-            connection_manager.release_connection(client)
+                    parsed_results = parse_result_lines(extract_results_from_text(result_path))
+            finally:
+                result_path.unlink(missing_ok=True)
 
             # A single "@search" returns one file containing every format. Parse the whole
             # answer (both ebooks and audiobooks) and cache it under the query identity, so
             # requesting the other content type is served from cache without re-posting.
             ebook_releases = self._convert_to_releases(
-                parse_results_file(content, content_type="ebook"), content_type="ebook"
+                select_supported_results(parsed_results, content_type="ebook"),
+                content_type="ebook",
             )
             audiobook_releases = self._convert_to_releases(
-                parse_results_file(content, content_type="audiobook"), content_type="audiobook"
+                select_supported_results(parsed_results, content_type="audiobook"),
+                content_type="audiobook",
             )
             cache_results(
                 query_key,
@@ -444,48 +543,53 @@ class IRCReleaseSource(ReleaseSource):
         content_type: str = "ebook",
     ) -> list[Release]:
         """Convert parsed results to Release objects, sorted by online/format/server."""
-        releases = []
-        online_servers = self._online_servers or set()
-        format_priority_map = (
+        # IRC nicks are case-insensitive, so a result from "bookbot" counts for "BookBot"
+        online_servers = frozenset(nick.lower() for nick in self._online_servers or ())
+        # Bound once, so ranking a result's format is a single call
+        format_rank = (
             self.AUDIOBOOK_FORMAT_PRIORITY
             if content_type == "audiobook"
             else self.EBOOK_FORMAT_PRIORITY
-        )
+        ).get
 
+        # Tiered sort: online first, then by format priority, then by server name.
+        # Keys come straight from the parsed results while the releases are built.
+        ranked: list[tuple[tuple[int, int, str], Release]] = []
+        # A handful of servers answer for every result, so share one indexer label each
+        indexers: dict[str, str] = {}
         for result in results:
+            server, fmt, size = result.server, result.format, result.size
+            indexer = indexers.get(server)
+            if indexer is None:
+                indexer = indexers[server] = f"IRC:{server}"
             release = Release(
                 source="irc",
                 source_id=result.download_request,  # Full line for download
                 title=result.title,
-                format=result.format,
-                size=result.size,
-                size_bytes=self._parse_size(result.size) if result.size else None,
+                format=fmt,
+                size=size,
+                size_bytes=_parse_size_bytes(size) if size else None,
                 protocol=ReleaseProtocol.DCC,
-                indexer=f"IRC:{result.server}",
+                indexer=indexer,
                 content_type=content_type,
                 extra={
-                    "server": result.server,
+                    "server": server,
                     "author": result.author,
                     "full_line": result.full_line,
                 },
             )
-            releases.append(release)
-
-        # Tiered sort: online first, then by format priority, then by server name
-        def sort_key(release: Release) -> tuple:
-            server = release.extra.get("server", "")
-            is_online = server in online_servers
-            fmt = release.format.lower() if release.format else ""
-            format_priority = format_priority_map.get(fmt, 99)
-            return (
-                0 if is_online else 1,  # Online first
-                format_priority,  # Then by format
-                server.lower(),  # Then alphabetically by server
+            server_lc = server.lower()
+            sort_key = (
+                0 if server_lc in online_servers else 1,  # Online first
+                format_rank(fmt.lower(), 99),  # Then by format
+                server_lc,  # Then alphabetically by server
             )
+            ranked.append((sort_key, release))
 
-        releases.sort(key=sort_key)
+        # Stable sort on the key alone, so equal keys keep result order
+        ranked.sort(key=itemgetter(0))
 
-        return releases
+        return [release for _, release in ranked]
 
     @staticmethod
     def _filter_by_content_type(releases: list[Release], requested: str) -> list[Release]:
@@ -501,30 +605,4 @@ class IRCReleaseSource(ReleaseSource):
         """Parse human-readable size (e.g., '1.2MB', '500K') to bytes."""
         if not size_str:
             return None
-
-        size_str = size_str.strip().upper()
-
-        # Map suffixes to multipliers (check longer suffixes first)
-        multipliers = [
-            ("GB", 1024 * 1024 * 1024),
-            ("MB", 1024 * 1024),
-            ("KB", 1024),
-            ("G", 1024 * 1024 * 1024),
-            ("M", 1024 * 1024),
-            ("K", 1024),
-            ("B", 1),
-        ]
-
-        for suffix, mult in multipliers:
-            if size_str.endswith(suffix):
-                try:
-                    num = float(size_str[: -len(suffix)].strip())
-                    return int(num * mult)
-                except ValueError:
-                    return None
-
-        # Try parsing as plain number (bytes)
-        try:
-            return int(float(size_str))
-        except ValueError:
-            return None
+        return _parse_size_bytes(size_str)
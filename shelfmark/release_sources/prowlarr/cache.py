@@ -2,21 +2,94 @@
 
 Stores search results so the handler can look up releases by source_id.
 This keeps all Prowlarr-specific data within the plugin.
+
+Releases live in a small SQLite database in CONFIG_DIR, so a download queued
+before a restart can still resolve its release afterwards without re-searching.
 """
 
+import json
+import sqlite3
+import threading
 import time
-from threading import Lock
+from pathlib import Path
+from typing import TYPE_CHECKING
 
+from shelfmark.config import env
 from shelfmark.core.logger import setup_logger
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
 logger = setup_logger(__name__)
 
 # Cache TTL in seconds (1 hour - releases should be downloaded within this time)
 RELEASE_CACHE_TTL = 3600
 
-# Internal cache storage: source_id -> (release_dict, timestamp)
-_cache: dict[str, tuple] = {}
-_cache_lock = Lock()
+# How often the background sweep evicts expired releases
+CLEANUP_INTERVAL = RELEASE_CACHE_TTL / 4
+
+# Cache database location
+CACHE_DB_PATH = Path(env.CONFIG_DIR) / "prowlarr_cache.db"
+
+# Shared connection, opened on first use; every query runs under _db_lock
+_db: sqlite3.Connection | None = None
+_db_lock = threading.Lock()
+
+# Started with the first cached release, so importing the module spawns nothing
+_cleanup_thread: threading.Thread | None = None
+_cleanup_thread_lock = threading.Lock()
+
+
+def _open_db(path: str) -> sqlite3.Connection:
+    conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS releases ("
+        "source_id TEXT PRIMARY KEY, release_json TEXT NOT NULL, cached_at REAL NOT NULL)"
+    )
+    # Lets cleanup range-delete expired rows instead of scanning the table
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_releases_cached_at ON releases(cached_at)")
+    return conn
+
+
+def _connection() -> sqlite3.Connection:
+    """Return the shared connection. Caller must hold _db_lock."""
+    global _db
+    if _db is None:
+        try:
+            _db = _open_db(str(CACHE_DB_PATH))
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(
+                "Prowlarr release cache unavailable at %s, keeping it in memory: %s",
+                CACHE_DB_PATH,
+                e,
+            )
+            _db = _open_db(":memory:")
+    return _db
+
+
+def _cleanup_loop() -> None:
+    """Periodically evict expired releases, so the cache stays bounded without callers."""
+    while True:
+        time.sleep(CLEANUP_INTERVAL)
+        try:
+            cleanup_expired()
+        except Exception:
+            logger.exception("Prowlarr release cache cleanup failed")
+
+
+def _ensure_cleanup_thread() -> None:
+    """Start the background cleanup thread once."""
+    global _cleanup_thread
+    if _cleanup_thread is not None:
+        return
+    with _cleanup_thread_lock:
+        if _cleanup_thread is None:
+            _cleanup_thread = threading.Thread(
+                target=_cleanup_loop, daemon=True, name="ProwlarrCacheCleanup"
+            )
+            _cleanup_thread.start()
 
 
 def cache_release(source_id: str, release_data: dict) -> None:
@@ -27,8 +100,35 @@ def cache_release(source_id: str, release_data: dict) -> None:
         release_data: The full Prowlarr API result dict
 
     """
-    with _cache_lock:
-        _cache[source_id] = (release_data, time.time())
+    cache_releases([(source_id, release_data)])
+
+
+def cache_releases(items: Iterable[tuple[str, dict]]) -> None:
+    """Cache many releases in a single transaction.
+
+    Args:
+        items: (source_id, Prowlarr API result dict) pairs, e.g. one search's results
+
+    """
+    cached_at = time.time()
+    rows = [(source_id, json.dumps(release_data), cached_at) for source_id, release_data in items]
+    if not rows:
+        return
+
+    with _db_lock:
+        conn = _connection()
+        conn.execute("BEGIN")
+        try:
+            conn.executemany(
+                "INSERT OR REPLACE INTO releases (source_id, release_json, cached_at) "
+                "VALUES (?, ?, ?)",
+                rows,
+            )
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+    _ensure_cleanup_thread()
 
 
 def get_release(source_id: str) -> dict | None:
@@ -41,21 +141,28 @@ def get_release(source_id: str) -> dict | None:
         The cached release dict, or None if not found or expired
 
     """
-    with _cache_lock:
-        if source_id not in _cache:
+    with _db_lock:
+        row = (
+            _connection()
+            .execute(
+                "SELECT release_json, cached_at FROM releases WHERE source_id = ?", (source_id,)
+            )
+            .fetchone()
+        )
+        if row is None:
             logger.debug("Prowlarr release not in cache: %s", source_id)
             return None
 
-        release_data, cached_at = _cache[source_id]
+        release_json, cached_at = row
         age = time.time() - cached_at
 
         if age > RELEASE_CACHE_TTL:
             # Expired - remove from cache
-            del _cache[source_id]
+            _connection().execute("DELETE FROM releases WHERE source_id = ?", (source_id,))
             logger.debug("Prowlarr release expired: %s", source_id)
             return None
 
-        return release_data
+    return json.loads(release_json)
 
 
 def remove_release(source_id: str) -> None:
@@ -65,10 +172,10 @@ def remove_release(source_id: str) -> None:
         source_id: The unique identifier for the release
 
     """
-    with _cache_lock:
-        if source_id in _cache:
-            del _cache[source_id]
-            logger.debug("Removed Prowlarr release from cache: %s", source_id)
+    with _db_lock:
+        cursor = _connection().execute("DELETE FROM releases WHERE source_id = ?", (source_id,))
+    if cursor.rowcount:
+        logger.debug("Removed Prowlarr release from cache: %s", source_id)
 
 
 def cleanup_expired() -> int:
@@ -78,18 +185,12 @@ def cleanup_expired() -> int:
         Number of entries removed
 
     """
-    current_time = time.time()
-    removed = 0
-
-    with _cache_lock:
-        expired_ids = [
-            source_id
-            for source_id, (_, cached_at) in _cache.items()
-            if current_time - cached_at > RELEASE_CACHE_TTL
-        ]
-        for source_id in expired_ids:
-            del _cache[source_id]
-            removed += 1
+    cutoff = time.time() - RELEASE_CACHE_TTL
+
+    with _db_lock:
+        removed = (
+            _connection().execute("DELETE FROM releases WHERE cached_at < ?", (cutoff,)).rowcount
+        )
 
     if removed:
         logger.debug("Cleaned up %s expired Prowlarr cache entries", removed)
@@ -104,8 +205,9 @@ def get_cache_stats() -> dict:
         Dict with cache stats
 
     """
-    with _cache_lock:
-        return {
-            "size": len(_cache),
-            "entries": list(_cache.keys()),
-        }
+    with _db_lock:
+        entries = [row[0] for row in _connection().execute("SELECT source_id FROM releases")]
+    return {
+        "size": len(entries),
+        "entries": entries,
+    }
@@ -17,6 +17,7 @@ from shelfmark.core.logger import setup_logger
 from shelfmark.core.request_helpers import normalize_optional_text
 from shelfmark.core.search_plan import ReleaseSearchVariant
 from shelfmark.core.utils import normalize_http_url
+from shelfmark.download.fs import run_blocking_io
 from shelfmark.release_sources import (
     ColumnAlign,
     ColumnColorHint,
@@ -32,7 +33,7 @@ from shelfmark.release_sources import (
     register_source,
 )
 from shelfmark.release_sources.prowlarr.api import IndexerSeedSettings, ProwlarrClient
-from shelfmark.release_sources.prowlarr.cache import cache_release
+from shelfmark.release_sources.prowlarr.cache import cache_releases
 from shelfmark.release_sources.prowlarr.utils import (
     build_source_id,
     coerce_float_like,
@@ -463,9 +464,6 @@ def _prowlarr_result_to_release(
 
     source_id = build_source_id(result)
 
-    # Cache the raw Prowlarr result so handler can look it up by source_id
-    cache_release(source_id, result)
-
     # Derive common indicators from torznab/newznab attrs when present.
     download_volume_factor = coerce_float_like(result.get("downloadVolumeFactor"))
     is_freeleech = download_volume_factor == 0.0
@@ -987,6 +985,8 @@ class ProwlarrSource(ReleaseSource):
 
             results: list[Release] = []
             enriched_source_ids: set[str] = set()
+            # Raw results keyed by source_id, so the handler can look them up at download time
+            results_to_cache: list[tuple[str, dict]] = []
 
             for raw_result in all_results:
                 result_with_seed_settings = _apply_indexer_seed_settings(
@@ -1006,10 +1006,14 @@ class ProwlarrSource(ReleaseSource):
                 if idx_id_int is not None and idx_id_int in indexer_priority:
                     release.extra["indexer_priority"] = indexer_priority[idx_id_int]
                 results.append(release)
+                results_to_cache.append((release.source_id, result_with_seed_settings))
 
                 if is_enriched:
                     enriched_source_ids.add(release.source_id)
 
+            # One transaction per search, off the gevent hub
+            run_blocking_io(cache_releases, results_to_cache)
+
             results.sort(
                 key=lambda r: (
                     _release_indexer_rank(r, indexer_priority),
@@ -4,17 +4,15 @@ Provides common helper functions used across the Prowlarr plugin.
 """
 
 import re
-from typing import TYPE_CHECKING
 from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
 
 from shelfmark.core.request_helpers import normalize_optional_text
 
-if TYPE_CHECKING:
-    from pathlib import Path
-
 _INTEGER_LIKE_PATTERN = re.compile(r"^[+-]?\d+$")
 _FLOAT_LIKE_PATTERN = re.compile(r"^[+-]?(?:\d+(?:\.\d*)?|\.\d+)$")
 
+_KNOWN_PROTOCOLS = frozenset(("torrent", "usenet"))
+
 
 def coerce_int_like(value: object) -> int | None:
     """Return an integer for int-like config/API values, else None."""
@@ -73,17 +71,19 @@ def get_protocol(result: dict) -> str:
 
     Uses the protocol field directly if available, otherwise infers from URLs.
     """
-    protocol = str(result.get("protocol", "")).lower()
-    if protocol in ("torrent", "usenet"):
-        return protocol
-
-    magnet_url = str(result.get("magnetUrl") or "").lower()
-    download_url = str(result.get("downloadUrl") or "").lower()
-
-    # Prefer magnetUrl for inference if present.
-    if magnet_url.startswith("magnet:"):
+    protocol = result.get("protocol")
+    if protocol:
+        protocol = str(protocol).lower()
+        if protocol in _KNOWN_PROTOCOLS:
+            return protocol
+
+    # Prefer magnetUrl for inference if present. Only its scheme needs case-folding,
+    # and downloadUrl is not lowered at all when the magnet settles it.
+    magnet_url = result.get("magnetUrl")
+    if magnet_url and str(magnet_url)[: len("magnet:")].lower() == "magnet:":
         return "torrent"
 
+    download_url = str(result.get("downloadUrl") or "").lower()
     if download_url.startswith("magnet:") or ".torrent" in download_url:
         return "torrent"
     if ".nzb" in download_url:
@@ -164,27 +164,3 @@ def get_protocol_display(result: dict) -> str:
     if protocol == "usenet":
         return "nzb"
     return protocol
-
-
-def get_unique_path(staging_dir: Path, name: str, suffix: str = "") -> Path:
-    """Generate a unique path in staging_dir, appending _N if needed.
-
-    Args:
-        staging_dir: Directory to create the path in
-        name: Base name for the file/directory
-        suffix: Optional suffix (e.g., ".epub" for files)
-
-    Returns:
-        Unique Path that doesn't exist in staging_dir
-
-    """
-    staged_path = staging_dir / (name + suffix)
-    if not staged_path.exists():
-        return staged_path
-
-    counter = 1
-    while True:
-        staged_path = staging_dir / f"{name}_{counter}{suffix}"
-        if not staged_path.exists():
-            return staged_path
-        counter += 1
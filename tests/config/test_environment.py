@@ -78,6 +78,18 @@ class TestDirectorySetup:
                 assert path1.suffix == ".epub"
                 assert path2.suffix == ".epub"
 
+    def test_build_staging_dir_reserves_a_fresh_directory_per_call(self):
+        """Repeated calls for one task should each get their own new directory."""
+        from shelfmark.download.staging import build_staging_dir
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch("shelfmark.config.env.TMP_DIR", Path(tmpdir)):
+                dirs = [build_staging_dir("extract", "task1") for _ in range(3)]
+
+            assert len(set(dirs)) == 3
+            assert all(d.is_dir() for d in dirs)
+            assert [d.name.removeprefix(dirs[0].name) for d in dirs] == ["", "_1", "_2"]
+
 
 # =============================================================================
 # Supported Formats Tests
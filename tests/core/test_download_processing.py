@@ -7,6 +7,7 @@ Covers:
 - Custom script execution
 """
 
+import itertools
 import json
 import os
 import shutil
@@ -80,6 +81,13 @@ def _sync_core_config(mock_config, mock_core_config, mock_archive_config=None):
         mock_archive_config.get = mock_config.get
 
 
+def _mock_script_process(mock_popen, *, returncode=0, stdout="", stderr=""):
+    process = mock_popen.return_value
+    process.communicate.return_value = (stdout, stderr)
+    process.returncode = returncode
+    return process
+
+
 # =============================================================================
 # _atomic_copy Tests
 # =============================================================================
@@ -329,6 +337,103 @@ class TestAtomicCopy:
         with pytest.raises(RuntimeError, match="Could not copy file after 100 attempts"):
             _atomic_copy(source, tmp_path / "dest.txt", max_attempts=100)
 
+    def test_large_copy_uses_copy_file_range(self, tmp_path, monkeypatch):
+        """Large copies go through copy_file_range and keep copy2 metadata semantics."""
+        from shelfmark.download import fs
+
+        source = tmp_path / "source.bin"
+        source.write_bytes(b"x" * 4096)
+        os.chmod(source, 0o640)
+        dest = tmp_path / "dest.bin"
+
+        range_calls: list[int] = []
+
+        def _fake_copy_file_range(src_fd, dst_fd, count):
+            data = os.read(src_fd, count)
+            range_calls.append(len(data))
+            return os.write(dst_fd, data)
+
+        monkeypatch.setattr(fs, "_COPY_FILE_RANGE_MIN_SIZE", 1)
+        monkeypatch.setattr(fs, "_COPY_FILE_RANGE_SUPPORT", {})
+        monkeypatch.setattr(fs.os, "copy_file_range", _fake_copy_file_range, raising=False)
+
+        with patch("shelfmark.download.fs.shutil.copy2", side_effect=AssertionError("copy2")):
+            result = fs.atomic_copy(source, dest)
+
+        assert result == dest
+        assert result.read_bytes() == b"x" * 4096
+        assert (os.stat(result).st_mode & 0o777) == 0o640
+        assert sum(range_calls) == 4096
+
+    def test_copy_file_range_unsupported_falls_back_and_is_remembered(self, tmp_path, monkeypatch):
+        """An unsupported device pair falls back to copy2 and skips the syscall next time."""
+        import errno
+
+        from shelfmark.download import fs
+
+        range_calls = {"count": 0}
+
+        def _unsupported(*_args, **_kwargs):
+            range_calls["count"] += 1
+            raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+        monkeypatch.setattr(fs, "_COPY_FILE_RANGE_MIN_SIZE", 1)
+        monkeypatch.setattr(fs, "_COPY_FILE_RANGE_SUPPORT", {})
+        monkeypatch.setattr(fs.os, "copy_file_range", _unsupported, raising=False)
+
+        for name in ("a.bin", "b.bin"):
+            source = tmp_path / f"src-{name}"
+            source.write_bytes(b"payload")
+            result = fs.atomic_copy(source, tmp_path / name)
+            assert result.read_bytes() == b"payload"
+
+        assert range_calls["count"] == 1
+
+    def test_copy_file_range_zero_return_falls_back_and_is_remembered(self, tmp_path, monkeypatch):
+        """A filesystem that copies nothing falls back to copy2 instead of a short file."""
+        from shelfmark.download import fs
+
+        range_calls = {"count": 0}
+
+        def _copies_nothing(*_args, **_kwargs):
+            range_calls["count"] += 1
+            return 0
+
+        monkeypatch.setattr(fs, "_COPY_FILE_RANGE_MIN_SIZE", 1)
+        monkeypatch.setattr(fs, "_COPY_FILE_RANGE_SUPPORT", {})
+        monkeypatch.setattr(fs.os, "copy_file_range", _copies_nothing, raising=False)
+
+        for name in ("a.bin", "b.bin"):
+            source = tmp_path / f"src-{name}"
+            source.write_bytes(b"payload")
+            result = fs.atomic_copy(source, tmp_path / name)
+            assert result.read_bytes() == b"payload"
+
+        assert range_calls["count"] == 1
+
+    def test_copy_file_range_short_copy_falls_back_to_copy2(self, tmp_path, monkeypatch):
+        """A copy that stops part-way is redone by copy2 rather than kept truncated."""
+        from shelfmark.download import fs
+
+        source = tmp_path / "source.bin"
+        source.write_bytes(b"x" * 4096)
+        returns = iter([1024, 0])
+
+        def _stops_early(src_fd, dst_fd, count):
+            chunk = next(returns)
+            os.write(dst_fd, os.read(src_fd, chunk))
+            return chunk
+
+        monkeypatch.setattr(fs, "_COPY_FILE_RANGE_MIN_SIZE", 1)
+        monkeypatch.setattr(fs, "_COPY_FILE_RANGE_SUPPORT", {})
+        monkeypatch.setattr(fs.os, "copy_file_range", _stops_early, raising=False)
+
+        result = fs.atomic_copy(source, tmp_path / "dest.bin")
+
+        assert result.read_bytes() == b"x" * 4096
+        # Only a pair that never copied anything is marked unsupported.
+        assert fs._COPY_FILE_RANGE_SUPPORT == {}
+
 
 # =============================================================================
 # process_directory Tests
@@ -643,6 +748,40 @@ class TestPostProcessDownload:
         assert not temp_file.exists()  # Moved
         status_cb.assert_called_with("complete", "Complete")
 
+    def test_folder_output_resolves_output_plan_once(self, temp_dirs, sample_direct_task):
+        """Reuses the processing plan's output plan when preparing files."""
+        from shelfmark.download.postprocess import prepare
+        from shelfmark.download.postprocess.router import (
+            post_process_download as _post_process_download,
+        )
+
+        temp_file = temp_dirs["staging"] / "book.epub"
+        temp_file.write_bytes(b"epub content")
+
+        with (
+            patch("shelfmark.core.config.config") as mock_config,
+            patch("shelfmark.config.env.TMP_DIR", temp_dirs["staging"]),
+            patch.object(
+                prepare,
+                "resolve_hardlink_source",
+                wraps=prepare.resolve_hardlink_source,
+            ) as resolve_spy,
+        ):
+            mock_config.USE_BOOK_TITLE = False
+            mock_config.CUSTOM_SCRIPT = None
+            mock_config.get = _mock_destination_config(temp_dirs["ingest"])
+            _sync_core_config(mock_config, mock_config)
+
+            result = _post_process_download(
+                temp_file=temp_file,
+                task=sample_direct_task,
+                cancel_flag=Event(),
+                status_callback=MagicMock(),
+            )
+
+        assert result is not None
+        assert resolve_spy.call_count == 1
+
     def test_uses_formatted_filename(self, temp_dirs, sample_direct_task):
         """Uses task title when USE_BOOK_TITLE enabled."""
         from shelfmark.download.postprocess.router import (
@@ -865,7 +1004,7 @@ class TestCustomScriptExecution:
         with (
             patch("shelfmark.core.config.config") as mock_config,
             patch("shelfmark.config.env.TMP_DIR", temp_dirs["staging"]),
-            patch("subprocess.run") as mock_run,
+            patch("subprocess.Popen") as mock_popen,
         ):
             mock_config.USE_BOOK_TITLE = False
             mock_config.CUSTOM_SCRIPT = "/path/to/script.sh"
@@ -873,7 +1012,7 @@ class TestCustomScriptExecution:
             mock_config.get = _mock_destination_config(temp_dirs["ingest"])
             _sync_core_config(mock_config, mock_config)
 
-            mock_run.return_value = MagicMock(stdout="", returncode=0)
+            _mock_script_process(mock_popen)
 
             result = _post_process_download(
                 temp_file=temp_file,
@@ -883,15 +1022,17 @@ class TestCustomScriptExecution:
             )
 
         assert result is not None
-        mock_run.assert_called_once()
-        call_args = mock_run.call_args
+        mock_popen.assert_called_once()
+        call_args = mock_popen.call_args
         result_path = Path(result)
         assert call_args[0][0] == ["/path/to/script.sh", str(result_path)]
         assert call_args.kwargs["stdin"] is subprocess.DEVNULL
-        assert "input" not in call_args.kwargs
+        assert mock_popen.return_value.communicate.call_args.kwargs["input"] is None
 
     def test_runs_custom_script_with_json_payload_on_stdin(self, temp_dirs, sample_direct_task):
         """Sends a JSON payload to the custom script via stdin when enabled."""
+        import subprocess
+
         from shelfmark.download.postprocess.router import (
             post_process_download as _post_process_download,
         )
@@ -905,7 +1046,7 @@ class TestCustomScriptExecution:
         with (
             patch("shelfmark.core.config.config") as mock_config,
             patch("shelfmark.config.env.TMP_DIR", temp_dirs["staging"]),
-            patch("subprocess.run") as mock_run,
+            patch("subprocess.Popen") as mock_popen,
         ):
             mock_config.USE_BOOK_TITLE = False
             mock_config.CUSTOM_SCRIPT = "/path/to/script.sh"
@@ -916,7 +1057,7 @@ class TestCustomScriptExecution:
             )
             _sync_core_config(mock_config, mock_config)
 
-            mock_run.return_value = MagicMock(stdout="", returncode=0)
+            _mock_script_process(mock_popen)
 
             result = _post_process_download(
                 temp_file=temp_file,
@@ -928,9 +1069,9 @@ class TestCustomScriptExecution:
         assert result is not None
         result_path = Path(result)
 
-        payload_json = mock_run.call_args.kwargs.get("input")
+        payload_json = mock_popen.return_value.communicate.call_args.kwargs.get("input")
         assert payload_json
-        assert "stdin" not in mock_run.call_args.kwargs
+        assert mock_popen.call_args.kwargs["stdin"] is subprocess.PIPE
         payload = json.loads(payload_json)
         assert payload["version"] == 1
         assert payload["phase"] == "post_transfer"
@@ -943,6 +1084,8 @@ class TestCustomScriptExecution:
         self, temp_dirs, sample_direct_task
     ):
         """Runs the custom script hook after a successful Booklore upload."""
+        import subprocess
+
         from shelfmark.download.postprocess.router import (
             post_process_download as _post_process_download,
         )
@@ -961,7 +1104,7 @@ class TestCustomScriptExecution:
             patch("shelfmark.download.outputs.booklore.booklore_login", return_value="token"),
             patch("shelfmark.download.outputs.booklore.booklore_upload_file"),
             patch("shelfmark.download.outputs.booklore.booklore_refresh_library"),
-            patch("subprocess.run") as mock_run,
+            patch("subprocess.Popen") as mock_popen,
         ):
             mock_config.USE_BOOK_TITLE = False
             mock_config.CUSTOM_SCRIPT = "/path/to/script.sh"
@@ -980,7 +1123,7 @@ class TestCustomScriptExecution:
             )
             _sync_core_config(mock_config, mock_config)
 
-            mock_run.return_value = MagicMock(stdout="", returncode=0)
+            _mock_script_process(mock_popen)
 
             result = _post_process_download(
                 temp_file=temp_file,
@@ -991,9 +1134,9 @@ class TestCustomScriptExecution:
 
         assert result == "booklore://direct-booklore"
 
-        payload_json = mock_run.call_args.kwargs.get("input")
+        payload_json = mock_popen.return_value.communicate.call_args.kwargs.get("input")
         assert payload_json
-        assert "stdin" not in mock_run.call_args.kwargs
+        assert mock_popen.call_args.kwargs["stdin"] is subprocess.PIPE
         payload = json.loads(payload_json)
         assert payload["version"] == 1
         assert payload["phase"] == "post_upload"
@@ -1017,7 +1160,7 @@ class TestCustomScriptExecution:
         with (
             patch("shelfmark.core.config.config") as mock_config,
             patch("shelfmark.config.env.TMP_DIR", temp_dirs["staging"]),
-            patch("subprocess.run") as mock_run,
+            patch("subprocess.Popen") as mock_popen,
         ):
             mock_config.USE_BOOK_TITLE = False
             mock_config.CUSTOM_SCRIPT = "/path/to/script.sh"
@@ -1028,7 +1171,7 @@ class TestCustomScriptExecution:
             )
             _sync_core_config(mock_config, mock_config)
 
-            mock_run.return_value = MagicMock(stdout="", returncode=0)
+            _mock_script_process(mock_popen)
 
             result = _post_process_download(
                 temp_file=temp_file,
@@ -1040,7 +1183,7 @@ class TestCustomScriptExecution:
         assert result is not None
         result_path = Path(result)
         expected_relative = result_path.relative_to(temp_dirs["ingest"])
-        script_args = mock_run.call_args[0][0]
+        script_args = mock_popen.call_args[0][0]
         assert script_args[0] == "/path/to/script.sh"
         assert script_args[1] == str(expected_relative)
         assert not Path(script_args[1]).is_absolute()
@@ -1072,7 +1215,7 @@ class TestCustomScriptExecution:
         with (
             patch("shelfmark.core.config.config") as mock_config,
             patch("shelfmark.config.env.TMP_DIR", temp_dirs["staging"]),
-            patch("subprocess.run") as mock_run,
+            patch("subprocess.Popen") as mock_popen,
         ):
             mock_config.USE_BOOK_TITLE = False
             mock_config.CUSTOM_SCRIPT = "/path/to/script.sh"
@@ -1082,7 +1225,7 @@ class TestCustomScriptExecution:
             )
             _sync_core_config(mock_config, mock_config)
 
-            mock_run.return_value = MagicMock(stdout="", returncode=0)
+            _mock_script_process(mock_popen)
 
             result = _post_process_download(
                 temp_file=download_dir,
@@ -1092,8 +1235,8 @@ class TestCustomScriptExecution:
             )
 
         assert result is not None
-        assert mock_run.call_count == 1
-        script_args = mock_run.call_args[0][0]
+        assert mock_popen.call_count == 1
+        script_args = mock_popen.call_args[0][0]
         assert script_args[0] == "/path/to/script.sh"
         assert Path(script_args[1]) == temp_dirs["ingest"]
 
@@ -1112,7 +1255,7 @@ class TestCustomScriptExecution:
         with (
             patch("shelfmark.core.config.config") as mock_config,
             patch("shelfmark.config.env.TMP_DIR", temp_dirs["staging"]),
-            patch("subprocess.run", side_effect=FileNotFoundError("not found")),
+            patch("subprocess.Popen", side_effect=FileNotFoundError("not found")),
         ):
             mock_config.USE_BOOK_TITLE = False
             mock_config.CUSTOM_SCRIPT = "/nonexistent/script.sh"
@@ -1145,7 +1288,7 @@ class TestCustomScriptExecution:
         with (
             patch("shelfmark.core.config.config") as mock_config,
             patch("shelfmark.config.env.TMP_DIR", temp_dirs["staging"]),
-            patch("subprocess.run", side_effect=PermissionError("not executable")),
+            patch("subprocess.Popen", side_effect=PermissionError("not executable")),
         ):
             mock_config.USE_BOOK_TITLE = False
             mock_config.CUSTOM_SCRIPT = "/path/to/script.sh"
@@ -1165,7 +1308,7 @@ class TestCustomScriptExecution:
 
     def test_script_timeout_error(self, temp_dirs, sample_direct_task):
         """Returns error when script times out."""
-        import subprocess
+        import signal
 
         from shelfmark.download.postprocess.router import (
             post_process_download as _post_process_download,
@@ -1180,8 +1323,13 @@ class TestCustomScriptExecution:
         with (
             patch("shelfmark.core.config.config") as mock_config,
             patch("shelfmark.config.env.TMP_DIR", temp_dirs["staging"]),
-            patch("subprocess.run", side_effect=subprocess.TimeoutExpired("script", 300)),
+            patch("subprocess.Popen") as mock_popen,
+            patch("shelfmark.download.postprocess.custom_script.time") as mock_time,
+            patch("os.killpg") as mock_killpg,
         ):
+            process = _mock_script_process(mock_popen)
+            # Each clock read jumps past the 300s budget.
+            mock_time.monotonic.side_effect = itertools.count(0, 1000)
             mock_config.USE_BOOK_TITLE = False
             mock_config.CUSTOM_SCRIPT = "/path/to/script.sh"
             _sync_core_config(mock_config, mock_config)
@@ -1196,12 +1344,11 @@ class TestCustomScriptExecution:
             )
 
         assert result is None
+        mock_killpg.assert_called_once_with(process.pid, signal.SIGKILL)
         status_cb.assert_called_with("error", "Custom script timed out")
 
     def test_script_nonzero_exit_error(self, temp_dirs, sample_direct_task):
         """Returns error when script exits non-zero."""
-        import subprocess
-
         from shelfmark.download.postprocess.router import (
             post_process_download as _post_process_download,
         )
@@ -1215,7 +1362,7 @@ class TestCustomScriptExecution:
         with (
             patch("shelfmark.core.config.config") as mock_config,
             patch("shelfmark.config.env.TMP_DIR", temp_dirs["staging"]),
-            patch("subprocess.run") as mock_run,
+            patch("subprocess.Popen") as mock_popen,
         ):
             mock_config.USE_BOOK_TITLE = False
             mock_config.CUSTOM_SCRIPT = "/path/to/script.sh"
@@ -1223,8 +1370,7 @@ class TestCustomScriptExecution:
             mock_config.get = _mock_destination_config(temp_dirs["ingest"])
             _sync_core_config(mock_config, mock_config)
 
-            error = subprocess.CalledProcessError(1, "script", stderr="Something failed")
-            mock_run.side_effect = error
+            _mock_script_process(mock_popen, returncode=1, stderr="Something failed")
 
             result = _post_process_download(
                 temp_file=temp_file,
@@ -1236,6 +1382,48 @@ class TestCustomScriptExecution:
         assert result is None
         status_cb.assert_called_with("error", "Custom script failed: Something failed")
 
+    # Integration-style end-to-end processing scenarios live in
+    # `tests/core/test_processing_integration.py`.
+
+    def test_cancel_flag_terminates_running_script(self, tmp_path):
+        """Terminates a running script when the task is cancelled."""
+        import threading
+        import time
+
+        from shelfmark.download.postprocess.custom_script import (
+            prepare_custom_script_execution,
+            run_custom_script,
+        )
+
+        script = tmp_path / "slow.sh"
+        script.write_text("#!/bin/sh\nsleep 30\n")
+        script.chmod(0o755)
+        target = tmp_path / "book.epub"
+        target.write_bytes(b"content")
+
+        execution = prepare_custom_script_execution(
+            str(script),
+            target_path=target,
+            destination=tmp_path,
+            path_mode="absolute",
+            phase="post_transfer",
+        )
+        status_cb = MagicMock()
+        cancel_flag = Event()
+        timer = threading.Timer(0.2, cancel_flag.set)
+        timer.start()
+
+        started = time.monotonic()
+        try:
+            result = run_custom_script(
+                execution,
+                task_id="cancel-script",
+                status_callback=status_cb,
+                cancel_flag=cancel_flag,
+            )
+        finally:
+            timer.cancel()
 
-# Integration-style end-to-end processing scenarios live in
-# `tests/core/test_processing_integration.py`.
+        assert result is False
+        assert time.monotonic() - started < 10
+        status_cb.assert_not_called()
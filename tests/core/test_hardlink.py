@@ -273,6 +273,63 @@ class TestAtomicHardlink:
         assert source.exists()
         assert os.stat(source).st_ino != os.stat(result).st_ino
 
+    def test_hardlink_or_copy_reports_operation(self, tmp_path, monkeypatch):
+        """Reports hardlink vs copy without re-checking inodes."""
+        from shelfmark.download.fs import atomic_hardlink_or_copy
+
+        source = tmp_path / "source.txt"
+        source.write_text("content")
+
+        result, op = atomic_hardlink_or_copy(source, tmp_path / "linked.txt")
+        assert op == "hardlink"
+        assert os.stat(source).st_ino == os.stat(result).st_ino
+
+        original_link = os.link
+
+        def _raise_only_for_initial_link(src, dst, *_args, **_kwargs):
+            if Path(src) == source:
+                raise PermissionError("hardlink not permitted")
+            return original_link(src, dst)
+
+        monkeypatch.setattr(os, "link", _raise_only_for_initial_link)
+
+        result, op = atomic_hardlink_or_copy(source, tmp_path / "copied.txt")
+        assert op == "copy"
+        assert result.read_text() == "content"
+
+    def test_cross_device_failure_skips_link_for_same_directories(self, tmp_path, monkeypatch):
+        """Remembers EXDEV per directory pair so later files copy directly."""
+        import errno
+
+        import shelfmark.download.fs as fs
+
+        src_dir = tmp_path / "src"
+        dst_dir = tmp_path / "dst"
+        src_dir.mkdir()
+        dst_dir.mkdir()
+        first = src_dir / "a.txt"
+        second = src_dir / "b.txt"
+        first.write_text("a")
+        second.write_text("b")
+
+        monkeypatch.setattr(fs, "_CROSS_DEVICE_DIRS", set())
+        original_link = os.link
+        link_sources: list[Path] = []
+
+        def _exdev_for_sources(src, dst, *_args, **_kwargs):
+            if Path(src).parent == src_dir:
+                link_sources.append(Path(src))
+                raise OSError(errno.EXDEV, "Invalid cross-device link")
+            return original_link(src, dst)
+
+        monkeypatch.setattr(os, "link", _exdev_for_sources)
+
+        assert fs.atomic_hardlink_or_copy(first, dst_dir / "a.txt")[1] == "copy"
+        assert fs.atomic_hardlink_or_copy(second, dst_dir / "b.txt")[1] == "copy"
+
+        assert link_sources == [first]
+        assert (dst_dir / "b.txt").read_text() == "b"
+
 
 class TestAtomicMove:
     """Tests for _atomic_move() function."""
@@ -647,6 +704,88 @@ class TestHardlinkWithLibraryMode:
         # Source dir should be cleaned up
         assert not source_dir.exists()
 
+    def test_transfer_directory_many_parts_keep_part_order(self, tmp_path, sample_task):
+        """Multi-part moves still return the first part and keep every file's contents."""
+        from shelfmark.download.postprocess.pipeline import transfer_directory_to_library
+
+        library = tmp_path / "library"
+        library.mkdir()
+        source_dir = tmp_path / "staging" / "audiobook"
+        source_dir.mkdir(parents=True)
+
+        for index in range(1, 13):
+            (source_dir / f"Chapter {index}.mp3").write_bytes(f"audio{index}".encode())
+
+        sample_task.content_type = "audiobook"
+        status_cb = MagicMock()
+
+        with (
+            patch(
+                "shelfmark.download.postprocess.scan.get_supported_formats", return_value=["mp3"]
+            ),
+            patch("shelfmark.config.env.TMP_DIR", source_dir.parent),
+        ):
+            result = transfer_directory_to_library(
+                source_dir=source_dir,
+                library_base=str(library),
+                template="{Author}/{Title}{ - PartNumber}",
+                metadata={"Author": "Brandon Sanderson", "Title": "The Way of Kings"},
+                task=sample_task,
+                temp_file=source_dir,
+                status_callback=status_cb,
+                use_hardlink=False,
+            )
+
+        author_dir = library / "Brandon Sanderson"
+        assert result == str(author_dir / "The Way of Kings - 01.mp3")
+        for index in range(1, 13):
+            part = author_dir / f"The Way of Kings - {index:02d}.mp3"
+            assert part.read_bytes() == f"audio{index}".encode()
+        status_cb.assert_called_with("complete", "Complete (12 files)")
+
+    @pytest.mark.parametrize("is_torrent", [False, True])
+    def test_transfer_directory_without_part_number_keeps_every_part(
+        self, tmp_path, sample_task, is_torrent
+    ):
+        """Parts sharing one library name are all kept, suffixed in part order."""
+        from shelfmark.download.postprocess.pipeline import transfer_directory_to_library
+
+        library = tmp_path / "library"
+        library.mkdir()
+        source_dir = tmp_path / "staging" / "audiobook"
+        source_dir.mkdir(parents=True)
+
+        for index in range(1, 7):
+            (source_dir / f"Chapter {index}.mp3").write_bytes(f"audio{index}".encode())
+
+        sample_task.content_type = "audiobook"
+        if is_torrent:
+            sample_task.original_download_path = str(source_dir)
+
+        with (
+            patch(
+                "shelfmark.download.postprocess.scan.get_supported_formats", return_value=["mp3"]
+            ),
+            patch("shelfmark.config.env.TMP_DIR", source_dir.parent),
+        ):
+            result = transfer_directory_to_library(
+                source_dir=source_dir,
+                library_base=str(library),
+                template="{Author}/{Title}",
+                metadata={"Author": "Brandon Sanderson", "Title": "The Way of Kings"},
+                task=sample_task,
+                temp_file=source_dir,
+                status_callback=MagicMock(),
+                use_hardlink=False,
+            )
+
+        author_dir = library / "Brandon Sanderson"
+        assert result == str(author_dir / "The Way of Kings.mp3")
+        assert (author_dir / "The Way of Kings.mp3").read_bytes() == b"audio1"
+        for index in range(2, 7):
+            part = author_dir / f"The Way of Kings_{index - 1}.mp3"
+            assert part.read_bytes() == f"audio{index}".encode()
+
     def test_single_file_in_directory_no_part_number(self, tmp_path, sample_task):
         """Single file in directory doesn't get part number."""
         from shelfmark.download.postprocess.pipeline import transfer_directory_to_library
@@ -891,6 +1030,21 @@ class TestTorrentOptimization:
 
         assert is_torrent_source(staging_path, sample_task) is False
 
+    def testis_torrent_source_true_for_symlinked_alias(self, tmp_path, sample_task):
+        """Detects the torrent path when reached through a symlinked directory."""
+        from shelfmark.download.postprocess.pipeline import is_torrent_source
+
+        torrent_dir = tmp_path / "downloads"
+        torrent_dir.mkdir()
+        torrent_path = torrent_dir / "book.epub"
+        torrent_path.touch()
+        alias_dir = tmp_path / "alias"
+        alias_dir.symlink_to(torrent_dir, target_is_directory=True)
+        sample_task.original_download_path = str(torrent_path)
+
+        assert is_torrent_source(alias_dir / "book.epub", sample_task) is True
+        assert is_torrent_source(alias_dir / "missing.epub", sample_task) is False
+
     def test_library_mode_torrent_no_hardlink_copies(self, tmp_path, sample_task):
         """Library mode copies (not moves) torrent files when hardlink unavailable."""
         from shelfmark.download.postprocess.pipeline import transfer_file_to_library
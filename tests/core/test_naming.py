@@ -11,6 +11,7 @@ import pytest
 from shelfmark.core.naming import (
     assign_part_numbers,
     build_library_path,
+    compile_library_path,
     derive_primary_title,
     format_series_position,
     natural_sort_key,
@@ -420,6 +421,19 @@ class TestBuildLibraryPath:
         )
         assert path == Path("/books/Sanderson/Book")
 
+    def test_compiled_builder_matches_build_library_path(self):
+        """Compiled builder renders the same paths as build_library_path per part."""
+        template = "{Author}/{Title}{ - Part }{PartNumber}"
+        metadata = {"Author": "Sanderson", "Title": "Book"}
+        build = compile_library_path("/audiobooks", template, metadata)
+
+        assert build(None, None) == build_library_path("/audiobooks", template, metadata)
+        for part in ("01", "02", "10"):
+            assert build(part, "mp3") == build_library_path(
+                "/audiobooks", template, {**metadata, "PartNumber": part}, extension="mp3"
+            )
+        assert build("02", "mp3") == Path("/audiobooks/Sanderson/Book - Part 02.mp3")
+
 
 class TestSanitizeFilename:
     """Tests for filename sanitization."""
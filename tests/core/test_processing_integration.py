@@ -1180,13 +1180,14 @@ def test_custom_script_external_source_stages_copy_and_preserves_source(tmp_path
     with (
         patch("shelfmark.core.config.config") as mock_config,
         patch("shelfmark.config.env.TMP_DIR", staging),
-        patch("subprocess.run") as mock_run,
+        patch("subprocess.Popen") as mock_popen,
     ):
         mock_config.get = _build_config(ingest, organization="none")
         mock_config.CUSTOM_SCRIPT = "/path/to/script.sh"
         _sync_config(mock_config, mock_config)
 
-        mock_run.return_value = MagicMock(stdout="", returncode=0)
+        mock_popen.return_value.communicate.return_value = ("", "")
+        mock_popen.return_value.returncode = 0
 
         result = _post_process_download(original, task, Event(), lambda *_args: None)
 
@@ -1198,8 +1199,8 @@ def test_custom_script_external_source_stages_copy_and_preserves_source(tmp_path
     assert original.exists()
 
     # Script should have run against the final imported file.
-    assert mock_run.call_count == 1
-    script_args = mock_run.call_args[0][0]
+    assert mock_popen.call_count == 1
+    script_args = mock_popen.call_args[0][0]
     assert script_args[0] == "/path/to/script.sh"
     assert Path(script_args[1]) == result_path
 
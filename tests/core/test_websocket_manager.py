@@ -1,5 +1,7 @@
 """Tests for WebSocket room scoping and SID room synchronization."""
 
+from unittest.mock import MagicMock, call
+
 from shelfmark.api import websocket as websocket_module
 from shelfmark.api.websocket import WebSocketManager
 
@@ -84,3 +86,45 @@ def test_sync_user_room_tracks_ref_counts_across_multiple_sids(monkeypatch):
     manager.leave_user_room("sid-a")
     manager.leave_user_room("sid-b")
     assert manager._user_rooms == {}
+
+
+def test_has_subscribers_tracks_connection_count():
+    manager = WebSocketManager()
+    assert manager.has_subscribers() is False
+
+    manager.client_connected()
+    assert manager.has_subscribers() is True
+
+    manager.client_disconnected()
+    assert manager.has_subscribers() is False
+
+
+def test_broadcast_download_progress_batch_emits_per_book_to_rooms(monkeypatch):
+    monkeypatch.setattr(websocket_module, "join_room", lambda *_, **__: None)
+
+    manager = WebSocketManager()
+    socketio = MagicMock()
+    manager.init_app(MagicMock(), socketio)
+    manager.sync_user_room("sid-a", is_admin=False, db_user_id=7)
+
+    manager.broadcast_download_progress_batch(
+        {"book-1": (25.0, 7), "book-2": (50.0, 9)}, "downloading"
+    )
+
+    assert socketio.emit.call_args_list == [
+        call(
+            "download_progress",
+            {"book_id": "book-1", "progress": 25.0, "status": "downloading"},
+            to="admins",
+        ),
+        call(
+            "download_progress",
+            {"book_id": "book-1", "progress": 25.0, "status": "downloading"},
+            to="user_7",
+        ),
+        call(
+            "download_progress",
+            {"book_id": "book-2", "progress": 50.0, "status": "downloading"},
+            to="admins",
+        ),
+    ]
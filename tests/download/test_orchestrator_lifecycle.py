@@ -143,7 +143,11 @@ def test_start_replaces_dead_coordinator_thread(monkeypatch):
 
     thread_factory = MagicMock(return_value=new_thread)
 
+    live_broadcaster = MagicMock()
+    live_broadcaster.is_alive.return_value = True
+
     monkeypatch.setattr(orchestrator, "_coordinator_thread", dead_thread)
+    monkeypatch.setattr(orchestrator, "_progress_broadcaster_thread", live_broadcaster)
     monkeypatch.setattr(orchestrator.threading, "Thread", thread_factory)
 
     orchestrator.start()
@@ -155,3 +159,131 @@ def test_start_replaces_dead_coordinator_thread(monkeypatch):
     )
     new_thread.start.assert_called_once_with()
     assert orchestrator._coordinator_thread is new_thread
+
+
+def test_start_launches_progress_broadcaster_once(monkeypatch):
+    import shelfmark.download.orchestrator as orchestrator
+
+    live_coordinator = MagicMock()
+    live_coordinator.is_alive.return_value = True
+
+    new_thread = MagicMock()
+    new_thread.is_alive.return_value = True
+    thread_factory = MagicMock(return_value=new_thread)
+
+    monkeypatch.setattr(orchestrator, "_coordinator_thread", live_coordinator)
+    monkeypatch.setattr(orchestrator, "_progress_broadcaster_thread", None)
+    monkeypatch.setattr(orchestrator.threading, "Thread", thread_factory)
+
+    orchestrator.start()
+    orchestrator.start()
+
+    thread_factory.assert_called_once_with(
+        target=orchestrator._progress_broadcast_loop,
+        daemon=True,
+        name="ProgressBroadcaster",
+    )
+    assert orchestrator._progress_broadcaster_thread is new_thread
+
+
+def test_concurrent_download_loop_cancels_stalled_task_once_outside_lock(monkeypatch):
+    import threading
+
+    import shelfmark.download.orchestrator as orchestrator
+
+    pending_future = MagicMock()
+    pending_future.done.return_value = False
+
+    class _PendingExecutor(_FakeExecutor):
+        def submit(self, *args, **kwargs):
+            # The worker reports activity once, then goes quiet
+            with orchestrator._progress_lock:
+                orchestrator._record_activity_locked("stalled-task", 0.0)
+            return pending_future
+
+    next_downloads = iter([("stalled-task", threading.Event())])
+    mock_queue = MagicMock()
+    mock_queue.get_next.side_effect = lambda: next(next_downloads, None)
+    mock_queue.cancel_download.side_effect = lambda _task_id: (
+        orchestrator._progress_lock.locked() and pytest.fail("cancel while holding lock")
+    )
+
+    sleep_calls = 0
+
+    def fake_sleep(_delay: float) -> None:
+        nonlocal sleep_calls
+        sleep_calls += 1
+        if sleep_calls >= 3:
+            raise _StopLoop()
+
+    monkeypatch.setattr(orchestrator, "book_queue", mock_queue)
+    monkeypatch.setattr(orchestrator, "ThreadPoolExecutor", _PendingExecutor)
+    monkeypatch.setattr(orchestrator.time, "sleep", fake_sleep)
+    monkeypatch.setattr(orchestrator.time, "monotonic", lambda: 10_000.0)
+    monkeypatch.setattr(orchestrator.config, "MAX_CONCURRENT_DOWNLOADS", 1, raising=False)
+    monkeypatch.setattr(orchestrator, "_last_activity", {})
+    monkeypatch.setattr(orchestrator, "_stall_heap", [])
+    monkeypatch.setattr(orchestrator, "_stall_deadlines", {})
+
+    with pytest.raises(_StopLoop):
+        orchestrator.concurrent_download_loop()
+
+    mock_queue.cancel_download.assert_called_once_with("stalled-task")
+    mock_queue.update_status_message.assert_called_once_with(
+        "stalled-task",
+        f"Download stalled (no activity for {orchestrator.STALL_TIMEOUT}s)",
+    )
+
+
+def test_concurrent_download_loop_staggers_starts_without_sleeping(monkeypatch):
+    import threading
+
+    import shelfmark.download.orchestrator as orchestrator
+
+    submitted: list[str] = []
+
+    class _RecordingExecutor(_FakeExecutor):
+        def submit(self, _fn, task_id, _cancel_flag):
+            submitted.append(task_id)
+            future = MagicMock()
+            future.done.return_value = False
+            return future
+
+    queued = iter([("task-1", threading.Event()), ("task-2", threading.Event())])
+    mock_queue = MagicMock()
+    mock_queue.get_next.side_effect = lambda: next(queued, None)
+
+    clock = {"now": 100.0}
+    sleeps: list[float] = []
+    submitted_per_tick: list[list[str]] = []
+
+    def fake_sleep(delay: float) -> None:
+        sleeps.append(delay)
+        submitted_per_tick.append(list(submitted))
+        clock["now"] += delay
+        if len(sleeps) >= 4:
+            raise _StopLoop()
+
+    class _FixedRng:
+        def uniform(self, _low: float, _high: float) -> float:
+            return 1.0
+
+    monkeypatch.setattr(orchestrator, "book_queue", mock_queue)
+    monkeypatch.setattr(orchestrator, "ThreadPoolExecutor", _RecordingExecutor)
+    monkeypatch.setattr(orchestrator, "_RNG", _FixedRng())
+    monkeypatch.setattr(orchestrator.time, "sleep", fake_sleep)
+    monkeypatch.setattr(orchestrator.time, "monotonic", lambda: clock["now"])
+    monkeypatch.setattr(orchestrator.config, "MAX_CONCURRENT_DOWNLOADS", 2, raising=False)
+    monkeypatch.setattr(orchestrator.config, "MAIN_LOOP_SLEEP_TIME", 0.5, raising=False)
+
+    with pytest.raises(_StopLoop):
+        orchestrator.concurrent_download_loop()
+
+    # The coordinator never sleeps for the stagger; it defers the second start to a later tick.
+    assert sleeps == [0.5, 0.5, 0.5, 0.5]
+    assert submitted_per_tick == [
+        ["task-1"],
+        ["task-1"],
+        ["task-1", "task-2"],
+        ["task-1", "task-2"],
+    ]
@@ -19,7 +19,7 @@ def test_update_download_status_dedupes_identical_events(monkeypatch):
     monkeypatch.setattr(orchestrator, "ws_manager", mock_ws)
 
     times = iter([1.0, 2.0])
-    monkeypatch.setattr(orchestrator.time, "time", lambda: next(times))
+    monkeypatch.setattr(orchestrator.time, "monotonic", lambda: next(times))
 
     orchestrator.update_download_status(book_id, "resolving", "Bypassing protection...")
     orchestrator.update_download_status(book_id, "resolving", "Bypassing protection...")
@@ -33,6 +33,32 @@ def test_update_download_status_dedupes_identical_events(monkeypatch):
     assert orchestrator._last_activity[book_id] == 1.0
 
 
+def test_update_download_status_skips_repeated_status_without_message(monkeypatch):
+    import shelfmark.download.orchestrator as orchestrator
+
+    book_id = "test-book-id"
+
+    orchestrator._last_activity.clear()
+    orchestrator._last_progress_value.clear()
+    orchestrator._last_status_event.clear()
+
+    mock_queue = MagicMock()
+    monkeypatch.setattr(orchestrator, "book_queue", mock_queue)
+    monkeypatch.setattr(orchestrator, "queue_status", lambda: {})
+
+    mock_ws = MagicMock()
+    monkeypatch.setattr(orchestrator, "ws_manager", mock_ws)
+
+    orchestrator.update_download_status(book_id, "downloading", "Downloading from mirror")
+    orchestrator.update_download_status(book_id, "downloading")
+    orchestrator.update_download_status(book_id, "downloading")
+    orchestrator.update_download_status(book_id, "downloading", "Retrying mirror")
+
+    assert mock_queue.update_status.call_count == 2
+    assert mock_queue.update_status_message.call_count == 2
+    assert mock_ws.broadcast_status_update.call_count == 2
+
+
 def test_update_download_progress_dedupes_identical_progress_for_activity(monkeypatch):
     import shelfmark.download.orchestrator as orchestrator
 
@@ -47,7 +73,7 @@ def test_update_download_progress_dedupes_identical_progress_for_activity(monkey
     monkeypatch.setattr(orchestrator, "ws_manager", None)
 
     times = iter([10.0, 20.0])
-    monkeypatch.setattr(orchestrator.time, "time", lambda: next(times))
+    monkeypatch.setattr(orchestrator.time, "monotonic", lambda: next(times))
 
     orchestrator.update_download_progress(book_id, 0.0)
     orchestrator.update_download_progress(book_id, 0.0)
@@ -71,10 +97,239 @@ def test_update_download_progress_refreshes_activity_when_progress_changes(monke
     monkeypatch.setattr(orchestrator, "ws_manager", None)
 
     times = iter([30.0, 40.0])
-    monkeypatch.setattr(orchestrator.time, "time", lambda: next(times))
+    monkeypatch.setattr(orchestrator.time, "monotonic", lambda: next(times))
 
     orchestrator.update_download_progress(book_id, 0.0)
     orchestrator.update_download_progress(book_id, 0.5)
 
     assert orchestrator._last_activity[book_id] == 40.0
     assert orchestrator._last_progress_value[book_id] == 0.5
+
+
+def test_update_download_status_skips_queue_snapshot_without_subscribers(monkeypatch):
+    import shelfmark.download.orchestrator as orchestrator
+
+    book_id = "test-no-subscribers"
+
+    orchestrator._last_activity.clear()
+    orchestrator._last_progress_value.clear()
+    orchestrator._last_status_event.clear()
+
+    mock_queue = MagicMock()
+    monkeypatch.setattr(orchestrator, "book_queue", mock_queue)
+    queue_status = MagicMock(return_value={})
+    monkeypatch.setattr(orchestrator, "queue_status", queue_status)
+
+    mock_ws = MagicMock()
+    mock_ws.is_enabled.return_value = True
+    mock_ws.has_subscribers.return_value = False
+    monkeypatch.setattr(orchestrator, "ws_manager", mock_ws)
+
+    orchestrator.update_download_status(book_id, "downloading")
+    orchestrator.update_download_progress(book_id, 50.0)
+
+    assert mock_queue.update_status.call_count == 1
+    assert mock_queue.update_progress.call_count == 1
+    queue_status.assert_not_called()
+    mock_ws.broadcast_status_update.assert_not_called()
+    mock_ws.broadcast_download_progress.assert_not_called()
+
+
+def test_update_download_progress_coalesces_mid_progress_until_flush(monkeypatch):
+    import shelfmark.download.orchestrator as orchestrator
+
+    orchestrator._last_activity.clear()
+    orchestrator._last_progress_value.clear()
+    orchestrator._pending_progress.clear()
+
+    mock_queue = MagicMock()
+    mock_queue.get_task.return_value = MagicMock(user_id=7)
+    mock_queue.get_task_status.return_value = orchestrator.QueueStatus.DOWNLOADING
+    monkeypatch.setattr(orchestrator, "book_queue", mock_queue)
+
+    mock_ws = MagicMock()
+    mock_ws.is_enabled.return_value = True
+    mock_ws.has_subscribers.return_value = True
+    monkeypatch.setattr(orchestrator, "ws_manager", mock_ws)
+
+    orchestrator.update_download_progress("book-a", 0.0)
+    orchestrator.update_download_progress("book-a", 20.0)
+    orchestrator.update_download_progress("book-a", 40.0)
+    orchestrator.update_download_progress("book-b", 55.0)
+
+    # Start-of-download progress is sent immediately, mid-progress is deferred.
+    mock_ws.broadcast_download_progress.assert_called_once_with(
+        "book-a", 0.0, "downloading", user_id=7
+    )
+    mock_ws.broadcast_download_progress_batch.assert_not_called()
+
+    orchestrator._flush_pending_progress()
+
+    mock_ws.broadcast_download_progress_batch.assert_called_once_with(
+        {"book-a": (40.0, 7), "book-b": (55.0, 7)}, "downloading"
+    )
+    assert orchestrator._pending_progress == {}
+
+
+def test_update_download_progress_broadcasts_completion_immediately(monkeypatch):
+    import shelfmark.download.orchestrator as orchestrator
+
+    orchestrator._last_activity.clear()
+    orchestrator._last_progress_value.clear()
+    orchestrator._pending_progress.clear()
+
+    mock_queue = MagicMock()
+    mock_queue.get_task.return_value = None
+    monkeypatch.setattr(orchestrator, "book_queue", mock_queue)
+
+    mock_ws = MagicMock()
+    mock_ws.is_enabled.return_value = True
+    mock_ws.has_subscribers.return_value = True
+    monkeypatch.setattr(orchestrator, "ws_manager", mock_ws)
+
+    orchestrator.update_download_progress("book-c", 50.0)
+    orchestrator.update_download_progress("book-c", 100.0)
+
+    mock_ws.broadcast_download_progress.assert_called_once_with(
+        "book-c", 100.0, "downloading", user_id=None
+    )
+    assert "book-c" not in orchestrator._pending_progress
+
+
+def test_flush_pending_progress_skips_finished_tasks(monkeypatch):
+    import shelfmark.download.orchestrator as orchestrator
+
+    orchestrator._pending_progress.clear()
+    statuses = {
+        "book-live": orchestrator.QueueStatus.DOWNLOADING,
+        "book-done": orchestrator.QueueStatus.COMPLETE,
+    }
+
+    mock_queue = MagicMock()
+    mock_queue.get_task.return_value = MagicMock(user_id=None)
+    mock_queue.get_task_status.side_effect = statuses.get
+    monkeypatch.setattr(orchestrator, "book_queue", mock_queue)
+
+    mock_ws = MagicMock()
+    mock_ws.is_enabled.return_value = True
+    mock_ws.has_subscribers.return_value = True
+    monkeypatch.setattr(orchestrator, "ws_manager", mock_ws)
+
+    orchestrator._pending_progress.update({"book-live": 30.0, "book-done": 60.0})
+    orchestrator._flush_pending_progress()
+
+    mock_ws.broadcast_download_progress_batch.assert_called_once_with(
+        {"book-live": (30.0, None)}, "downloading"
+    )
+
+
+def test_flush_pending_progress_never_goes_below_immediate_broadcast(monkeypatch):
+    import shelfmark.download.orchestrator as orchestrator
+
+    orchestrator._last_activity.clear()
+    orchestrator._last_progress_value.clear()
+    orchestrator._pending_progress.clear()
+    monkeypatch.setattr(orchestrator, "_broadcast_progress", {})
+
+    mock_queue = MagicMock()
+    mock_queue.get_task.return_value = MagicMock(user_id=None)
+    mock_queue.get_task_status.return_value = orchestrator.QueueStatus.DOWNLOADING
+    monkeypatch.setattr(orchestrator, "book_queue", mock_queue)
+
+    mock_ws = MagicMock()
+    mock_ws.is_enabled.return_value = True
+    mock_ws.has_subscribers.return_value = True
+    monkeypatch.setattr(orchestrator, "ws_manager", mock_ws)
+
+    orchestrator.update_download_progress("book-d", 99.5)
+    # A coalesced value that was still in flight when the immediate update went out
+    orchestrator._pending_progress["book-d"] = 60.0
+    orchestrator._flush_pending_progress()
+
+    mock_ws.broadcast_download_progress_batch.assert_not_called()
+    assert orchestrator._broadcast_progress["book-d"] == 99.5
+
+
+def test_update_download_status_accepts_mixed_case_and_ignores_unknown(monkeypatch):
+    import shelfmark.download.orchestrator as orchestrator
+
+    book_id = "test-status-case"
+
+    orchestrator._last_activity.clear()
+    orchestrator._last_status_event.clear()
+
+    mock_queue = MagicMock()
+    monkeypatch.setattr(orchestrator, "book_queue", mock_queue)
+    monkeypatch.setattr(orchestrator, "ws_manager", None)
+
+    orchestrator.update_download_status(book_id, "Downloading")
+    orchestrator.update_download_status(book_id, "downloading")
+    orchestrator.update_download_status(book_id, "not-a-status")
+
+    mock_queue.update_status.assert_called_once_with(book_id, orchestrator.QueueStatus.DOWNLOADING)
+
+
+def test_pop_stalled_tasks_only_returns_tasks_past_their_latest_activity(monkeypatch):
+    import shelfmark.download.orchestrator as orchestrator
+
+    monkeypatch.setattr(orchestrator, "_last_activity", {})
+    monkeypatch.setattr(orchestrator, "_stall_heap", [])
+    monkeypatch.setattr(orchestrator, "_stall_deadlines", {})
+    timeout = orchestrator.STALL_TIMEOUT
+
+    with orchestrator._progress_lock:
+        orchestrator._record_activity_locked("idle", 0.0)
+        orchestrator._record_activity_locked("busy", 0.0)
+        orchestrator._record_activity_locked("busy", 200.0)
+        orchestrator._record_activity_locked("done", 0.0)
+    orchestrator._cleanup_progress_tracking("done")
+
+    # Activity updates for a task with a pending deadline do not grow the heap.
+    assert len(orchestrator._stall_heap) == 3
+
+    active = {"idle", "busy"}
+    assert orchestrator._pop_stalled_tasks(timeout / 2, active) == []
+    assert orchestrator._pop_stalled_tasks(timeout + 1, active) == ["idle"]
+    # "busy" was rescheduled from its latest activity rather than reported.
+    assert orchestrator._stall_heap == [(200.0 + timeout, "busy")]
+    assert orchestrator._pop_stalled_tasks(timeout + 150, active) == []
+    assert orchestrator._pop_stalled_tasks(200.0 + timeout + 1, active) == ["busy"]
+    assert orchestrator._stall_heap == []
+    assert orchestrator._stall_deadlines == {}
+
+
+def test_pop_stalled_tasks_ignores_activity_recorded_after_cleanup(monkeypatch):
+    import shelfmark.download.orchestrator as orchestrator
+
+    monkeypatch.setattr(orchestrator, "_last_activity", {})
+    monkeypatch.setattr(orchestrator, "_stall_heap", [])
+    monkeypatch.setattr(orchestrator, "_stall_deadlines", {})
+    timeout = orchestrator.STALL_TIMEOUT
+
+    with orchestrator._progress_lock:
+        orchestrator._record_activity_locked("finished", 0.0)
+    orchestrator._cleanup_progress_tracking("finished")
+    # A status callback racing the worker's cleanup re-arms stall tracking.
+    with orchestrator._progress_lock:
+        orchestrator._record_activity_locked("finished", 1.0)
+
+    assert orchestrator._pop_stalled_tasks(timeout + 2, active_task_ids=set()) == []
+    assert orchestrator._stall_heap == []
+    assert orchestrator._stall_deadlines == {}
+    assert "finished" not in orchestrator._last_activity
+
+
+def test_format_download_exception_message_flags_ingest_permission_errors_by_filename():
+    import errno
+
+    import shelfmark.download.orchestrator as orchestrator
+
+    ingest_error = PermissionError(errno.EACCES, "Permission denied", "/cwa-book-ingest/book.epub")
+    other_error = PermissionError(errno.EACCES, "Permission denied", "/books/book.epub")
+
+    assert orchestrator._format_download_exception_message(ingest_error).startswith(
+        "Destination misconfigured"
+    )
+    assert orchestrator._format_download_exception_message(other_error).startswith(
+        "Permission denied:"
+    )
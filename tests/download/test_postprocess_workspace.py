@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from shelfmark.core.models import DownloadTask
+from shelfmark.download.postprocess import workspace as workspace_mod
+
+
+@pytest.fixture(autouse=True)
+def fresh_resolved_paths(monkeypatch):
+    """Start every test with an empty resolved-path cache."""
+    monkeypatch.setattr(workspace_mod, "_RESOLVED_PATHS", {})
+
+
+@pytest.fixture
+def tmp_workspace(tmp_path, monkeypatch) -> Path:
+    """Create a TMP_DIR under tmp_path and point the workspace at it."""
+    tmp_dir = tmp_path / "tmp"
+    tmp_dir.mkdir()
+    monkeypatch.setattr(workspace_mod.env_config, "TMP_DIR", tmp_dir)
+    return tmp_dir
+
+
+@pytest.fixture
+def resolve_calls(monkeypatch) -> list[Path]:
+    """Record every path Path.resolve() is called on."""
+    calls: list[Path] = []
+    original_resolve = Path.resolve
+
+    def counting_resolve(self, *args, **kwargs):
+        calls.append(self)
+        return original_resolve(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "resolve", counting_resolve)
+    return calls
+
+
+def test_is_within_tmp_dir_resolves_tmp_dir_once(tmp_path, tmp_workspace, resolve_calls) -> None:
+    tmp_dir = tmp_workspace
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    (tmp_dir / "escape").symlink_to(outside)
+
+    assert workspace_mod.is_within_tmp_dir(tmp_dir / "a.epub")
+    assert workspace_mod.is_within_tmp_dir(tmp_dir / "b.epub")
+    # Symlinks out of TMP_DIR are still rejected.
+    assert not workspace_mod.is_within_tmp_dir(tmp_dir / "escape" / "c.epub")
+
+    assert resolve_calls.count(tmp_dir) == 1
+
+
+def test_is_original_download_matches_lexically_equal_paths_without_resolving(
+    monkeypatch,
+) -> None:
+    task = DownloadTask(
+        task_id="t",
+        source="prowlarr",
+        title="Test",
+        original_download_path="/downloads/complete/Book",
+    )
+
+    def fail_resolve(self, *args, **kwargs):
+        raise AssertionError("resolve() should not be needed")
+
+    monkeypatch.setattr(Path, "resolve", fail_resolve)
+
+    assert workspace_mod._is_original_download(Path("/downloads/complete/./Book/"), task)
+
+
+def test_safe_cleanup_path_stats_each_path_once(tmp_workspace, monkeypatch) -> None:
+    tmp_dir = tmp_workspace
+    staged_dir = tmp_dir / "release"
+    staged_dir.mkdir()
+    (staged_dir / "book.epub").write_text("x", encoding="utf-8")
+    staged_file = tmp_dir / "book.epub"
+    staged_file.write_text("x", encoding="utf-8")
+
+    stat_calls: list[Path] = []
+    original_stat = Path.stat
+
+    def counting_stat(self, *args, **kwargs):
+        stat_calls.append(self)
+        return original_stat(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "stat", counting_stat)
+
+    task = DownloadTask(task_id="t", source="direct_download", title="Test")
+    workspace_mod.safe_cleanup_path(staged_dir, task)
+    workspace_mod.safe_cleanup_path(staged_file, task)
+    workspace_mod.safe_cleanup_path(tmp_dir / "missing.epub", task)
+
+    assert stat_calls.count(staged_dir) == 1
+    assert stat_calls.count(staged_file) == 1
+    assert not staged_dir.exists()
+    assert not staged_file.exists()
+
+
+def test_is_original_download_resolves_original_path_once(tmp_path, resolve_calls) -> None:
+    original = tmp_path / "complete" / "Book"
+    original.mkdir(parents=True)
+    task = DownloadTask(
+        task_id="t",
+        source="prowlarr",
+        title="Test",
+        original_download_path=str(original),
+    )
+
+    assert not workspace_mod._is_original_download(tmp_path / "staging" / "a.epub", task)
+    assert not workspace_mod._is_original_download(tmp_path / "staging" / "b.epub", task)
+    assert workspace_mod._is_original_download(original / ".." / "Book", task)
+
+    assert resolve_calls.count(original) == 1
+
+
+def test_cleanup_output_staging_removes_every_cleanup_path(tmp_path, tmp_workspace) -> None:
+    from shelfmark.download.postprocess.types import OutputPlan
+    from shelfmark.download.staging import STAGE_NONE
+
+    tmp_dir = tmp_workspace
+    extract_dir = tmp_dir / "extract"
+    extract_dir.mkdir()
+    (extract_dir / "book.epub").write_text("x", encoding="utf-8")
+    archives = [tmp_dir / f"part{i}.zip" for i in range(5)]
+    for archive in archives:
+        archive.write_text("x", encoding="utf-8")
+    outside = tmp_path / "library" / "book.epub"
+    outside.parent.mkdir()
+    outside.write_text("x", encoding="utf-8")
+
+    plan = OutputPlan(
+        mode="folder",
+        stage_action=STAGE_NONE,
+        staging_dir=tmp_dir,
+        allow_archive_extraction=True,
+    )
+    task = DownloadTask(task_id="t", source="direct_download", title="Test")
+
+    workspace_mod.cleanup_output_staging(
+        plan,
+        tmp_dir / "download.zip",
+        task,
+        [extract_dir, extract_dir / "book.epub", *archives, outside],
+    )
+
+    assert not extract_dir.exists()
+    assert not any(archive.exists() for archive in archives)
+    # Paths outside TMP_DIR are never removed.
+    assert outside.exists()
+
+
+@pytest.mark.usefixtures("tmp_workspace")
+def test_is_within_tmp_dir_rejects_relative_paths_outside_tmp_without_resolving(
+    tmp_path, resolve_calls, monkeypatch
+) -> None:
+    workdir = tmp_path / "work"
+    workdir.mkdir()
+    monkeypatch.chdir(workdir)
+
+    assert not workspace_mod.is_within_tmp_dir(Path("book.epub"))
+    assert resolve_calls == []
+    # A relative path that does lead into TMP_DIR is still checked for real.
+    assert workspace_mod.is_within_tmp_dir(Path("../tmp/book.epub"))
@@ -1,3 +1,6 @@
+import json
+import os
+
 from shelfmark.release_sources import Release
 from shelfmark.release_sources.irc import cache
 
@@ -28,3 +31,222 @@ def test_cache_results_round_trip_by_query_identity(monkeypatch):
 
     # A different query identity is isolated.
     assert cache.get_cached_results("irc.example.net:ebooks:other query", ttl_seconds=60) is None
+
+
+def test_load_cache_reuses_parsed_file_until_it_changes(monkeypatch, tmp_path):
+    cache_file = tmp_path / "irc_cache.json"
+    monkeypatch.setattr(cache, "CACHE_FILE", cache_file)
+    monkeypatch.setattr(cache, "_cache_data", None)
+    monkeypatch.setattr(cache, "_cache_mtime_ns", None)
+
+    release = Release(source="irc", source_id="one", title="Title", format="epub")
+    cache.cache_results("server:channel:title", "title", [release])
+    cache._flush_cache()
+
+    read_calls = []
+    original_read_bytes = type(cache_file).read_bytes
+
+    def _counting_read_bytes(path):
+        read_calls.append(path)
+        return original_read_bytes(path)
+
+    monkeypatch.setattr(type(cache_file), "read_bytes", _counting_read_bytes)
+
+    first = cache.get_cached_results("server:channel:title", ttl_seconds=60)
+    first["releases"][0].extra["mutated"] = True
+    second = cache.get_cached_results("server:channel:title", ttl_seconds=60)
+    assert read_calls == []
+    assert second["releases"][0].extra == {}
+
+    # An external rewrite (new mtime) is picked up on the next access.
+    cache_file.write_text('{"entries": {}, "version": 1}')
+    stat = cache_file.stat()
+    os.utime(cache_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert cache.get_cached_results("server:channel:title", ttl_seconds=60) is None
+    assert read_calls == [cache_file]
+
+
+def test_save_cache_replaces_file_atomically(monkeypatch, tmp_path):
+    cache_file = tmp_path / "irc_cache.json"
+    cache_file.write_text('{"entries": {"old": {}}, "version": 1}')
+    monkeypatch.setattr(cache, "CACHE_FILE", cache_file)
+    monkeypatch.setattr(cache, "_cache_data", None)
+    monkeypatch.setattr(cache, "_cache_mtime_ns", None)
+
+    def _fail_replace(self, target):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(type(cache_file), "replace", _fail_replace)
+    assert cache._write_cache_file('{"entries": {}, "version": 1}') is None
+
+    # A failed write leaves the previous file intact and no temp file behind.
+    assert cache_file.read_text() == '{"entries": {"old": {}}, "version": 1}'
+    assert list(tmp_path.iterdir()) == [cache_file]
+
+
+def test_release_to_dict_round_trips_without_aliasing_extra():
+    from shelfmark.release_sources import ReleaseProtocol
+
+    release = Release(
+        source="irc",
+        source_id="one",
+        title="Title",
+        format="epub",
+        protocol=ReleaseProtocol.DCC,
+        extra={"bot": "Search", "files": ["a.epub"]},
+    )
+
+    data = cache._release_to_dict(release)
+    release.extra["files"].append("b.epub")
+
+    assert data["protocol"] == "dcc"
+    assert data["extra"] == {"bot": "Search", "files": ["a.epub"]}
+    assert cache._dict_to_release(data) == Release(
+        source="irc",
+        source_id="one",
+        title="Title",
+        format="epub",
+        protocol=ReleaseProtocol.DCC,
+        extra={"bot": "Search", "files": ["a.epub"]},
+    )
+
+
+def test_cache_results_coalesces_writes_until_flush(monkeypatch, tmp_path):
+    cache_file = tmp_path / "irc_cache.json"
+    monkeypatch.setattr(cache, "CACHE_FILE", cache_file)
+    monkeypatch.setattr(cache, "_cache_data", None)
+    monkeypatch.setattr(cache, "_cache_mtime_ns", None)
+    monkeypatch.setattr(cache, "SAVE_DELAY_SECONDS", 60)
+
+    first = Release(source="irc", source_id="one", title="One", format="epub")
+    second = Release(source="irc", source_id="two", title="Two", format="epub")
+    cache.cache_results("server:channel:one", "one", [first])
+    cache.cache_results("server:channel:two", "two", [second])
+
+    # Nothing is written yet, but reads see the pending entries.
+    assert not cache_file.exists()
+    assert cache.get_cached_results("server:channel:two", ttl_seconds=60) is not None
+
+    cache._flush_cache()
+
+    assert cache._flush_timer is None
+    written = json.loads(cache_file.read_text())
+    assert set(written["entries"]) == {"server:channel:one", "server:channel:two"}
+
+
+def test_flush_cache_does_not_hold_cache_lock_while_writing(monkeypatch, tmp_path):
+    cache_file = tmp_path / "irc_cache.json"
+    monkeypatch.setattr(cache, "CACHE_FILE", cache_file)
+    monkeypatch.setattr(cache, "_cache_data", None)
+    monkeypatch.setattr(cache, "_cache_mtime_ns", None)
+    monkeypatch.setattr(cache, "SAVE_DELAY_SECONDS", 60)
+
+    release = Release(source="irc", source_id="one", title="One", format="epub")
+    cache.cache_results("server:channel:one", "one", [release])
+
+    lock_held_during_write = []
+    original_write = cache._write_cache_file
+
+    def _recording_write(payload):
+        lock_held_during_write.append(cache._cache_lock.locked())
+        return original_write(payload)
+
+    monkeypatch.setattr(cache, "_write_cache_file", _recording_write)
+    cache._flush_cache()
+
+    assert lock_held_during_write == [False]
+    assert cache._cache_dirty is False
+    assert "server:channel:one" in json.loads(cache_file.read_text())["entries"]
+
+
+def test_failed_flush_schedules_its_own_retry(monkeypatch, tmp_path):
+    cache_file = tmp_path / "irc_cache.json"
+    monkeypatch.setattr(cache, "CACHE_FILE", cache_file)
+    monkeypatch.setattr(cache, "_cache_data", None)
+    monkeypatch.setattr(cache, "_cache_mtime_ns", None)
+    monkeypatch.setattr(cache, "SAVE_DELAY_SECONDS", 60)
+    monkeypatch.setattr(cache, "SAVE_RETRY_DELAY_SECONDS", 60)
+
+    release = Release(source="irc", source_id="one", title="One", format="epub")
+    cache.cache_results("server:channel:one", "one", [release])
+
+    original_write = cache._write_cache_file
+    monkeypatch.setattr(cache, "_write_cache_file", lambda _payload: None)
+    cache._flush_cache()
+
+    assert cache._cache_dirty is True
+    assert cache._flush_timer is not None
+    assert not cache_file.exists()
+
+    # The retry timer writes the pending entries without another cache_results call.
+    monkeypatch.setattr(cache, "_write_cache_file", original_write)
+    cache._flush_cache()
+
+    assert cache._flush_timer is None
+    assert "server:channel:one" in json.loads(cache_file.read_text())["entries"]
+
+
+def test_cache_results_drops_expired_entries(monkeypatch):
+    now = 1_000_000.0
+    state = {
+        "entries": {
+            "old": {"title": "old", "releases": [], "cached_at": now - 120},
+            "fresh": {"title": "fresh", "releases": [], "cached_at": now - 30},
+        },
+        "version": 1,
+    }
+
+    monkeypatch.setattr(cache, "_load_cache", lambda: state)
+    monkeypatch.setattr(cache, "_save_cache", lambda _cache: None)
+    monkeypatch.setattr(cache, "_configured_cache_ttl", lambda: 60)
+    monkeypatch.setattr(cache.time, "time", lambda: now)
+
+    cache.cache_results("new", "new", [])
+
+    assert set(state["entries"]) == {"fresh", "new"}
+
+
+def test_cleanup_expired_keeps_fresh_entries_and_skips_noop_saves(monkeypatch):
+    now = 1_000_000.0
+    state = {
+        "entries": {
+            "old": {"title": "old", "releases": [], "cached_at": now - 120},
+            "fresh": {"title": "fresh", "releases": [], "cached_at": now - 30},
+        },
+        "version": 1,
+    }
+    saves = []
+
+    monkeypatch.setattr(cache, "_load_cache", lambda: state)
+    monkeypatch.setattr(cache, "_save_cache", saves.append)
+    monkeypatch.setattr(cache.time, "time", lambda: now)
+
+    assert cache.cleanup_expired(ttl_seconds=60) == 1
+    assert set(state["entries"]) == {"fresh"}
+    assert cache.cleanup_expired(ttl_seconds=60) == 0
+    assert len(saves) == 1
+
+
+def test_empty_answers_expire_after_the_short_empty_results_ttl(monkeypatch):
+    now = 1_000_000.0
+    stale = now - cache.EMPTY_RESULTS_CACHE_TTL - 1
+    release = {"source": "irc", "source_id": "line", "title": "Found"}
+    state = {
+        "entries": {
+            "empty": {"title": "empty", "releases": [], "cached_at": stale},
+            "found": {"title": "found", "releases": [release], "cached_at": stale},
+        },
+        "version": 1,
+    }
+
+    monkeypatch.setattr(cache, "_load_cache", lambda: state)
+    monkeypatch.setattr(cache, "_save_cache", lambda _cache: None)
+    monkeypatch.setattr(cache.time, "time", lambda: now)
+
+    # Even a TTL of 0 (never expire) only applies to answers that found something.
+    for ttl_seconds in (cache.DEFAULT_CACHE_TTL, 0):
+        assert cache.get_cached_results("empty", ttl_seconds=ttl_seconds) is None
+        assert cache.get_cached_results("found", ttl_seconds=ttl_seconds) is not None
+
+    assert cache.cleanup_expired(ttl_seconds=0) == 1
+    assert set(state["entries"]) == {"found"}
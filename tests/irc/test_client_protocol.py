@@ -0,0 +1,182 @@
+from types import SimpleNamespace
+
+import pytest
+
+from shelfmark.release_sources.irc import client as client_mod
+from shelfmark.release_sources.irc.client import IRCClient, IRCConnectionError, IRCEvent
+
+
+def _client() -> IRCClient:
+    return IRCClient(nick="reader", server="irc.example.test", port=6697)
+
+
+@pytest.mark.parametrize(
+    ("line", "expected"),
+    [
+        (
+            ':Bot!u@h PRIVMSG reader :\x01DCC SEND "x_results_for_book.zip" 1 2 3\x01',
+            IRCEvent.SEARCH_RESULT,
+        ),
+        (':Bot!u@h PRIVMSG reader :\x01DCC SEND "book.epub" 1 2 3\x01', IRCEvent.BOOK_RESULT),
+        (":Bot!u@h NOTICE reader :Sorry, nothing matches", IRCEvent.NO_RESULTS),
+        (":Bot!u@h NOTICE reader :Please try another server", IRCEvent.BAD_SERVER),
+        (":Bot!u@h NOTICE reader :Your search has been accepted", IRCEvent.SEARCH_ACCEPTED),
+        (":Bot!u@h NOTICE reader :Search returned 12 matches", IRCEvent.MATCHES_FOUND),
+        (":Bot!u@h NOTICE reader", IRCEvent.MESSAGE),
+        (":Bot!u@h PRIVMSG #books :Sorry, 12 matches", IRCEvent.MESSAGE),
+        (":irc.example.test 353 reader = #books :@Bot", IRCEvent.SERVER_LIST),
+        ("PING :irc.example.test", IRCEvent.PING),
+        (":Someone!u@h PRIVMSG reader :\x01VERSION\x01", IRCEvent.VERSION),
+        (":Someone!u@h PRIVMSG #books :hello", IRCEvent.MESSAGE),
+        (":Someone!u@h PRIVMSG #books :can a bot DCC SEND it?", IRCEvent.MESSAGE),
+        (":Someone!u@h PRIVMSG #books :that NOTICE said Sorry", IRCEvent.MESSAGE),
+    ],
+)
+def test_parse_message_classifies_events(line: str, expected: IRCEvent) -> None:
+    assert _client()._parse_message(line).event is expected
+
+
+class _ScriptedSocket:
+    """A socket that returns queued recv chunks, then reports the connection closed."""
+
+    def __init__(self, chunks: list[bytes]) -> None:
+        self.chunks = list(chunks)
+        self.sent: list[bytes] = []
+        self.options: dict[tuple[int, int], int] = {}
+
+    def gettimeout(self) -> float | None:
+        return 300.0
+
+    def settimeout(self, _value: float | None) -> None:
+        pass
+
+    def recv(self, _bufsize: int) -> bytes:
+        return self.chunks.pop(0) if self.chunks else b""
+
+    def connect(self, _address: tuple[str, int]) -> None:
+        pass
+
+    def setsockopt(self, level: int, option: int, value: int) -> None:
+        self.options[level, option] = value
+
+    def sendall(self, data: bytes) -> None:
+        self.sent.append(data)
+
+
+def test_recv_lines_splits_buffered_bytes_into_lines() -> None:
+    client = _client()
+    snowman = "\N{SNOWMAN}".encode()
+    client._socket = _ScriptedSocket(
+        [
+            b"PING :a\r\n\r\n:Bot NOTICE reader :one\r\n:Bot NOTICE reader :",
+            snowman[:1],
+            snowman[1:] + b"\r\n",
+        ]
+    )
+
+    assert list(client._recv_lines()) == [
+        "PING :a",
+        ":Bot NOTICE reader :one",
+        ":Bot NOTICE reader :\N{SNOWMAN}",
+    ]
+    assert client._buffer == bytearray()
+
+
+def test_connect_sends_registration_in_one_write(monkeypatch) -> None:
+    sock = _ScriptedSocket([b":irc.example.test 001 reader :Welcome\r\n"])
+    monkeypatch.setattr(client_mod.socket, "socket", lambda *_args: sock)
+    client = IRCClient(nick="reader", server="irc.example.test", port=6667, use_tls=False)
+
+    client.connect()
+
+    assert client.is_connected
+    assert sock.sent == [b"USER reader 0 * :reader\r\nNICK reader\r\n"]
+    assert sock.options[client_mod.socket.IPPROTO_TCP, client_mod.socket.TCP_NODELAY] == 1
+
+
+def test_connect_matches_reply_codes_on_the_command_only(monkeypatch) -> None:
+    sock = _ScriptedSocket(
+        [
+            b":irc.example.test NOTICE * :Waiting for 001 after ident lookup\r\n",
+            b":irc.example.test 433 * reader :Nickname is already in use\r\n",
+        ]
+    )
+    monkeypatch.setattr(client_mod.socket, "socket", lambda *_args: sock)
+    client = IRCClient(nick="reader", server="irc.example.test", port=6667, use_tls=False)
+
+    with pytest.raises(IRCConnectionError, match="already in use"):
+        client.connect()
+
+
+@pytest.mark.parametrize(
+    ("line", "prefix", "command", "params", "trailing"),
+    [
+        (":nick!u@h PRIVMSG #books :hi :there", "nick!u@h", "PRIVMSG", ["#books"], "hi :there"),
+        ("PING :irc.example.test", None, "PING", [], "irc.example.test"),
+        (
+            ":irc.example.test 366 reader #books",
+            "irc.example.test",
+            "366",
+            ["reader", "#books"],
+            None,
+        ),
+        (":lonely", None, ":lonely", [], None),
+        ("", None, "", [], None),
+    ],
+)
+def test_parse_message_splits_prefix_command_params_and_trailing(
+    line: str, prefix: str | None, command: str, params: list[str], trailing: str | None
+) -> None:
+    msg = _client()._parse_message(line)
+
+    assert (msg.raw, msg.prefix, msg.command, msg.params, msg.trailing) == (
+        line,
+        prefix,
+        command,
+        params,
+        trailing,
+    )
+
+
+def test_parse_names_list_keeps_only_elevated_users() -> None:
+    client = _client()
+
+    client._parse_names_list(":irc.example.test 353 reader = #books :@Bot +Voiced reader ~Owner")
+
+    assert client.online_servers == {"Bot", "Voiced", "Owner"}
+
+
+class _ClockedSilentSocket(_ScriptedSocket):
+    """A socket whose recv always blocks for its full timeout on a fake clock."""
+
+    def __init__(self, clock: SimpleNamespace) -> None:
+        super().__init__([])
+        self.clock = clock
+        self.timeout = 300.0
+        self.recv_timeouts: list[float] = []
+
+    def settimeout(self, value: float | None) -> None:
+        self.timeout = value
+
+    def recv(self, _bufsize: int) -> bytes:
+        self.recv_timeouts.append(self.timeout)
+        self.clock.now += self.timeout
+        raise TimeoutError
+
+
+def test_connect_waits_for_welcome_in_a_single_deadline_bound_recv(monkeypatch) -> None:
+    clock = SimpleNamespace(now=0.0)
+    clock.monotonic = lambda: clock.now
+    sock = _ClockedSilentSocket(clock)
+    monkeypatch.setattr(client_mod, "time", clock)
+    monkeypatch.setattr(client_mod.socket, "socket", lambda *_args: sock)
+    client = IRCClient(nick="reader", server="irc.example.test", port=6667, use_tls=False)
+
+    with pytest.raises(IRCConnectionError, match="Timeout waiting"):
+        client.connect()
+
+    assert sock.recv_timeouts == [30.0]
+
+
+def test_parsed_messages_have_no_instance_dict() -> None:
+    assert not hasattr(_client()._parse_message("PING :x"), "__dict__")
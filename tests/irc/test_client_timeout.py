@@ -55,7 +55,7 @@ def test_recv_lines_caps_socket_timeout_at_the_deadline() -> None:
     client._socket = sock
     client._connected = True
 
-    lines = list(client._recv_lines(deadline=time.time() + 0.05))
+    lines = list(client._recv_lines(deadline=time.monotonic() + 0.05))
 
     assert lines == []
     # Never waits past the deadline on a single recv
@@ -2,10 +2,12 @@ import socket
 
 import pytest
 
+from shelfmark.release_sources.irc import dcc as dcc_mod
 from shelfmark.release_sources.irc.dcc import (
     DCCOffer,
     DCCParseError,
     DCCSecurityError,
+    DCCSizeError,
     download_dcc,
     parse_dcc_send,
     safe_dcc_filename,
@@ -61,6 +63,34 @@ def test_validate_dcc_endpoint_allows_public_endpoint() -> None:
     validate_dcc_endpoint(DCCOffer(filename="book.epub", ip="8.8.8.8", port=443, size=1))
 
 
+def test_parse_dcc_send_formats_ip_integer_as_dotted_quad() -> None:
+    offer = parse_dcc_send('DCC SEND "book.epub" 134744072 443 1')
+
+    assert offer.ip == "8.8.8.8"
+
+
+def test_parse_dcc_send_reads_ctcp_wrapped_offer_with_spaced_filename() -> None:
+    offer = parse_dcc_send(
+        ':Bot!u@h PRIVMSG reader :\x01DCC SEND "Author - My Book.epub" 134744072 443 2048\x01'
+    )
+
+    assert offer == DCCOffer(filename="Author - My Book.epub", ip="8.8.8.8", port=443, size=2048)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "PRIVMSG reader :hello",
+        'DCC SEND "book.epub" 134744072 443',
+        'DCC SEND "book.epub" 134744072 443 big',
+        'DCC SEND "" 134744072 443 1',
+    ],
+)
+def test_parse_dcc_send_rejects_malformed_offers(text: str) -> None:
+    with pytest.raises(DCCParseError):
+        parse_dcc_send(text)
+
+
 def test_parse_dcc_send_rejects_out_of_range_ip_integer() -> None:
     with pytest.raises(DCCParseError):
         parse_dcc_send('DCC SEND "book.epub" 999999999999999999 443 1')
@@ -80,3 +110,85 @@ def test_download_dcc_rejects_private_endpoint_before_socket_connect(
             DCCOffer(filename="book.epub", ip="127.0.0.1", port=1234, size=1),
             tmp_path / "book.epub",
         )
+
+
+class _StreamingSocket:
+    """A connected socket that delivers a payload in fixed-size pieces."""
+
+    def __init__(self, payload: bytes, piece_size: int) -> None:
+        self.payload = payload
+        self.piece_size = piece_size
+        self.closed = False
+
+    def settimeout(self, _value: float) -> None:
+        pass
+
+    def connect(self, _address: tuple[str, int]) -> None:
+        pass
+
+    def recv_into(self, buffer: memoryview) -> int:
+        piece = self.payload[: min(self.piece_size, len(buffer))]
+        self.payload = self.payload[len(piece) :]
+        buffer[: len(piece)] = piece
+        return len(piece)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def test_download_dcc_writes_every_received_chunk(monkeypatch, tmp_path) -> None:
+    payload = bytes(range(256)) * 1000
+    sock = _StreamingSocket(payload, piece_size=7000)
+    monkeypatch.setattr(socket, "socket", lambda *_args: sock)
+    dest = tmp_path / "book.epub"
+
+    download_dcc(
+        DCCOffer(filename="book.epub", ip="8.8.8.8", port=1234, size=len(payload)),
+        dest,
+    )
+
+    assert dest.read_bytes() == payload
+    assert sock.closed
+
+
+def test_download_dcc_reports_each_whole_percent_once(monkeypatch, tmp_path) -> None:
+    payload = b"x" * 1000
+    monkeypatch.setattr(socket, "socket", lambda *_args: _StreamingSocket(payload, piece_size=3))
+    reported: list[float] = []
+
+    download_dcc(
+        DCCOffer(filename="book.epub", ip="8.8.8.8", port=1234, size=len(payload)),
+        tmp_path / "book.epub",
+        progress_callback=reported.append,
+    )
+
+    assert reported == list(range(101))
+
+
+def test_download_dcc_writes_transfers_larger_than_write_buffer(monkeypatch, tmp_path) -> None:
+    payload = bytes(range(256)) * 8192
+    assert len(payload) > dcc_mod.WRITE_BUFFER_SIZE
+    sock = _StreamingSocket(payload, piece_size=70000)
+    monkeypatch.setattr(socket, "socket", lambda *_args: sock)
+    dest = tmp_path / "book.epub"
+
+    download_dcc(
+        DCCOffer(filename="book.epub", ip="8.8.8.8", port=1234, size=len(payload)),
+        dest,
+    )
+
+    assert dest.read_bytes() == payload
+
+
+def test_download_dcc_keeps_only_received_bytes_when_sender_stops_early(
+    monkeypatch, tmp_path
+) -> None:
+    size = dcc_mod.WRITE_BUFFER_SIZE * 2
+    payload = b"x" * (size // 2)
+    monkeypatch.setattr(socket, "socket", lambda *_args: _StreamingSocket(payload, 4096))
+    dest = tmp_path / "book.epub"
+
+    with pytest.raises(DCCSizeError):
+        download_dcc(DCCOffer(filename="book.epub", ip="8.8.8.8", port=1234, size=size), dest)
+
+    assert dest.read_bytes() == payload
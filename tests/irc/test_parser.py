@@ -1,3 +1,5 @@
+import zipfile
+
 from shelfmark.release_sources.irc import parser
 
 
@@ -40,3 +42,67 @@ def test_parse_results_file_uses_book_format_settings_for_ebooks(monkeypatch):
     results = parser.parse_results_file(content, content_type="ebook")
 
     assert [result.format for result in results] == ["epub"]
+
+
+def test_parse_result_line_fallback_detects_and_strips_known_format():
+    result = parser.parse_result_line("!BookBot Great Book.AZW3 [retail]")
+
+    assert result is not None
+    assert result.format == "azw3"
+    assert result.title == "Great Book [retail]"
+
+
+def test_parse_result_line_fallback_ignores_unknown_extension():
+    result = parser.parse_result_line("!BookBot Great Book.epubx [retail]")
+
+    assert result is not None
+    assert result.format == "unknown"
+    assert result.title == "Great Book.epubx [retail]"
+
+
+def test_extract_results_from_zip_streams_decoded_lines(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        parser.config, "get", lambda key, default=None: {"SUPPORTED_FORMATS": ["epub"]}.get(key)
+    )
+    zip_path = tmp_path / "results.zip"
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        zf.writestr(
+            "SearchBot_results_for_book.txt",
+            "!BookBot Zoë Author - Utf Book.epub ::INFO:: 1MB\r\n".encode()
+            + "!BookBot Ren\xe9e Author - Latin Book.epub ::INFO:: 2MB\r\n".encode("latin-1"),
+        )
+
+    lines = parser.extract_results_from_zip(zip_path)
+    results = parser.parse_results_file(lines, content_type="ebook")
+
+    assert [result.author for result in results] == ["Zoë Author", "Renée Author"]
+
+
+def test_extract_results_from_text_decodes_each_line_like_zip_members(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        parser.config, "get", lambda key, default=None: {"SUPPORTED_FORMATS": ["epub"]}.get(key)
+    )
+    text_path = tmp_path / "results.txt"
+    text_path.write_bytes(
+        "!BookBot Zoë Author - Utf Book.epub ::INFO:: 1MB\r\n".encode()
+        + "!BookBot Ren\xe9e Author - Latin Book.epub ::INFO:: 2MB\r\n".encode("latin-1")
+    )
+
+    lines = parser.extract_results_from_text(text_path)
+    results = parser.parse_results_file(lines, content_type="ebook")
+
+    assert [result.author for result in results] == ["Zoë Author", "Renée Author"]
+
+
+def test_supported_formats_are_renormalized_only_when_config_changes(monkeypatch):
+    values = {"SUPPORTED_FORMATS": [" EPUB ", "mobi"]}
+    monkeypatch.setattr(parser.config, "get", lambda key, default=None: values.get(key, default))
+    monkeypatch.setattr(parser, "_supported_formats_cache", {})
+
+    first = parser._get_supported_formats("ebook")
+    assert parser._get_supported_formats("ebook") is first
+    assert first == {"epub", "mobi"}
+
+    values["SUPPORTED_FORMATS"] = ["azw3"]
+
+    assert parser._get_supported_formats("ebook") == {"azw3"}
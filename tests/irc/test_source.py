@@ -1,6 +1,8 @@
 import time
 from types import SimpleNamespace
 
+import pytest
+
 from shelfmark.metadata_providers import BookMetadata
 from shelfmark.release_sources import Release
 from shelfmark.release_sources.irc.parser import SearchResult
@@ -36,6 +38,109 @@ def test_convert_to_releases_marks_audiobook_results_and_sorts_audio_before_arch
     assert all(release.content_type == "audiobook" for release in releases)
 
 
+def test_convert_to_releases_sorts_online_then_format_then_server_keeping_ties_in_order():
+    source = IRCReleaseSource()
+    source._online_servers = {"Online"}
+
+    def result(server, title, fmt):
+        return SearchResult(
+            server=server,
+            author="Author",
+            title=title,
+            format=fmt,
+            size=None,
+            full_line=f"!{server} Author - {title}.{fmt}",
+        )
+
+    releases = source._convert_to_releases(
+        [
+            result("beta", "Offline B", "epub"),
+            result("Alpha", "Offline A", "epub"),
+            result("Online", "Online Mobi", "mobi"),
+            result("Online", "Online Epub 1", "EPUB"),
+            result("Online", "Online Epub 2", "epub"),
+        ]
+    )
+
+    assert [release.title for release in releases] == [
+        "Online Epub 1",
+        "Online Epub 2",
+        "Online Mobi",
+        "Offline A",
+        "Offline B",
+    ]
+
+
+def test_convert_to_releases_matches_online_servers_case_insensitively():
+    source = IRCReleaseSource()
+    source._online_servers = {"BookBot"}
+
+    releases = source._convert_to_releases(
+        [
+            SearchResult(
+                server=server,
+                author="Author",
+                title=title,
+                format="epub",
+                size=None,
+                full_line=f"!{server} Author - {title}.epub",
+            )
+            for server, title in [("Alpha", "Offline"), ("bookbot", "Online")]
+        ]
+    )
+
+    assert [release.title for release in releases] == ["Online", "Offline"]
+
+
+def test_convert_to_releases_builds_slotted_releases_with_plain_extra():
+    source = IRCReleaseSource()
+    source._online_servers = set()
+
+    (release,) = source._convert_to_releases(
+        [
+            SearchResult(
+                server="Bot",
+                author="Author",
+                title="Title",
+                format="epub",
+                size="1MB",
+                full_line="!Bot Author - Title.epub ::INFO:: 1MB",
+            )
+        ]
+    )
+
+    assert not hasattr(release, "__dict__")
+    assert release.extra == {
+        "server": "Bot",
+        "author": "Author",
+        "full_line": "!Bot Author - Title.epub ::INFO:: 1MB",
+    }
+
+
+def test_convert_to_releases_shares_one_indexer_label_per_server():
+    source = IRCReleaseSource()
+    source._online_servers = set()
+
+    releases = source._convert_to_releases(
+        [
+            SearchResult(
+                server=server,
+                author="Author",
+                title=title,
+                format="epub",
+                size=None,
+                full_line=f"!{server} Author - {title}.epub",
+            )
+            for server, title in [("Bot", "One"), ("Other", "Two"), ("Bot", "Three")]
+        ]
+    )
+
+    by_title = {release.title: release for release in releases}
+    assert by_title["One"].indexer == "IRC:Bot"
+    assert by_title["One"].indexer is by_title["Three"].indexer
+    assert by_title["Two"].indexer == "IRC:Other"
+
+
 def test_search_uses_cached_results_without_opening_a_connection(monkeypatch):
     import shelfmark.release_sources.irc.source as irc_source
 
@@ -46,7 +151,6 @@ def test_search_uses_cached_results_without_opening_a_connection(monkeypatch):
         title="Cached Result",
     )
 
-    monkeypatch.setattr(source, "is_available", lambda: True)
     monkeypatch.setattr(
         irc_source,
         "_config_text",
@@ -116,7 +220,6 @@ def test_search_no_dcc_offer_releases_connection_and_caches_empty_result(monkeyp
     # Ensure no leftover send budget from a previous test blocks the send.
     irc_source._recent_message_sends.clear()
 
-    monkeypatch.setattr(source, "is_available", lambda: True)
     monkeypatch.setattr(irc_source, "_enforce_rate_limit", lambda: None)
     monkeypatch.setattr(irc_source, "_emit_status", lambda *_args, **_kwargs: None)
     monkeypatch.setattr(
@@ -197,7 +300,6 @@ def test_audiobook_search_routes_to_configured_audiobook_channel_and_bot(monkeyp
     )
     irc_source._recent_message_sends.clear()
 
-    monkeypatch.setattr(source, "is_available", lambda: True)
     monkeypatch.setattr(irc_source, "_enforce_rate_limit", lambda: None)
     monkeypatch.setattr(irc_source, "_emit_status", lambda *_args, **_kwargs: None)
     monkeypatch.setattr(
@@ -271,7 +373,6 @@ def test_audiobook_search_reuses_main_bot_when_only_channel_configured(monkeypat
     )
     irc_source._recent_message_sends.clear()
 
-    monkeypatch.setattr(source, "is_available", lambda: True)
     monkeypatch.setattr(irc_source, "_enforce_rate_limit", lambda: None)
     monkeypatch.setattr(irc_source, "_emit_status", lambda *_args, **_kwargs: None)
     monkeypatch.setattr(
@@ -306,8 +407,6 @@ def test_search_without_search_bot_never_posts_to_channel(monkeypatch):
 
     source = IRCReleaseSource()
 
-    # Force is_available True so we exercise the in-search guard (defense in depth).
-    monkeypatch.setattr(source, "is_available", lambda: True)
     monkeypatch.setattr(irc_source, "_emit_status", lambda *_args, **_kwargs: None)
     monkeypatch.setattr(irc_source, "_enforce_rate_limit", lambda: None)
     monkeypatch.setattr(
@@ -337,6 +436,22 @@ def test_search_without_search_bot_never_posts_to_channel(monkeypatch):
     assert source.search(book, plan) == []
 
 
+def test_enforce_rate_limit_spaces_back_to_back_searches(monkeypatch):
+    """Searches arriving together each get their own slot, MIN_SEARCH_INTERVAL apart."""
+    import shelfmark.release_sources.irc.source as irc_source
+
+    sleeps = []
+    fake_time = SimpleNamespace(monotonic=lambda: 1000.0, sleep=sleeps.append)
+    monkeypatch.setattr(irc_source, "time", fake_time)
+    monkeypatch.setattr(irc_source, "_last_search_time", float("-inf"))
+
+    for _ in range(3):
+        irc_source._enforce_rate_limit()
+
+    interval = irc_source.MIN_SEARCH_INTERVAL
+    assert sleeps == [interval, 2 * interval]
+
+
 def test_recent_send_count_caps_and_windows():
     """The send budget counts identical queries and prunes entries outside the window."""
     import shelfmark.release_sources.irc.source as irc_source
@@ -366,7 +481,6 @@ def test_search_send_budget_blocks_repost_and_returns_cache(monkeypatch):
     source = IRCReleaseSource()
     cached_release = Release(source="irc", source_id="cached-line", title="Cached Result")
 
-    monkeypatch.setattr(source, "is_available", lambda: True)
     monkeypatch.setattr(irc_source, "_emit_status", lambda *_args, **_kwargs: None)
     monkeypatch.setattr(irc_source, "_enforce_rate_limit", lambda: None)
     monkeypatch.setattr(
@@ -407,3 +521,141 @@ def test_search_send_budget_blocks_repost_and_returns_cache(monkeypatch):
 
     assert releases == [cached_release]
     assert source._online_servers == {"AudioBot"}
+
+
+@pytest.mark.parametrize(
+    ("size", "expected"),
+    [
+        ("1.5MB", 1572864),
+        (" 500 k ", 512000),
+        ("2gb", 2 * 1024**3),
+        ("1TB", 1024**4),
+        ("12B", 12),
+        ("4096", 4096),
+        ("", None),
+        ("1.2.3MB", None),
+        ("about 5MB", None),
+    ],
+)
+def test_parse_size_reads_human_readable_sizes(size, expected):
+    assert IRCReleaseSource._parse_size(size) == expected
+
+
+def test_parse_size_reuses_parsed_value_for_repeated_strings():
+    from shelfmark.release_sources.irc.source import _parse_size_bytes
+
+    _parse_size_bytes.cache_clear()
+
+    assert [IRCReleaseSource._parse_size("750KB") for _ in range(3)] == [768000] * 3
+    assert _parse_size_bytes.cache_info().misses == 1
+
+
+def test_results_dir_is_created_once_and_recreated_if_removed(tmp_path, monkeypatch):
+    import shelfmark.release_sources.irc.source as irc_source
+
+    registered: list[tuple] = []
+    monkeypatch.setattr(irc_source, "_results_dir", None)
+    monkeypatch.setattr(irc_source.tempfile, "tempdir", str(tmp_path))
+    monkeypatch.setattr(
+        irc_source.atexit, "register", lambda *args, **kwargs: registered.append(args)
+    )
+
+    results_dir = irc_source._get_results_dir()
+    assert results_dir.parent == tmp_path
+    assert irc_source._get_results_dir() == results_dir
+
+    results_dir.rmdir()
+    assert irc_source._get_results_dir() == results_dir
+    assert results_dir.is_dir()
+    assert len(registered) == 1
+
+
+def test_search_reads_each_irc_setting_once(monkeypatch):
+    import shelfmark.release_sources.irc.source as irc_source
+
+    reads: list[str] = []
+    settings = {
+        "IRC_SERVER": "irc.example.net",
+        "IRC_CHANNEL": "ebooks",
+        "IRC_NICK": "tester",
+        "IRC_SEARCH_BOT": "search",
+    }
+
+    def config_text(key):
+        reads.append(key)
+        return settings.get(key, "")
+
+    monkeypatch.setattr(irc_source, "_config_text", config_text)
+    monkeypatch.setattr(irc_source, "_emit_status", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr(
+        "shelfmark.release_sources.irc.cache.get_cached_results",
+        lambda cache_key, *_args, **_kwargs: {"releases": [], "online_servers": []},
+    )
+
+    book = BookMetadata(provider="hardcover", provider_id="once", title="Once")
+    IRCReleaseSource().search(book, SimpleNamespace(primary_query="Once"))
+
+    assert sorted(reads) == sorted(settings)
+
+
+def test_search_releases_connection_before_parsing_and_never_closes_it(tmp_path, monkeypatch):
+    import shelfmark.release_sources.irc.source as irc_source
+
+    events: list[str] = []
+
+    class FakeClient:
+        online_servers = set()
+
+        def send_message(self, channel: str, message: str) -> None:
+            pass
+
+        def wait_for_dcc(self, *, timeout: float, result_type: bool) -> SimpleNamespace:
+            return SimpleNamespace(filename="SearchBot_results_for_book.txt")
+
+    def fake_download(offer, dest_path, timeout):
+        dest_path.write_text("!Bot Author - Book.epub ::INFO:: 1MB\r\n")
+        events.append("downloaded")
+
+    def failing_parse(lines):
+        events.append("parsing")
+        raise RuntimeError("bad results file")
+
+    monkeypatch.setattr(
+        irc_source,
+        "_config_text",
+        lambda key: {
+            "IRC_SERVER": "irc.example.net",
+            "IRC_CHANNEL": "ebooks",
+            "IRC_NICK": "tester",
+            "IRC_SEARCH_BOT": "search",
+        }.get(key, ""),
+    )
+    irc_source._recent_message_sends.clear()
+    monkeypatch.setattr(irc_source, "_results_dir", tmp_path)
+    monkeypatch.setattr(irc_source, "_enforce_rate_limit", lambda: None)
+    monkeypatch.setattr(irc_source, "_emit_status", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr(irc_source, "download_dcc", fake_download)
+    monkeypatch.setattr(irc_source, "parse_result_lines", failing_parse)
+    monkeypatch.setattr(
+        "shelfmark.release_sources.irc.cache.get_cached_results",
+        lambda cache_key, *_args, **_kwargs: None,
+    )
+    monkeypatch.setattr(
+        "shelfmark.release_sources.irc.connection_manager.connection_manager.get_connection",
+        lambda **_kwargs: FakeClient(),
+    )
+    monkeypatch.setattr(
+        "shelfmark.release_sources.irc.connection_manager.connection_manager.release_connection",
+        lambda _client: events.append("released"),
+    )
+    monkeypatch.setattr(
+        "shelfmark.release_sources.irc.connection_manager.connection_manager.close_connection",
+        lambda _client: events.append("closed"),
+    )
+
+    book = BookMetadata(provider="hardcover", provider_id="parse", title="Book")
+    releases = IRCReleaseSource().search(book, SimpleNamespace(primary_query="Book"))
+
+    assert releases == []
+    assert events == ["downloaded", "released", "parsing"]
+    assert list(tmp_path.iterdir()) == []
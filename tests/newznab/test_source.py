@@ -1,5 +1,6 @@
 """Unit tests for the Newznab release source."""
 
+from dataclasses import asdict
 from unittest.mock import MagicMock
 
 import pytest
@@ -169,7 +170,7 @@ class TestResultToRelease:
             orchestrator.config, "get", lambda key, default=None, user_id=None: default
         )
 
-        success, error = orchestrator.queue_release(release.__dict__)
+        success, error = orchestrator.queue_release(asdict(release))
 
         assert success is True
         assert error is None
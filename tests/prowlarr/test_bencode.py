@@ -2,6 +2,10 @@
 Tests for bencode encoding/decoding in the torrent utilities.
 """
 
+import hashlib
+
+import pytest
+
 from shelfmark.download.clients.torrent_utils import (
     bencode_decode as _bencode_decode,
 )
@@ -81,6 +85,29 @@ class TestBencodeDecode:
             b"items": [1, 2, 3],
         }
 
+    def test_decode_returns_trailing_bytes(self):
+        """Test that bytes after the first value are returned as remaining."""
+        result, remaining = _bencode_decode(b"d1:ai1eei2e3:xyz")
+        assert result == {b"a": 1}
+        assert remaining == b"i2e3:xyz"
+
+    def test_decode_deeply_nested_lists(self):
+        """Test that nesting depth is not limited by the recursion limit."""
+        depth = 10_000
+        result, remaining = _bencode_decode(b"l" * depth + b"i7e" + b"e" * depth)
+
+        for _ in range(depth):
+            assert len(result) == 1
+            result = result[0]
+        assert result == 7
+        assert remaining == b""
+
+    def test_decode_rejects_malformed_data(self):
+        """Test that truncated or dangling structures raise ValueError."""
+        for data in (b"d3:keye", b"li1e", b"e", b"x"):
+            with pytest.raises(ValueError, match="Invalid bencode data"):
+                _bencode_decode(data)
+
 
 class TestBencodeEncode:
     """Tests for bencode encoding."""
@@ -125,6 +152,21 @@ class TestBencodeEncode:
         # Keys sorted: "list" < "num"
         assert result == b"d4:listli1ei2ei3ee3:numi42ee"
 
+    def test_encode_large_file_list(self):
+        """Test encoding a multi-file info dict with many entries."""
+        files = [{b"length": i, b"path": [b"dir", f"{i}.bin".encode()]} for i in range(2000)]
+
+        result = _bencode_encode({b"files": files})
+
+        assert result.startswith(b"d5:filesld6:lengthi0e4:pathl3:dir5:0.bineed")
+        assert result.endswith(b"d6:lengthi1999e4:pathl3:dir8:1999.bineeee")
+        assert _bencode_decode(result)[0] == {b"files": files}
+
+    def test_encode_rejects_unsupported_types(self):
+        """Test that unsupported values raise ValueError."""
+        with pytest.raises(ValueError, match="Cannot bencode type float"):
+            _bencode_encode({b"ratio": 1.5})
+
 
 class TestBencodeRoundTrip:
     """Tests for encoding then decoding (roundtrip)."""
@@ -198,3 +240,17 @@ class TestExtractInfoHash:
         hash2 = _extract_info_hash_from_torrent(torrent_bytes)
 
         assert hash1 == hash2
+
+    def test_extract_hash_uses_info_bytes_as_they_appear_in_the_file(self):
+        """Test that the hash covers the original info bytes, even if not canonical."""
+        # Keys deliberately out of order: re-encoding would sort them and change the hash.
+        info_bytes = b"d6:pieces20:" + b"\x01" * 20 + b"4:name9:book.epube"
+        torrent_bytes = b"d8:announce3:url4:info" + info_bytes + b"7:comment2:hie"
+
+        result = _extract_info_hash_from_torrent(torrent_bytes)
+
+        assert result == hashlib.sha1(info_bytes).hexdigest()
+
+    def test_extract_hash_returns_none_for_truncated_info(self):
+        """Test that a torrent cut off inside the info dict returns None."""
+        assert _extract_info_hash_from_torrent(b"d4:infod4:name") is None
@@ -4,6 +4,8 @@ Tests for the Prowlarr release cache.
 
 import time
 
+import pytest
+
 # Import the cache module
 from shelfmark.release_sources.prowlarr import cache
 
@@ -11,20 +13,41 @@ from shelfmark.release_sources.prowlarr import cache
 class TestProwlarrCache:
     """Tests for release caching functionality."""
 
-    def setup_method(self):
-        """Clear cache before each test."""
-        # Clear the internal cache
-        cache._cache.clear()
+    @pytest.fixture(autouse=True)
+    def fresh_cache(self, tmp_path, monkeypatch):
+        """Give each test its own empty cache database."""
+        monkeypatch.setattr(cache, "CACHE_DB_PATH", tmp_path / "prowlarr_cache.db")
+        monkeypatch.setattr(cache, "_db", None)
+        yield
+        if cache._db is not None:
+            cache._db.close()
+
+    @staticmethod
+    def _cached_ids():
+        return set(cache.get_cache_stats()["entries"])
 
     def test_cache_release_stores_data(self):
         """Test that cache_release stores data correctly."""
         release_data = {"title": "Test Book", "size": 1024}
         cache.cache_release("test-id", release_data)
 
-        assert "test-id" in cache._cache
-        stored_data, timestamp = cache._cache["test-id"]
-        assert stored_data == release_data
-        assert isinstance(timestamp, float)
+        assert "test-id" in self._cached_ids()
+        assert cache.get_release("test-id") == release_data
+
+    def test_cache_releases_stores_a_whole_search_at_once(self):
+        """Test that cache_releases stores every release it is given."""
+        releases = [(f"batch-{i}", {"title": f"Book {i}"}) for i in range(50)]
+        cache.cache_releases(releases)
+
+        assert self._cached_ids() == {source_id for source_id, _ in releases}
+        assert cache.get_release("batch-7") == {"title": "Book 7"}
+        assert not cache._db.in_transaction
+
+    def test_cache_releases_ignores_empty_batches(self):
+        """Test that an empty search does not open the database."""
+        cache.cache_releases([])
+
+        assert cache._db is None
 
     def test_get_release_returns_cached_data(self):
         """Test that get_release returns cached data."""
@@ -60,10 +83,10 @@ class TestProwlarrCache:
     def test_remove_release_deletes_entry(self):
         """Test that remove_release removes cached entries."""
         cache.cache_release("remove-id", {"title": "Book to Remove"})
-        assert "remove-id" in cache._cache
+        assert "remove-id" in self._cached_ids()
 
         cache.remove_release("remove-id")
-        assert "remove-id" not in cache._cache
+        assert "remove-id" not in self._cached_ids()
 
     def test_remove_release_ignores_missing_ids(self):
         """Test that remove_release doesn't raise for missing IDs."""
@@ -72,18 +95,69 @@ class TestProwlarrCache:
 
     def test_cleanup_expired_removes_old_entries(self, monkeypatch):
         """Test that cleanup_expired removes old entries."""
-        # Add some entries
-        cache.cache_release("keep-id", {"title": "Keep This"})
+        # Add some entries, caching old-id two hours ago so it has expired
+        real_time = time.time
+        monkeypatch.setattr(cache.time, "time", lambda: real_time() - 7200)
         cache.cache_release("old-id", {"title": "Remove This"})
-
-        # Make old-id appear expired by manipulating its timestamp
-        cache._cache["old-id"] = ({"title": "Remove This"}, time.time() - 7200)  # 2 hours old
+        monkeypatch.setattr(cache.time, "time", real_time)
+        cache.cache_release("keep-id", {"title": "Keep This"})
 
         removed = cache.cleanup_expired()
 
         assert removed == 1
-        assert "keep-id" in cache._cache
-        assert "old-id" not in cache._cache
+        assert self._cached_ids() == {"keep-id"}
+
+    def test_cleanup_expired_keeps_entries_refreshed_since_they_were_first_cached(
+        self, monkeypatch
+    ):
+        """A re-cached release must survive the expiry of its earlier copy."""
+        real_time = time.time
+        monkeypatch.setattr(cache.time, "time", lambda: real_time() - 7200)
+        cache.cache_release("refreshed-id", {"title": "First"})
+        monkeypatch.setattr(cache.time, "time", real_time)
+        cache.cache_release("refreshed-id", {"title": "Second"})
+
+        assert cache.cleanup_expired() == 0
+        assert cache.get_release("refreshed-id") == {"title": "Second"}
+
+    def test_cached_releases_survive_reopening_the_database(self, monkeypatch):
+        """Releases persist across restarts instead of living only in memory."""
+        cache.cache_release("persisted-id", {"title": "Still Here", "seeders": 4})
+        cache._db.close()
+        monkeypatch.setattr(cache, "_db", None)
+
+        assert cache.get_release("persisted-id") == {"title": "Still Here", "seeders": 4}
+
+    def test_unwritable_database_path_falls_back_to_memory(self, tmp_path, monkeypatch):
+        """A config dir that cannot hold the database still leaves a working cache."""
+        monkeypatch.setattr(cache, "CACHE_DB_PATH", tmp_path / "missing" / "cache.db")
+
+        cache.cache_release("memory-id", {"title": "In Memory"})
+
+        assert cache.get_release("memory-id") == {"title": "In Memory"}
+        assert not (tmp_path / "missing").exists()
+
+    def test_cache_release_starts_one_background_cleanup_thread(self, monkeypatch):
+        """The periodic sweep starts with the first cached release, once."""
+        started = []
+
+        class FakeThread:
+            def __init__(self, *, target, daemon, name):
+                self.target = target
+                self.daemon = daemon
+
+            def start(self):
+                started.append(self)
+
+        monkeypatch.setattr(cache, "_cleanup_thread", None)
+        monkeypatch.setattr(cache.threading, "Thread", FakeThread)
+
+        cache.cache_release("first", {"title": "One"})
+        cache.cache_release("second", {"title": "Two"})
+
+        assert len(started) == 1
+        assert started[0].daemon
+        assert started[0].target is cache._cleanup_loop
 
     def test_get_cache_stats_returns_correct_info(self):
         """Test that get_cache_stats returns accurate information."""
@@ -2,6 +2,9 @@
 
 from unittest.mock import MagicMock, patch
 
+import pytest
+import requests
+
 from shelfmark.download.clients import DownloadStatus
 from shelfmark.download.clients.torrent_utils import TorrentInfo
 
@@ -228,3 +231,109 @@ class TestDelugeClientErrors:
 
         assert client._authenticated is False
         assert client._connected is False
+
+    def test_find_existing_uses_expected_hash_without_fetching_torrent(self, monkeypatch):
+        """A known info_hash is looked up directly instead of fetching the .torrent."""
+        config_values = {
+            "DELUGE_HOST": "http://localhost",
+            "DELUGE_PORT": "8112",
+            "DELUGE_PASSWORD": "password",
+        }
+        monkeypatch.setattr(
+            "shelfmark.download.clients.deluge.config.get",
+            make_config_getter(config_values),
+        )
+        monkeypatch.setattr(
+            "shelfmark.download.clients.torrent_utils._torrent_fetch_session.get",
+            MagicMock(side_effect=AssertionError("must not fetch the .torrent")),
+        )
+
+        from shelfmark.download.clients.deluge import DelugeClient
+
+        client = DelugeClient()
+        monkeypatch.setattr(client, "_ensure_connected", lambda: None)
+        rpc_call = MagicMock(return_value={})
+        monkeypatch.setattr(client, "_rpc_call", rpc_call)
+
+        result = client.find_existing(
+            "https://tracker.example/download/book.torrent",
+            expected_hash="ABCDEF1234567890ABCDEF1234567890ABCDEF12",
+        )
+
+        assert result is None
+        rpc_call.assert_called_once_with(
+            "core.get_torrent_status", "abcdef1234567890abcdef1234567890abcdef12", ["state"]
+        )
+
+
+class TestDelugeClientRpcCall:
+    """Tests for DelugeClient._rpc_call() transport handling."""
+
+    @staticmethod
+    def _make_client(monkeypatch):
+        config_values = {
+            "DELUGE_HOST": "http://localhost",
+            "DELUGE_PORT": "8112",
+            "DELUGE_PASSWORD": "password",
+        }
+        monkeypatch.setattr(
+            "shelfmark.download.clients.deluge.config.get",
+            make_config_getter(config_values),
+        )
+
+        from shelfmark.download.clients.deluge import DelugeClient
+
+        client = DelugeClient()
+        client._authenticated = True
+        client._connected = True
+        return client
+
+    def test_dropped_connection_is_retried_once_without_reconnecting(self, monkeypatch):
+        """A stale keep-alive socket costs one resend, not a fresh login."""
+        client = self._make_client(monkeypatch)
+        response = MagicMock()
+        response.json.return_value = {"id": 1, "result": {"state": "Seeding"}, "error": None}
+        post = MagicMock(side_effect=[requests.exceptions.ConnectionError("reset"), response])
+        monkeypatch.setattr(client._session, "post", post)
+
+        result = client._rpc_call("core.get_torrent_status", "abc", ["state"])
+
+        assert result == {"state": "Seeding"}
+        assert post.call_count == 2
+        assert post.call_args_list[0].kwargs["json"] == post.call_args_list[1].kwargs["json"]
+        assert client._authenticated is True
+        assert client._connected is True
+
+    def test_repeated_connection_failure_is_raised(self, monkeypatch):
+        """A second transport failure surfaces to the caller's error handling."""
+        client = self._make_client(monkeypatch)
+        post = MagicMock(side_effect=requests.exceptions.ConnectionError("down"))
+        monkeypatch.setattr(client._session, "post", post)
+
+        with pytest.raises(requests.exceptions.ConnectionError):
+            client._rpc_call("web.connected")
+
+        assert post.call_count == 2
+
+    @pytest.mark.parametrize("method", ["core.add_torrent_file", "core.add_torrent_magnet"])
+    def test_state_changing_call_is_not_resent(self, monkeypatch, method):
+        """An add that may already have been applied is never sent twice."""
+        client = self._make_client(monkeypatch)
+        post = MagicMock(side_effect=requests.exceptions.ConnectionError("remote disconnected"))
+        monkeypatch.setattr(client._session, "post", post)
+
+        with pytest.raises(requests.exceptions.ConnectionError):
+            client._rpc_call(method, "book.torrent", "ZGF0YQ==", {})
+
+        post.assert_called_once()
+
+    def test_connect_timeout_is_not_retried(self, monkeypatch):
+        """A host that is down costs one connect timeout, not two."""
+        client = self._make_client(monkeypatch)
+        post = MagicMock(side_effect=requests.exceptions.ConnectTimeout("timed out"))
+        monkeypatch.setattr(client._session, "post", post)
+
+        with pytest.raises(requests.exceptions.ConnectTimeout):
+            client._rpc_call("web.connected")
+
+        post.assert_called_once()
@@ -124,7 +124,7 @@ class MockClient(DownloadClient):
         return "/downloads/test-file.epub"
 
     def find_existing(
-        self, url: str, category: str | None = None
+        self, url: str, category: str | None = None, expected_hash: str | None = None
     ) -> tuple[str, DownloadStatus] | None:
         return None
 
@@ -76,6 +76,18 @@ class TestGetProtocol:
         assert get_protocol({"protocol": "Usenet"}) == "usenet"
         assert get_protocol({"protocol": "USENET"}) == "usenet"
 
+    def test_get_protocol_infers_from_urls(self):
+        """Test inference from magnetUrl first, then downloadUrl."""
+        assert get_protocol({"magnetUrl": "MAGNET:?xt=urn:btih:abc"}) == "torrent"
+        assert (
+            get_protocol({"magnetUrl": "", "downloadUrl": "https://x.example/Book.TORRENT"})
+            == "torrent"
+        )
+        assert get_protocol({"protocol": None, "downloadUrl": "https://x.example/a.nzb"}) == (
+            "usenet"
+        )
+        assert get_protocol({"magnetUrl": "https://x.example/not-a-magnet"}) == "unknown"
+
 
 class TestProwlarrHandlerDownloadErrors:
     """Tests for error handling in ProwlarrHandler.download()."""
@@ -777,6 +789,50 @@ class TestProwlarrHandlerExistingDownload:
             called_url = mock_client.find_existing.call_args.args[0]
             assert called_url == "magnet:?xt=urn:btih:abc123&dn=test"
 
+    def test_passes_indexer_info_hash_to_find_existing(self):
+        """The indexer's infoHash lets the client look up the torrent without a fetch."""
+        mock_client = MagicMock()
+        mock_client.name = "deluge"
+        mock_client.find_existing.return_value = None
+
+        with (
+            patch(
+                "shelfmark.release_sources.prowlarr.handler.get_release",
+                return_value={
+                    "protocol": "torrent",
+                    "downloadUrl": "https://prowlarr.example.com/api/v1/indexer/1/download/123",
+                    "infoHash": "ABCDEF1234567890ABCDEF1234567890ABCDEF12",
+                    "title": "Test Release",
+                },
+            ),
+            patch(
+                "shelfmark.release_sources.prowlarr.handler.get_client",
+                return_value=mock_client,
+            ),
+            patch(
+                "shelfmark.release_sources.prowlarr.handler.remove_release",
+            ),
+            patch.object(
+                ProwlarrHandler,
+                "_poll_and_complete",
+                return_value=None,
+            ),
+        ):
+            handler = ProwlarrHandler()
+            task = DownloadTask(task_id="torrent-info-hash", source="prowlarr", title="Test Book")
+            recorder = ProgressRecorder()
+
+            handler.download(
+                task=task,
+                cancel_flag=Event(),
+                progress_callback=recorder.progress_callback,
+                status_callback=recorder.status_callback,
+            )
+
+            assert mock_client.find_existing.call_args.kwargs["expected_hash"] == (
+                "ABCDEF1234567890ABCDEF1234567890ABCDEF12"
+            )
+
     def test_prefers_download_url_for_usenet(self):
         """If both downloadUrl and magnetUrl exist, usenet should use downloadUrl."""
         mock_client = MagicMock()
@@ -4,6 +4,8 @@ Tests for the Prowlarr source module.
 Tests the utility functions for parsing release metadata.
 """
 
+from dataclasses import asdict
+
 # Import the functions to test
 import pytest
 
@@ -524,7 +526,7 @@ class TestProwlarrLocalizedQueries:
 
         monkeypatch.setattr(orchestrator.book_queue, "add", fake_add)
 
-        success, error = orchestrator.queue_release(releases[0].__dict__)
+        success, error = orchestrator.queue_release(asdict(releases[0]))
 
         assert success is True
         assert error is None
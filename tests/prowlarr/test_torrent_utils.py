@@ -387,7 +387,9 @@ class TestExtractTorrentInfo:
         response = MagicMock(status_code=200, content=torrent_data)
         response.raise_for_status = MagicMock()
         mock_get = MagicMock(return_value=response)
-        monkeypatch.setattr("shelfmark.download.clients.torrent_utils.requests.get", mock_get)
+        monkeypatch.setattr(
+            "shelfmark.download.clients.torrent_utils._torrent_fetch_session.get", mock_get
+        )
 
         # No expected_hash supplied: the hash can only come from the prefetch.
         result = extract_torrent_info(
@@ -421,7 +423,9 @@ class TestExtractTorrentInfo:
         response = MagicMock(status_code=200, content=torrent_data)
         response.raise_for_status = MagicMock()
         mock_get = MagicMock(return_value=response)
-        monkeypatch.setattr("shelfmark.download.clients.torrent_utils.requests.get", mock_get)
+        monkeypatch.setattr(
+            "shelfmark.download.clients.torrent_utils._torrent_fetch_session.get", mock_get
+        )
 
         extract_torrent_info(
             "https://attacker.example/book.torrent",
@@ -432,6 +436,28 @@ class TestExtractTorrentInfo:
         sent_headers = mock_get.call_args.kwargs.get("headers", {})
         assert "X-Api-Key" not in sent_headers
 
+    def test_skips_origin_check_without_api_key(self, monkeypatch):
+        """Without a Prowlarr API key the download URL's origin is never parsed."""
+        monkeypatch.setattr(
+            "shelfmark.download.clients.torrent_utils.config.get",
+            lambda key, default="": default,
+        )
+        trust_check = MagicMock(return_value=False)
+        monkeypatch.setattr(
+            "shelfmark.download.clients.torrent_utils._is_trusted_torrent_fetch_url", trust_check
+        )
+        response = MagicMock(status_code=200, content=b"not a torrent")
+        response.raise_for_status = MagicMock()
+        mock_get = MagicMock(return_value=response)
+        monkeypatch.setattr(
+            "shelfmark.download.clients.torrent_utils._torrent_fetch_session.get", mock_get
+        )
+
+        extract_torrent_info("https://tracker.example/book.torrent", fetch_torrent=True)
+
+        trust_check.assert_not_called()
+        assert "X-Api-Key" not in mock_get.call_args.kwargs["headers"]
+
     def test_fetches_configured_prowlarr_torrent_url(self, monkeypatch):
         """Configured Prowlarr download URLs can still be prefetched and parsed."""
         info_dict = {
@@ -454,7 +480,9 @@ class TestExtractTorrentInfo:
         response = MagicMock(status_code=200, content=torrent_data)
         response.raise_for_status = MagicMock()
         mock_get = MagicMock(return_value=response)
-        monkeypatch.setattr("shelfmark.download.clients.torrent_utils.requests.get", mock_get)
+        monkeypatch.setattr(
+            "shelfmark.download.clients.torrent_utils._torrent_fetch_session.get", mock_get
+        )
 
         result = extract_torrent_info(
             "https://prowlarr.example/1/download?apikey=secret&indexer=7",
@@ -488,7 +516,9 @@ class TestExtractTorrentInfo:
         response = MagicMock(status_code=200, content=torrent_data)
         response.raise_for_status = MagicMock()
         mock_get = MagicMock(return_value=response)
-        monkeypatch.setattr("shelfmark.download.clients.torrent_utils.requests.get", mock_get)
+        monkeypatch.setattr(
+            "shelfmark.download.clients.torrent_utils._torrent_fetch_session.get", mock_get
+        )
 
         result = extract_torrent_info(
             "http://prowlarr.example:9696/1/download?apikey=secret&indexer=7",
@@ -529,7 +559,9 @@ class TestExtractTorrentInfo:
         final = MagicMock(status_code=200, content=torrent_data)
         final.raise_for_status = MagicMock()
         mock_get = MagicMock(side_effect=[redirect, final])
-        monkeypatch.setattr("shelfmark.download.clients.torrent_utils.requests.get", mock_get)
+        monkeypatch.setattr(
+            "shelfmark.download.clients.torrent_utils._torrent_fetch_session.get", mock_get
+        )
 
         # No expected_hash supplied: the hash can only come from the prefetch.
         result = extract_torrent_info(
@@ -556,7 +588,9 @@ class TestExtractTorrentInfo:
         response = MagicMock(status_code=302)
         response.headers = {"Location": magnet}
         mock_get = MagicMock(return_value=response)
-        monkeypatch.setattr("shelfmark.download.clients.torrent_utils.requests.get", mock_get)
+        monkeypatch.setattr(
+            "shelfmark.download.clients.torrent_utils._torrent_fetch_session.get", mock_get
+        )
 
         result = extract_torrent_info(
             "https://prowlarr.example/1/download?apikey=secret&indexer=7",
@@ -578,7 +612,9 @@ class TestExtractTorrentInfo:
         response = MagicMock(status_code=302)
         response.headers = {"Location": "https://tracker.example/loop"}
         mock_get = MagicMock(return_value=response)
-        monkeypatch.setattr("shelfmark.download.clients.torrent_utils.requests.get", mock_get)
+        monkeypatch.setattr(
+            "shelfmark.download.clients.torrent_utils._torrent_fetch_session.get", mock_get
+        )
 
         result = extract_torrent_info(
             "https://prowlarr.example/1/download?apikey=secret&indexer=7",
@@ -696,7 +732,9 @@ class TestTorrentFetchCache:
         response = MagicMock(status_code=200, content=torrent_data)
         response.raise_for_status = MagicMock()
         mock_get = MagicMock(return_value=response)
-        monkeypatch.setattr("shelfmark.download.clients.torrent_utils.requests.get", mock_get)
+        monkeypatch.setattr(
+            "shelfmark.download.clients.torrent_utils._torrent_fetch_session.get", mock_get
+        )
 
         url = "https://prowlarr.example/26/download?apikey=secret&link=token"
         first = extract_torrent_info(url, fetch_torrent=True)
@@ -707,6 +745,23 @@ class TestTorrentFetchCache:
         assert second.info_hash == info_hash
         assert second.torrent_data == torrent_data
 
+    def test_repeated_url_reuses_base64_torrent_data(self, monkeypatch):
+        """Retried uploads reuse the encoded .torrent instead of re-encoding it."""
+        torrent_data, info_hash = self._valid_torrent()
+        response = MagicMock(status_code=200, content=torrent_data)
+        response.raise_for_status = MagicMock()
+        monkeypatch.setattr(
+            "shelfmark.download.clients.torrent_utils._torrent_fetch_session.get",
+            MagicMock(return_value=response),
+        )
+
+        url = "https://prowlarr.example/26/download?apikey=secret&link=token"
+        first = extract_torrent_info(url, fetch_torrent=True)
+        second = extract_torrent_info(url, fetch_torrent=True, expected_hash=info_hash.upper())
+
+        assert first.torrent_data_b64 == base64.b64encode(torrent_data).decode("ascii")
+        assert second.torrent_data_b64 is first.torrent_data_b64
+
     def test_failed_fetch_is_not_cached_and_records_reason(self, monkeypatch):
         """Fetch failures are retried on the next call and expose the reason."""
         import requests as requests_module
@@ -716,7 +771,9 @@ class TestTorrentFetchCache:
                 "500 Server Error: Internal Server Error for url: https://prowlarr.example/26/download"
             )
         )
-        monkeypatch.setattr("shelfmark.download.clients.torrent_utils.requests.get", mock_get)
+        monkeypatch.setattr(
+            "shelfmark.download.clients.torrent_utils._torrent_fetch_session.get", mock_get
+        )
 
         url = "https://prowlarr.example/26/download?apikey=secret&link=token"
         first = extract_torrent_info(url, fetch_torrent=True)
@@ -733,7 +790,9 @@ class TestTorrentFetchCache:
         import requests as requests_module
 
         mock_get = MagicMock(side_effect=requests_module.exceptions.ConnectionError("boom"))
-        monkeypatch.setattr("shelfmark.download.clients.torrent_utils.requests.get", mock_get)
+        monkeypatch.setattr(
+            "shelfmark.download.clients.torrent_utils._torrent_fetch_session.get", mock_get
+        )
 
         known_hash = "3b245504cf5f11bbdbe1201cea6a6bf45aee1bc0"
         result = extract_torrent_info(
@@ -751,7 +810,9 @@ class TestTorrentFetchCache:
         response = MagicMock(status_code=200, content=b"<html>not a torrent</html>")
         response.raise_for_status = MagicMock()
         mock_get = MagicMock(return_value=response)
-        monkeypatch.setattr("shelfmark.download.clients.torrent_utils.requests.get", mock_get)
+        monkeypatch.setattr(
+            "shelfmark.download.clients.torrent_utils._torrent_fetch_session.get", mock_get
+        )
 
         url = "https://tracker.example/download/book.torrent"
         known_hash = "3b245504cf5f11bbdbe1201cea6a6bf45aee1bc0"
@@ -768,7 +829,9 @@ class TestTorrentFetchCache:
         response = MagicMock(status_code=200, content=torrent_data)
         response.raise_for_status = MagicMock()
         mock_get = MagicMock(return_value=response)
-        monkeypatch.setattr("shelfmark.download.clients.torrent_utils.requests.get", mock_get)
+        monkeypatch.setattr(
+            "shelfmark.download.clients.torrent_utils._torrent_fetch_session.get", mock_get
+        )
 
         clock = {"now": 1000.0}
         monkeypatch.setattr(
@@ -788,7 +851,9 @@ class TestTorrentFetchCache:
         magnet = "magnet:?xt=urn:btih:3b245504cf5f11bbdbe1201cea6a6bf45aee1bc0&dn=test"
         response = MagicMock(status_code=302, headers={"Location": magnet})
         mock_get = MagicMock(return_value=response)
-        monkeypatch.setattr("shelfmark.download.clients.torrent_utils.requests.get", mock_get)
+        monkeypatch.setattr(
+            "shelfmark.download.clients.torrent_utils._torrent_fetch_session.get", mock_get
+        )
 
         url = "https://tracker.example/download/book.torrent"
         first = extract_torrent_info(url, fetch_torrent=True)